@@ -10,14 +10,17 @@ def get_version(*args, **kwargs):
 __version__ = get_version(VERSION)
 
 
-def setup():
+def setup(defer_models=False):
     """
     Configure the settings (this happens as a side effect of accessing the
     first setting), configure logging and populate the app registry.
+
+    If defer_models is True, the models modules of applications are imported
+    the first time the app registry is asked for models.
     """
     from django.apps import apps
     from django.conf import settings
     from django.utils.log import configure_logging
 
     configure_logging(settings.LOGGING_CONFIG, settings.LOGGING)
-    apps.populate(settings.INSTALLED_APPS)
+    apps.populate(settings.INSTALLED_APPS, defer_models=defer_models)
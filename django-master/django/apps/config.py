@@ -49,6 +49,9 @@ class AppConfig(object):
         # None to prevent accidental access before import_models() runs.
         self.models = None
 
+        # Registry this application belongs to. Set by Apps.populate().
+        self.apps = None
+
     def __repr__(self):
         return '<%s: %s>' % (self.__class__.__name__, self.label)
 
@@ -148,6 +151,9 @@ class AppConfig(object):
         """
         Raises an exception if models haven't been imported yet.
         """
+        if self.models is None and self.apps is not None:
+            # The registry may have deferred the import of models.
+            self.apps.check_models_ready()
         if self.models is None:
             raise AppRegistryNotReady(
                 "Models for app '%s' haven't been imported yet." % self.label)
@@ -1,7 +1,9 @@
 from collections import Counter, defaultdict, OrderedDict
+import logging
 import os
 import sys
 import threading
+import time
 import warnings
 
 from django.core.exceptions import AppRegistryNotReady, ImproperlyConfigured
@@ -11,6 +13,8 @@ from django.utils._os import upath
 
 from .config import AppConfig
 
+logger = logging.getLogger('django.apps')
+
 
 class Apps(object):
     """
@@ -45,21 +49,34 @@ class Apps(object):
         # Whether the registry is populated.
         self.apps_ready = self.models_ready = self.ready = False
 
-        # Lock for thread-safe population.
-        self._lock = threading.Lock()
+        # Lock for thread-safe population. It's reentrant so that importing
+        # models in check_models_ready() while they're being imported raises
+        # an exception instead of deadlocking.
+        self._lock = threading.RLock()
 
         # Pending lookups for lazy relations.
         self._pending_lookups = {}
 
+        # Whether populate() deferred the import of models.
+        self._models_deferred = False
+
+        # Mapping of labels to the time, in seconds, spent importing the app
+        # module ('app') and the models module ('models') of installed apps
+        # and running their ready() method ('ready'). Set by populate().
+        self.import_times = OrderedDict()
+
         # Populate apps and models, unless it's the master registry.
         if installed_apps is not None:
             self.populate(installed_apps)
 
-    def populate(self, installed_apps=None):
+    def populate(self, installed_apps=None, defer_models=False):
         """
         Loads application configurations and models.
 
         This method imports each application module and then each model module.
+        If defer_models is True, model modules are imported, and the ready()
+        methods of applications are called, the first time the registry is
+        asked for models, see check_models_ready().
 
         It is thread safe and idempotent, but not reentrant.
         """
@@ -72,13 +89,21 @@ class Apps(object):
             if self.ready:
                 return
 
+            if self._models_deferred:
+                if not defer_models:
+                    self._populate_models()
+                return
+
             # app_config should be pristine, otherwise the code below won't
             # guarantee that the order matches the order in INSTALLED_APPS.
             if self.app_configs:
                 raise RuntimeError("populate() isn't reentrant")
 
+            self.import_times = OrderedDict()
+
             # Load app configs and app modules.
             for entry in installed_apps:
+                start = time.time()
                 if isinstance(entry, AppConfig):
                     app_config = entry
                 else:
@@ -88,7 +113,9 @@ class Apps(object):
                         "Application labels aren't unique, "
                         "duplicates: %s" % app_config.label)
 
+                app_config.apps = self
                 self.app_configs[app_config.label] = app_config
+                self.import_times[app_config.label] = {'app': time.time() - start}
 
             # Check for duplicate app names.
             counts = Counter(
@@ -102,19 +129,51 @@ class Apps(object):
 
             self.apps_ready = True
 
-            # Load models.
-            for app_config in self.app_configs.values():
-                all_models = self.all_models[app_config.label]
-                app_config.import_models(all_models)
+            if defer_models:
+                self._models_deferred = True
+            else:
+                self._populate_models()
 
-            self.clear_cache()
+    def _populate_models(self):
+        """
+        Imports the model modules of the applications, then calls their
+        ready() methods. Must be called with the lock held.
+        """
+        self._models_deferred = False
 
-            self.models_ready = True
+        # Load models.
+        for app_config in self.app_configs.values():
+            start = time.time()
+            all_models = self.all_models[app_config.label]
+            app_config.import_models(all_models)
+            self.import_times[app_config.label]['models'] = time.time() - start
 
-            for app_config in self.get_app_configs():
-                app_config.ready()
+        self.clear_cache()
+
+        self.models_ready = True
+
+        for app_config in self.get_app_configs():
+            start = time.time()
+            app_config.ready()
+            self.import_times[app_config.label]['ready'] = time.time() - start
+
+        self.ready = True
 
-            self.ready = True
+        if logger.isEnabledFor(logging.DEBUG):
+            self._log_import_times()
+
+    def _log_import_times(self):
+        """
+        Logs the time spent loading each application, slowest first.
+        """
+        lines, total = [], 0
+        times = [(sum(phases.values()), label, phases)
+                 for label, phases in self.import_times.items()]
+        for app_total, label, phases in sorted(times, reverse=True):
+            total += app_total
+            lines.append("%s: %.3fs (app %.3fs, models %.3fs, ready %.3fs)" % (
+                label, app_total, phases['app'], phases.get('models', 0), phases.get('ready', 0)))
+        logger.debug("Populated the app registry in %.3fs:\n%s", total, "\n".join(lines))
 
     def check_apps_ready(self):
         """
@@ -126,8 +185,16 @@ class Apps(object):
     def check_models_ready(self):
         """
         Raises an exception if all models haven't been imported yet.
+
+        If the registry was populated with defer_models=True, imports them.
         """
         if not self.models_ready:
+            if self._models_deferred:
+                with self._lock:
+                    if self._models_deferred:
+                        self._populate_models()
+                if self.models_ready:
+                    return
             raise AppRegistryNotReady("Models aren't loaded yet.")
 
     def get_app_configs(self):
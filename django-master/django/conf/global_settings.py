@@ -144,6 +144,10 @@ LANGUAGES_BIDI = ("he", "ar", "fa", "ur")
 USE_I18N = True
 LOCALE_PATHS = ()
 
+# Directory of the merged translation catalogs written by compilemessages, or
+# None.
+LOCALE_CATALOGS_DIR = None
+
 # Settings for language cookie
 LANGUAGE_COOKIE_NAME = 'django_language'
 LANGUAGE_COOKIE_AGE = None
@@ -201,6 +205,10 @@ EMAIL_TIMEOUT = None
 # List of strings representing installed apps.
 INSTALLED_APPS = ()
 
+# Whether management commands defer importing the models of installed apps
+# until they're needed.
+DEFER_MODEL_IMPORTS = False
+
 # List of locations of the template source files, in search order.
 TEMPLATE_DIRS = ()
 
@@ -534,6 +542,26 @@ PASSWORD_HASHERS = (
     'django.contrib.auth.hashers.CryptPasswordHasher',
 )
 
+# The maximum number of threads hashing a password at the same time, or None
+# for no limit.
+PASSWORD_HASHING_CONCURRENCY = None
+
+# Whether to upgrade password hashes in a background thread rather than
+# during the login.
+PASSWORD_UPGRADE_IN_BACKGROUND = False
+
+#################
+# CONTENT TYPES #
+#################
+
+# Whether to load all the content types of a database on the first lookup
+# that misses the cache.
+CONTENT_TYPES_PRELOAD = False
+
+# The alias of the cache shared by processes to store the content types, or
+# None.
+CONTENT_TYPES_CACHE_ALIAS = None
+
 ###########
 # SIGNING #
 ###########
@@ -1,7 +1,8 @@
-from collections import OrderedDict
+from collections import Counter, OrderedDict
 import copy
+import logging
 import operator
-from functools import partial, reduce, update_wrapper
+from functools import partial, reduce, update_wrapper, wraps
 import warnings
 
 from django import forms
@@ -14,16 +15,17 @@ from django.contrib.admin.checks import (BaseModelAdminChecks, ModelAdminChecks,
 from django.contrib.admin.exceptions import DisallowedModelAdminToField
 from django.contrib.admin.utils import (quote, unquote, flatten_fieldsets,
     get_deleted_objects, model_format_dict, NestedObjects,
-    lookup_needs_distinct)
+    lookup_needs_distinct, QueryRecorder)
 from django.contrib.admin.templatetags.admin_static import static
 from django.contrib.admin.templatetags.admin_urls import add_preserved_filters
 from django.contrib.auth import get_permission_codename
 from django.core import checks
 from django.core.exceptions import (PermissionDenied, ValidationError,
     FieldError, ImproperlyConfigured)
-from django.core.paginator import Paginator
+from django.core.paginator import KeysetPaginator, Paginator
+from django.core.signals import request_finished
 from django.core.urlresolvers import reverse
-from django.db import models, transaction, router
+from django.db import connections, models, transaction, router
 from django.db.models.constants import LOOKUP_SEP
 from django.db.models.related import RelatedObject
 from django.db.models.fields import BLANK_CHOICE_DASH, FieldDoesNotExist
@@ -50,6 +52,8 @@ from django.utils.safestring import mark_safe
 from django.views.decorators.csrf import csrf_protect
 
 
+logger = logging.getLogger('django.contrib.admin')
+
 IS_POPUP_VAR = '_popup'
 TO_FIELD_VAR = '_to_field'
 
@@ -94,6 +98,57 @@ FORMFIELD_FOR_DBFIELD_DEFAULTS = {
 csrf_protect_m = method_decorator(csrf_protect)
 
 
+def check_list_query_budget(view):
+    """
+    Decorates ModelAdmin.changelist_view() to count the queries run while the
+    change list is built and rendered, and to log a warning when there are
+    more than the model admin's list_query_budget.
+    """
+    @wraps(view)
+    def _wrapped_view(self, request, *args, **kwargs):
+        if self.list_query_budget is None:
+            return view(self, request, *args, **kwargs)
+        using = router.db_for_read(self.model)
+        recorder = QueryRecorder(connections[using])
+
+        def stop_recording(**kwargs):
+            # The response failed to render or wasn't rendered. Only the
+            # thread that owns the connection may restore it.
+            if connections[using] is recorder.connection:
+                request_finished.disconnect(stop_recording)
+                recorder.stop()
+
+        def check_budget(response=None):
+            request_finished.disconnect(stop_recording)
+            recorder.stop()
+            num_queries = len(recorder.queries)
+            if num_queries > self.list_query_budget:
+                sql, count = Counter(q['sql'] for q in recorder.queries).most_common(1)[0]
+                logger.warning(
+                    'Change list of %s.%s ran %d queries, more than its '
+                    'budget of %d. The most repeated query (%d times) was: %s',
+                    self.opts.app_label, self.opts.model_name, num_queries,
+                    self.list_query_budget, count, sql,
+                    extra={'request': request},
+                )
+
+        recorder.start()
+        try:
+            response = view(self, request, *args, **kwargs)
+        except Exception:
+            recorder.stop()
+            raise
+        if isinstance(response, SimpleTemplateResponse) and not response.is_rendered:
+            # Rendering the results runs queries too. Stop recording at the
+            # end of the request at the latest.
+            request_finished.connect(stop_recording, weak=False)
+            response.add_post_render_callback(check_budget)
+        else:
+            check_budget()
+        return response
+    return _wrapped_view
+
+
 class BaseModelAdmin(six.with_metaclass(forms.MediaDefiningClass)):
     """Functionality common to both ModelAdmin and InlineAdmin."""
 
@@ -537,6 +592,11 @@ class ModelAdmin(BaseModelAdmin):
     save_as = False
     save_on_top = False
     paginator = Paginator
+    keyset_paginator = KeysetPaginator
+    keyset_pagination = False
+    estimate_result_count = False
+    list_prefetch_related = ()
+    list_query_budget = None
     preserve_filters = True
     inlines = []
 
@@ -772,6 +832,13 @@ class ModelAdmin(BaseModelAdmin):
     def get_paginator(self, request, queryset, per_page, orphans=0, allow_empty_first_page=True):
         return self.paginator(queryset, per_page, orphans, allow_empty_first_page)
 
+    def get_keyset_paginator(self, request, queryset, per_page):
+        """
+        Returns the paginator used by the changelist when keyset_pagination
+        is enabled.
+        """
+        return self.keyset_paginator(queryset, per_page)
+
     def log_addition(self, request, object):
         """
         Log that an object has been successfully added.
@@ -1468,6 +1535,7 @@ class ModelAdmin(BaseModelAdmin):
         return self.changeform_view(request, object_id, form_url, extra_context)
 
     @csrf_protect_m
+    @check_list_query_budget
     def changelist_view(self, request, extra_context=None):
         """
         The 'change list' admin view for this model.
@@ -1595,8 +1663,12 @@ class ModelAdmin(BaseModelAdmin):
         else:
             action_form = None
 
-        selection_note_all = ungettext('%(total_count)s selected',
-            'All %(total_count)s selected', cl.result_count)
+        if cl.result_count is None:
+            # The results aren't counted when using keyset pagination.
+            selection_note_all = _('All selected')
+        else:
+            selection_note_all = ungettext('%(total_count)s selected',
+                'All %(total_count)s selected', cl.result_count)
 
         context = dict(
             self.admin_site.each_context(),
@@ -5,8 +5,8 @@ import datetime
 from django.contrib.admin.templatetags.admin_urls import add_preserved_filters
 from django.contrib.admin.utils import (lookup_field, display_for_field,
     display_for_value, label_for_field)
-from django.contrib.admin.views.main import (ALL_VAR, EMPTY_CHANGELIST_VALUE,
-    ORDER_VAR, PAGE_VAR, SEARCH_VAR)
+from django.contrib.admin.views.main import (ALL_VAR, CURSOR_VAR,
+    EMPTY_CHANGELIST_VALUE, ORDER_VAR, PAGE_VAR, SEARCH_VAR)
 from django.contrib.admin.templatetags.admin_static import static
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.urlresolvers import NoReverseMatch
@@ -50,8 +50,18 @@ def pagination(cl):
     paginator, page_num = cl.paginator, cl.page_num
 
     pagination_required = (not cl.show_all or not cl.can_show_all) and cl.multi_page
+    previous_url = next_url = None
     if not pagination_required:
         page_range = []
+    elif cl.page is not None:
+        # Keyset pagination only allows moving to the adjacent pages.
+        page_range = []
+        previous_cursor = cl.page.previous_cursor()
+        if previous_cursor is not None:
+            previous_url = cl.get_query_string({CURSOR_VAR: previous_cursor})
+        next_cursor = cl.page.next_cursor()
+        if next_cursor is not None:
+            next_url = cl.get_query_string({CURSOR_VAR: next_cursor})
     else:
         ON_EACH_SIDE = 3
         ON_ENDS = 2
@@ -84,6 +94,8 @@ def pagination(cl):
         'pagination_required': pagination_required,
         'show_all_url': need_show_all_link and cl.get_query_string({ALL_VAR: ''}),
         'page_range': page_range,
+        'previous_url': previous_url,
+        'next_url': next_url,
         'ALL_VAR': ALL_VAR,
         '1': 1,
     }
@@ -404,7 +416,8 @@ def search_form(cl):
     """
     return {
         'cl': cl,
-        'show_result_count': cl.result_count != cl.full_result_count,
+        'show_result_count': (cl.result_count is not None and
+                              cl.result_count != cl.full_result_count),
         'search_var': SEARCH_VAR
     }
 
@@ -1,6 +1,6 @@
 from __future__ import unicode_literals
 
-from collections import defaultdict
+from collections import defaultdict, deque
 import datetime
 import decimal
 
@@ -222,6 +222,37 @@ class NestedObjects(Collector):
         return False
 
 
+class QueryRecorder(object):
+    """
+    Records the queries run on a database connection between start() and
+    stop(), whether or not the connection is logging queries already.
+    """
+    def __init__(self, connection):
+        self.connection = connection
+        self.queries = None
+        self._saved = None
+
+    def start(self):
+        connection = self.connection
+        self._saved = (connection.queries_log, connection.force_debug_cursor)
+        connection.queries_log = deque(maxlen=connection.queries_limit)
+        connection.force_debug_cursor = True
+
+    def stop(self):
+        """
+        Restores the connection's query log and stops recording. Calling
+        stop() again has no effect.
+        """
+        if self._saved is None:
+            return
+        connection = self.connection
+        self.queries = list(connection.queries_log)
+        connection.queries_log, connection.force_debug_cursor = self._saved
+        self._saved = None
+        if connection.queries_logged:
+            connection.queries_log.extend(self.queries)
+
+
 def model_format_dict(obj):
     """
     Return a `dict` with keys 'verbose_name' and 'verbose_name_plural',
@@ -441,6 +472,24 @@ def reverse_field_path(model, path):
     return (parent, LOOKUP_SEP.join(reversed_path))
 
 
+def get_non_null_related_paths(opts, max_depth=5):
+    """
+    Returns the paths of the relations that select_related() follows when it's
+    called without arguments: the non-null foreign keys, up to max_depth levels
+    deep.
+    """
+    paths = []
+    if max_depth:
+        for field in opts.fields:
+            if isinstance(field.rel, models.ManyToOneRel) and not field.null:
+                paths.append(field.name)
+                paths.extend(
+                    field.name + LOOKUP_SEP + path
+                    for path in get_non_null_related_paths(field.rel.to._meta, max_depth - 1)
+                )
+    return paths
+
+
 def get_fields_from_path(model, path):
     """ Return list of Fields given path relative to model.
 
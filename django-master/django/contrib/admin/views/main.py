@@ -2,10 +2,12 @@ from collections import OrderedDict
 import sys
 
 from django.core.exceptions import SuspiciousOperation, ImproperlyConfigured
-from django.core.paginator import InvalidPage
+from django.core.paginator import InvalidPage, Paginator
 from django.core.urlresolvers import reverse
-from django.db import models
+from django.db import connections, models
+from django.db.models.constants import LOOKUP_SEP
 from django.db.models.fields import FieldDoesNotExist
+from django.db.models.sql.datastructures import EmptyResultSet
 from django.utils import six
 from django.utils.encoding import force_text
 from django.utils.translation import ugettext, ugettext_lazy
@@ -17,10 +19,11 @@ from django.contrib.admin.exceptions import (
 )
 from django.contrib.admin.options import IncorrectLookupParameters, IS_POPUP_VAR, TO_FIELD_VAR
 from django.contrib.admin.utils import (quote, get_fields_from_path,
-    lookup_needs_distinct, prepare_lookup_value)
+    get_non_null_related_paths, lookup_needs_distinct, prepare_lookup_value)
 
 # Changelist settings
 ALL_VAR = 'all'
+CURSOR_VAR = 'c'
 ORDER_VAR = 'o'
 ORDER_TYPE_VAR = 'ot'
 PAGE_VAR = 'p'
@@ -58,6 +61,7 @@ class ChangeList(object):
             self.page_num = int(request.GET.get(PAGE_VAR, 0))
         except ValueError:
             self.page_num = 0
+        self.cursor = request.GET.get(CURSOR_VAR)
         self.show_all = ALL_VAR in request.GET
         self.is_popup = IS_POPUP_VAR in request.GET
         to_field = request.GET.get(TO_FIELD_VAR)
@@ -67,6 +71,8 @@ class ChangeList(object):
         self.params = dict(request.GET.items())
         if PAGE_VAR in self.params:
             del self.params[PAGE_VAR]
+        if CURSOR_VAR in self.params:
+            del self.params[CURSOR_VAR]
         if ERROR_FLAG in self.params:
             del self.params[ERROR_FLAG]
 
@@ -169,21 +175,33 @@ class ChangeList(object):
         return '?%s' % urlencode(sorted(p.items()))
 
     def get_results(self, request):
+        if self.model_admin.keyset_pagination:
+            return self.get_keyset_results(request)
+
         paginator = self.model_admin.get_paginator(request, self.queryset, self.list_per_page)
-        # Get the number of objects, with admin filters applied.
-        result_count = paginator.count
-
-        # Get the total number of objects, with no admin filters applied.
-        # Perform a slight optimization:
-        # full_result_count is equal to paginator.count if no filters
-        # were applied
-        if self.model_admin.show_full_result_count:
-            if self.get_filters_params() or self.params.get(SEARCH_VAR):
-                full_result_count = self.root_queryset.count()
+        filtered = bool(self.get_filters_params() or self.params.get(SEARCH_VAR))
+        if (filtered and self.model_admin.show_full_result_count and
+                type(paginator) is Paginator and
+                not self.model_admin.estimate_result_count):
+            # Count the filtered and the total number of objects in a single
+            # query, and spare the paginator from counting them again. Custom
+            # paginators may count differently, so they're left alone.
+            result_count, full_result_count = self.get_result_counts()
+            paginator._count = result_count
+        else:
+            # Get the number of objects, with admin filters applied.
+            result_count = paginator.count
+
+            # Get the total number of objects, with no admin filters applied.
+            # Perform a slight optimization:
+            # full_result_count is equal to paginator.count if no filters
+            # were applied
+            if not self.model_admin.show_full_result_count:
+                full_result_count = None
+            elif filtered:
+                full_result_count = self.get_full_result_count()
             else:
                 full_result_count = result_count
-        else:
-            full_result_count = None
         can_show_all = result_count <= self.list_max_show_all
         multi_page = result_count > self.list_per_page
 
@@ -206,6 +224,88 @@ class ChangeList(object):
         self.can_show_all = can_show_all
         self.multi_page = multi_page
         self.paginator = paginator
+        self.page = None
+
+    def get_keyset_results(self, request):
+        """
+        Like get_results(), but pages through the results by cursor with the
+        model admin's keyset paginator, so that no page requires an OFFSET.
+        The filtered results aren't counted; result_count is None unless no
+        filters are applied, in which case it's the full result count.
+        """
+        paginator = self.model_admin.get_keyset_paginator(request, self.queryset, self.list_per_page)
+        filtered = bool(self.get_filters_params() or self.params.get(SEARCH_VAR))
+        if self.model_admin.show_full_result_count or not filtered:
+            full_result_count = self.get_full_result_count()
+        else:
+            full_result_count = None
+        result_count = None if filtered else full_result_count
+        can_show_all = result_count is not None and result_count <= self.list_max_show_all
+
+        if self.show_all and can_show_all:
+            page = None
+            result_list = self.queryset._clone()
+            multi_page = result_count > self.list_per_page
+        else:
+            try:
+                page = paginator.page(self.cursor)
+            except InvalidPage:
+                raise IncorrectLookupParameters
+            result_list = page.object_list
+            multi_page = page.has_other_pages()
+
+        self.result_count = result_count
+        self.show_full_result_count = self.model_admin.show_full_result_count
+        self.show_admin_actions = self.show_full_result_count or bool(result_list)
+        self.full_result_count = full_result_count
+        self.result_list = result_list
+        self.can_show_all = can_show_all
+        self.multi_page = multi_page
+        self.paginator = paginator
+        self.page = page
+
+    def get_result_counts(self):
+        """
+        Returns a (result_count, full_result_count) tuple: the number of
+        objects with and without the admin filters applied, counted with a
+        single query when both querysets use the same database.
+        """
+        queryset, root_queryset = self.queryset, self.root_queryset
+        if (queryset.db != root_queryset.db or
+                queryset.query.low_mark or queryset.query.high_mark is not None or
+                root_queryset.query.low_mark or root_queryset.query.high_mark is not None):
+            return queryset.count(), root_queryset.count()
+        try:
+            sql, params = queryset.order_by().values('pk').query.sql_with_params()
+            root_sql, root_params = root_queryset.order_by().values('pk').query.sql_with_params()
+        except EmptyResultSet:
+            return queryset.count(), root_queryset.count()
+        connection = connections[queryset.db]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT COUNT(*), (SELECT COUNT(*) FROM (%s) full_subquery) '
+                'FROM (%s) subquery' % (root_sql, sql),
+                root_params + params)
+            return tuple(cursor.fetchone())
+
+    def get_full_result_count(self):
+        """
+        Returns the number of objects with no admin filters applied. If the
+        model admin's estimate_result_count is set and the queryset isn't
+        filtered, the number is estimated from the database's statistics
+        when they are available.
+        """
+        queryset = self.root_queryset
+        if self.model_admin.estimate_result_count and not (
+                queryset.query.where or queryset.query.distinct or
+                queryset.query.extra or queryset.query.low_mark or
+                queryset.query.high_mark is not None):
+            connection = connections[queryset.db]
+            with connection.cursor() as cursor:
+                estimate = connection.ops.estimated_row_count(cursor, self.opts.db_table)
+            if estimate is not None:
+                return estimate
+        return queryset.count()
 
     def _get_default_ordering(self):
         ordering = []
@@ -346,6 +446,8 @@ class ChangeList(object):
 
         if not qs.query.select_related:
             qs = self.apply_select_related(qs)
+        if self.model_admin.list_prefetch_related:
+            qs = qs.prefetch_related(*self.model_admin.list_prefetch_related)
 
         # Set ordering.
         ordering = self.get_ordering(request, qs)
@@ -366,23 +468,57 @@ class ChangeList(object):
             return qs.select_related()
 
         if self.list_select_related is False:
-            if self.has_related_field_in_list_display():
-                return qs.select_related()
+            related_paths = self.get_related_paths_in_list_display()
+            if related_paths:
+                # Also follow the non-null foreign keys of the model and of
+                # the related models, like select_related() without arguments
+                # does, since their string representation may use them.
+                paths = list(related_paths)
+                for path in [''] + related_paths:
+                    if path:
+                        model = get_fields_from_path(self.model, path)[-1].rel.to
+                        prefix = path + LOOKUP_SEP
+                    else:
+                        model, prefix = self.model, ''
+                    for subpath in get_non_null_related_paths(model._meta):
+                        if prefix + subpath not in paths:
+                            paths.append(prefix + subpath)
+                return qs.select_related(*paths)
 
         if self.list_select_related:
             return qs.select_related(*self.list_select_related)
         return qs
 
-    def has_related_field_in_list_display(self):
+    def get_related_paths_in_list_display(self):
+        """
+        Returns the relations that the columns of list_display follow, for
+        select_related(): the foreign keys in list_display and those in the
+        admin_order_field of its callables, e.g. 'author' for
+        'author__name'.
+        """
+        paths = []
         for field_name in self.list_display:
             try:
-                field = self.lookup_opts.get_field(field_name)
-            except models.FieldDoesNotExist:
-                pass
-            else:
-                if isinstance(field.rel, models.ManyToOneRel):
-                    return True
-        return False
+                order_field = self.get_ordering_field(field_name)
+            except (AttributeError, models.FieldDoesNotExist):
+                continue
+            if not isinstance(order_field, six.string_types):
+                continue
+            opts = self.lookup_opts
+            related_path = []
+            for part in order_field.lstrip('-').split(LOOKUP_SEP):
+                try:
+                    field = opts.get_field(part)
+                except models.FieldDoesNotExist:
+                    break
+                if not isinstance(field.rel, models.ManyToOneRel):
+                    break
+                related_path.append(part)
+                opts = field.rel.to._meta
+            path = LOOKUP_SEP.join(related_path)
+            if path and path not in paths:
+                paths.append(path)
+        return paths
 
     def url_for_result(self, result):
         pk = getattr(result, self.pk_attname)
@@ -13,6 +13,7 @@ from .signals import user_logged_in, user_logged_out, user_login_failed
 SESSION_KEY = '_auth_user_id'
 BACKEND_SESSION_KEY = '_auth_user_backend'
 HASH_SESSION_KEY = '_auth_user_hash'
+PREVIOUS_HASH_SESSION_KEY = '_auth_user_previous_hash'
 REDIRECT_FIELD_NAME = 'next'
 
 
@@ -99,6 +100,10 @@ def login(request, user):
     request.session[SESSION_KEY] = user.pk
     request.session[BACKEND_SESSION_KEY] = user.backend
     request.session[HASH_SESSION_KEY] = session_auth_hash
+    password_upgrade = getattr(user, '_password_upgrade', None)
+    if password_upgrade is not None:
+        # The password hash is being upgraded in the background.
+        password_upgrade.add_session(request.session)
     if hasattr(request, 'user'):
         request.user = user
     rotate_token(request)
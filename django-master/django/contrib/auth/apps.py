@@ -11,3 +11,6 @@ class AuthConfig(AppConfig):
 
     def ready(self):
         checks.register(checks.Tags.models)(check_user_model)
+
+        from django.contrib.auth.backends import update_cached_permissions_receivers
+        update_cached_permissions_receivers()
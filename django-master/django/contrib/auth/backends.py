@@ -1,6 +1,14 @@
 from __future__ import unicode_literals
-from django.contrib.auth import get_user_model
-from django.contrib.auth.models import Permission
+from django.conf import settings
+from django.contrib.auth import get_user_model, load_backend
+from django.contrib.auth.models import Group, Permission
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from django.test.signals import setting_changed
+from django.utils.crypto import get_random_string
+from django.utils.module_loading import import_string
 
 
 class ModelBackend(object):
@@ -94,6 +102,171 @@ class ModelBackend(object):
             return None
 
 
+class CachedModelBackend(ModelBackend):
+    """
+    A ModelBackend which keeps the permissions of users in a cache, so that
+    they aren't queried from the database on every request.
+
+    The cached permissions are keyed by a version which changes whenever
+    permissions or the permissions of groups change, and are deleted when
+    the groups or permissions of a user change, see
+    invalidate_cached_permissions().
+    """
+    cache_alias = 'default'
+    key_prefix = 'django.contrib.auth.permissions'
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def get_version(self):
+        version_key = '%s.version' % self.key_prefix
+        version = self.cache.get(version_key)
+        if version is None:
+            self.cache.add(version_key, get_random_string(12), None)
+            version = self.cache.get(version_key)
+        return version
+
+    def bump_version(self):
+        """
+        Invalidates the cached permissions of all users.
+        """
+        self.cache.set('%s.version' % self.key_prefix, get_random_string(12), None)
+
+    def get_cache_key(self, user_obj, version=None):
+        if version is None:
+            version = self.get_version()
+        # All superusers have all permissions.
+        user_key = 'superuser' if user_obj.is_superuser else user_obj.pk
+        return '%s.%s.%s' % (self.key_prefix, version, user_key)
+
+    def invalidate_user(self, user_pk):
+        """
+        Invalidates the cached permissions of the user with the given pk.
+        """
+        self.cache.delete('%s.%s.%s' % (self.key_prefix, self.get_version(), user_pk))
+
+    def _get_permissions(self, user_obj, obj, from_name):
+        if not user_obj.is_active or user_obj.is_anonymous() or obj is not None:
+            return set()
+
+        perm_cache_name = '_%s_perm_cache' % from_name
+        if not hasattr(user_obj, perm_cache_name):
+            cache_key = self.get_cache_key(user_obj)
+            perms = self.cache.get(cache_key)
+            if perms is None:
+                perms = {
+                    name: frozenset(super(CachedModelBackend, self)._get_permissions(user_obj, obj, name))
+                    for name in ('user', 'group')
+                }
+                self.cache.set(cache_key, perms)
+            for name in ('user', 'group'):
+                setattr(user_obj, '_%s_perm_cache' % name, set(perms[name]))
+        return getattr(user_obj, perm_cache_name)
+
+
+def invalidate_cached_permissions(sender, **kwargs):
+    """
+    Signal receiver invalidating the permissions cached by the
+    CachedModelBackends of AUTHENTICATION_BACKENDS when the permissions of
+    users or groups change.
+    """
+    backends = [
+        backend for backend in map(load_backend, settings.AUTHENTICATION_BACKENDS)
+        if isinstance(backend, CachedModelBackend)
+    ]
+    if not backends:
+        return
+    UserModel = get_user_model()
+    instance = kwargs.get('instance')
+    action = kwargs.get('action')
+    if action is not None:
+        # m2m_changed
+        if action not in ('post_add', 'post_remove', 'post_clear'):
+            return
+        user_relations = [
+            getattr(UserModel, name).through for name in ('groups', 'user_permissions')
+            if hasattr(UserModel, name)
+        ]
+        if sender is Group.permissions.through:
+            user_pks = None
+        elif sender in user_relations:
+            if not kwargs['reverse']:
+                user_pks = [instance.pk]
+            else:
+                # pk_set is None when clearing a group or a permission.
+                user_pks = kwargs['pk_set']
+        else:
+            return
+    elif sender is UserModel:
+        # post_delete
+        user_pks = [instance.pk]
+    elif sender in (Group, Permission):
+        user_pks = None
+    else:
+        return
+
+    for backend in backends:
+        if user_pks is None:
+            backend.bump_version()
+        else:
+            for user_pk in user_pks:
+                backend.invalidate_user(user_pk)
+
+
+# The (signal, sender) pairs invalidate_cached_permissions() is connected to.
+_connected_receivers = []
+
+
+def update_cached_permissions_receivers():
+    """
+    Connects invalidate_cached_permissions() to the signals sent when
+    permissions change if a CachedModelBackend is in AUTHENTICATION_BACKENDS,
+    and disconnects it otherwise. Receivers of post_delete disable fast
+    deletes, so they aren't connected needlessly.
+    """
+    for signal, sender in _connected_receivers:
+        signal.disconnect(invalidate_cached_permissions, sender=sender)
+    del _connected_receivers[:]
+
+    for backend_path in settings.AUTHENTICATION_BACKENDS:
+        try:
+            backend_class = import_string(backend_path)
+        except ImportError:
+            # load_backend() raises the error when the backend is used.
+            continue
+        if isinstance(backend_class, type) and issubclass(backend_class, CachedModelBackend):
+            break
+    else:
+        return
+
+    receivers = [
+        (m2m_changed, Group.permissions.through),
+        (post_save, Permission),
+        (post_delete, Permission),
+        (post_delete, Group),
+    ]
+    try:
+        UserModel = get_user_model()
+    except ImproperlyConfigured:
+        # get_user_model() raises the same error wherever it's used.
+        pass
+    else:
+        receivers.append((post_delete, UserModel))
+        for name in ('groups', 'user_permissions'):
+            if hasattr(UserModel, name):
+                receivers.append((m2m_changed, getattr(UserModel, name).through))
+    for signal, sender in receivers:
+        signal.connect(invalidate_cached_permissions, sender=sender)
+        _connected_receivers.append((signal, sender))
+
+
+@receiver(setting_changed)
+def reset_cached_permissions_receivers(**kwargs):
+    if kwargs['setting'] in ('AUTHENTICATION_BACKENDS', 'AUTH_USER_MODEL'):
+        update_cached_permissions_receivers()
+
+
 class RemoteUserBackend(ModelBackend):
     """
     This backend is to be used in conjunction with the ``RemoteUserMiddleware``
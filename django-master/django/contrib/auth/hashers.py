@@ -5,22 +5,30 @@ import binascii
 from collections import OrderedDict
 import hashlib
 import importlib
+import logging
+import threading
 
 from django.dispatch import receiver
 from django.conf import settings
 from django.test.signals import setting_changed
 from django.utils.encoding import force_bytes, force_str, force_text
 from django.core.exceptions import ImproperlyConfigured
+from django.db import connections
 from django.utils.crypto import (
     pbkdf2, constant_time_compare, get_random_string)
 from django.utils.module_loading import import_string
+from django.utils.six.moves import queue
 from django.utils.translation import ugettext_noop as _
 
+logger = logging.getLogger('django.contrib.auth')
+
 
 UNUSABLE_PASSWORD_PREFIX = '!'  # This will never be a valid encoded hash
 UNUSABLE_PASSWORD_SUFFIX_LENGTH = 40  # number of random chars to add after UNUSABLE_PASSWORD_PREFIX
 HASHERS = None  # lazily loaded from PASSWORD_HASHERS
 PREFERRED_HASHER = None  # defaults to first item in PASSWORD_HASHERS
+HASHING_SEMAPHORE = None  # lazily created from PASSWORD_HASHING_CONCURRENCY
+HASHING_SEMAPHORE_LOCK = threading.Lock()
 
 
 @receiver(setting_changed)
@@ -29,6 +37,88 @@ def reset_hashers(**kwargs):
         global HASHERS, PREFERRED_HASHER
         HASHERS = None
         PREFERRED_HASHER = None
+    elif kwargs['setting'] == 'PASSWORD_HASHING_CONCURRENCY':
+        global HASHING_SEMAPHORE
+        HASHING_SEMAPHORE = None
+
+
+class hashing_slot(object):
+    """
+    Context manager that waits until fewer than PASSWORD_HASHING_CONCURRENCY
+    threads are hashing a password. Hashing is CPU bound: letting every
+    request thread hash at once under a burst of logins only makes all of
+    them slower.
+    """
+    def __enter__(self):
+        global HASHING_SEMAPHORE
+        if settings.PASSWORD_HASHING_CONCURRENCY is None:
+            self.semaphore = None
+            return
+        if HASHING_SEMAPHORE is None:
+            with HASHING_SEMAPHORE_LOCK:
+                # Another thread may have created it in the meantime.
+                if HASHING_SEMAPHORE is None:
+                    HASHING_SEMAPHORE = threading.BoundedSemaphore(
+                        settings.PASSWORD_HASHING_CONCURRENCY)
+        self.semaphore = HASHING_SEMAPHORE
+        self.semaphore.acquire()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.semaphore is not None:
+            self.semaphore.release()
+
+
+class PasswordUpgradeQueue(object):
+    """
+    Runs the setters passed to check_password() in a background thread, so
+    that upgrading the hash of a password doesn't delay the login.
+
+    The queue is bounded: when it's full, upgrades are dropped, since they
+    will be attempted again the next time the user logs in.
+    """
+    maxsize = 1000
+
+    def __init__(self):
+        self.queue = queue.Queue(self.maxsize)
+        self.lock = threading.Lock()
+        self.thread = None
+
+    def put(self, setter, password):
+        """
+        Schedules a call to setter(password). Returns False if the queue is
+        full.
+        """
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self.run, name='PasswordUpgradeQueue')
+                self.thread.daemon = True
+                self.thread.start()
+        try:
+            self.queue.put_nowait((setter, password))
+        except queue.Full:
+            return False
+        return True
+
+    def join(self):
+        """
+        Blocks until all the scheduled upgrades are done.
+        """
+        self.queue.join()
+
+    def run(self):
+        while True:
+            setter, password = self.queue.get()
+            try:
+                setter(password)
+            except Exception:
+                logger.exception("Password hash upgrade failed.")
+            finally:
+                # Don't leave connections opened by the setter idle.
+                for conn in connections.all():
+                    conn.close()
+                self.queue.task_done()
+
+password_upgrade_queue = PasswordUpgradeQueue()
 
 
 def is_password_usable(encoded):
@@ -47,7 +137,8 @@ def check_password(password, encoded, setter=None, preferred='default'):
     part encoded digest.
 
     If setter is specified, it'll be called when you need to
-    regenerate the password.
+    regenerate the password, in a background thread if the
+    PASSWORD_UPGRADE_IN_BACKGROUND setting is True.
     """
     if password is None or not is_password_usable(encoded):
         return False
@@ -58,9 +149,13 @@ def check_password(password, encoded, setter=None, preferred='default'):
     must_update = hasher.algorithm != preferred.algorithm
     if not must_update:
         must_update = preferred.must_update(encoded)
-    is_correct = hasher.verify(password, encoded)
+    with hashing_slot():
+        is_correct = hasher.verify(password, encoded)
     if setter and is_correct and must_update:
-        setter(password)
+        if settings.PASSWORD_UPGRADE_IN_BACKGROUND:
+            password_upgrade_queue.put(setter, password)
+        else:
+            setter(password)
     return is_correct
 
 
@@ -82,7 +177,8 @@ def make_password(password, salt=None, hasher='default'):
     if not salt:
         salt = hasher.salt()
 
-    return hasher.encode(password, salt)
+    with hashing_slot():
+        return hasher.encode(password, salt)
 
 
 def load_hashers(password_hashers=None):
@@ -37,6 +37,13 @@ class SessionAuthenticationMiddleware(object):
                 session_hash,
                 user.get_session_auth_hash()
             )
+            if not session_hash_verified:
+                # The upgrade of the password's hash may not be saved yet.
+                previous_hash = request.session.get(auth.PREVIOUS_HASH_SESSION_KEY)
+                session_hash_verified = previous_hash and constant_time_compare(
+                    previous_hash,
+                    user.get_session_auth_hash()
+                )
             if not session_hash_verified:
                 auth.logout(request)
 
@@ -1,7 +1,13 @@
 from __future__ import unicode_literals
 
+import copy
+from importlib import import_module
+import threading
+
+from django.conf import settings
 from django.core.exceptions import PermissionDenied
 from django.core.mail import send_mail
+from django.core.signals import request_finished
 from django.core import validators
 from django.db import models
 from django.db.models.manager import EmptyManager
@@ -36,6 +42,89 @@ class PermissionManager(models.Manager):
         )
 
 
+class PasswordUpgrade(object):
+    """
+    Upgrades the hash of a user's password in the background, see the
+    PASSWORD_UPGRADE_IN_BACKGROUND setting. Called with the raw password by
+    the password upgrade queue's thread.
+
+    The user instance, which the request thread is still using, isn't
+    modified: the new hash is written to the database only if the password
+    hasn't changed in the meantime. Since the session auth hash depends on
+    the password hash, the sessions the user was logged in by the same
+    request, see login(), are updated too so they remain valid.
+    """
+    def __init__(self, user):
+        # A copy computes the session auth hashes, user may be a subclass
+        # overriding get_session_auth_hash().
+        self.user = copy.copy(user)
+        self.old_password = user.password
+        self.old_session_auth_hash = user.get_session_auth_hash()
+        self.new_password = None
+        self.new_session_auth_hash = None
+        self.lock = threading.Lock()
+        self.pending_sessions = 0
+        self.session_keys = []
+
+    def __call__(self, raw_password):
+        self.user.set_password(raw_password)
+        with self.lock:
+            self.new_password = self.user.password
+            self.new_session_auth_hash = self.user.get_session_auth_hash()
+            # Otherwise the request logging the user in completes it.
+            complete = not self.pending_sessions
+        if complete:
+            self.complete()
+
+    def add_session(self, session):
+        """
+        Called by login() with the session of the user. The session is saved
+        when the response has been sent, only then can it be updated.
+        """
+        with self.lock:
+            if self.new_password is not None and not self.pending_sessions:
+                # The new hash is being written. The session isn't saved yet
+                # and can be updated directly.
+                self.update_session(session)
+                return
+            self.pending_sessions += 1
+        thread = threading.current_thread()
+
+        def session_saved(**kwargs):
+            # request_finished is sent by every request; the one logging in
+            # is the next one to finish in this thread.
+            if threading.current_thread() is not thread:
+                return
+            request_finished.disconnect(session_saved)
+            with self.lock:
+                self.pending_sessions -= 1
+                if session.session_key:
+                    self.session_keys.append(session.session_key)
+                complete = self.new_password is not None and not self.pending_sessions
+            if complete:
+                self.complete()
+
+        request_finished.connect(session_saved, weak=False)
+
+    def update_session(self, session):
+        if session.get(auth.HASH_SESSION_KEY) == self.old_session_auth_hash:
+            session[auth.HASH_SESSION_KEY] = self.new_session_auth_hash
+            # Accepted until the new hash is in the database.
+            session[auth.PREVIOUS_HASH_SESSION_KEY] = self.old_session_auth_hash
+            return True
+        return False
+
+    def complete(self):
+        SessionStore = import_module(settings.SESSION_ENGINE).SessionStore
+        for session_key in self.session_keys:
+            session = SessionStore(session_key)
+            if self.update_session(session):
+                session.save()
+        self.user.__class__._default_manager.using(self.user._state.db).filter(
+            pk=self.user.pk, password=self.old_password,
+        ).update(password=self.new_password)
+
+
 @python_2_unicode_compatible
 class Permission(models.Model):
     """
@@ -231,9 +320,13 @@ class AbstractBaseUser(models.Model):
         Returns a boolean of whether the raw_password was correct. Handles
         hashing formats behind the scenes.
         """
-        def setter(raw_password):
-            self.set_password(raw_password)
-            self.save(update_fields=["password"])
+        if settings.PASSWORD_UPGRADE_IN_BACKGROUND:
+            # login() updates the session auth hash along with the password.
+            setter = self._password_upgrade = PasswordUpgrade(self)
+        else:
+            def setter(raw_password):
+                self.set_password(raw_password)
+                self.save(update_fields=["password"])
         return check_password(raw_password, self.password, setter)
 
     def set_unusable_password(self):
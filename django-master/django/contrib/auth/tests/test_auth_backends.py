@@ -2,12 +2,14 @@ from __future__ import unicode_literals
 from datetime import date
 
 from django.conf import settings
-from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.backends import CachedModelBackend, ModelBackend
 from django.contrib.auth.models import User, Group, Permission, AnonymousUser
 from django.contrib.auth.tests.utils import skipIfCustomUser
 from django.contrib.auth.tests.custom_user import ExtensionUser, CustomPermissionsUser, CustomUser
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import caches
 from django.core.exceptions import ImproperlyConfigured, PermissionDenied
+from django.db.models.signals import post_delete, post_save
 from django.contrib.auth import authenticate, get_user
 from django.http import HttpRequest
 from django.test import TestCase, override_settings
@@ -209,6 +211,90 @@ class ModelBackendTest(BaseModelBackendTest, TestCase):
         )
 
 
+@skipIfCustomUser
+@override_settings(
+    AUTHENTICATION_BACKENDS=('django.contrib.auth.backends.CachedModelBackend',),
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+)
+class CachedModelBackendTest(ModelBackendTest):
+    """
+    Tests for the CachedModelBackend using the default User model.
+    """
+    backend = 'django.contrib.auth.backends.CachedModelBackend'
+
+    def setUp(self):
+        caches['default'].clear()
+        super(CachedModelBackendTest, self).setUp()
+
+    def test_permissions_cached(self):
+        content_type = ContentType.objects.get_for_model(Group)
+        perm = Permission.objects.create(name='test', content_type=content_type, codename='test')
+        group = Group.objects.create(name='test_group')
+        group.permissions.add(perm)
+        self.user.groups.add(group)
+
+        user = User.objects.get(pk=self.user.pk)
+        with self.assertNumQueries(2):
+            self.assertTrue(user.has_perm('auth.test'))
+        user = User.objects.get(pk=self.user.pk)
+        with self.assertNumQueries(0):
+            self.assertTrue(user.has_perm('auth.test'))
+            self.assertEqual(user.get_group_permissions(), {'auth.test'})
+
+    def test_invalidation(self):
+        content_type = ContentType.objects.get_for_model(Group)
+        perm = Permission.objects.create(name='test', content_type=content_type, codename='test')
+        group = Group.objects.create(name='test_group')
+        self.user.groups.add(group)
+
+        def has_perm():
+            return User.objects.get(pk=self.user.pk).has_perm('auth.test')
+
+        self.assertFalse(has_perm())
+        # Changing the permissions of a group.
+        group.permissions.add(perm)
+        self.assertTrue(has_perm())
+        perm.group_set.clear()
+        self.assertFalse(has_perm())
+        # Changing the groups of a user, from both sides.
+        group.permissions.add(perm)
+        self.user.groups.remove(group)
+        self.assertFalse(has_perm())
+        group.user_set.add(self.user)
+        self.assertTrue(has_perm())
+        # Changing the permissions of a user.
+        group.delete()
+        self.assertFalse(has_perm())
+        self.user.user_permissions.add(perm)
+        self.assertTrue(has_perm())
+        perm.codename = 'renamed'
+        perm.save()
+        self.assertFalse(has_perm())
+
+    def test_receivers_connected_when_configured(self):
+        """
+        The receivers invalidating the cached permissions are only connected
+        when a CachedModelBackend is configured, since they disable fast
+        deletes.
+        """
+        self.assertTrue(post_delete.has_listeners(Group))
+        with self.settings(AUTHENTICATION_BACKENDS=('django.contrib.auth.backends.ModelBackend',)):
+            self.assertFalse(post_delete.has_listeners(Group))
+            self.assertFalse(post_save.has_listeners(Permission))
+        self.assertTrue(post_delete.has_listeners(Group))
+
+    def test_user_deletion(self):
+        backend = CachedModelBackend()
+        content_type = ContentType.objects.get_for_model(Group)
+        perm = Permission.objects.create(name='test', content_type=content_type, codename='test')
+        self.user.user_permissions.add(perm)
+        self.assertTrue(self.user.has_perm('auth.test'))
+        cache_key = backend.get_cache_key(self.user)
+        self.assertIsNotNone(backend.cache.get(cache_key))
+        self.user.delete()
+        self.assertIsNone(backend.cache.get(cache_key))
+
+
 @override_settings(AUTH_USER_MODEL='auth.ExtensionUser')
 class ExtensionUserModelBackendTest(BaseModelBackendTest, TestCase):
     """
@@ -1,13 +1,16 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
+import threading
+import time
 from unittest import skipUnless
 
 from django.conf.global_settings import PASSWORD_HASHERS as default_hashers
 from django.contrib.auth.hashers import (is_password_usable, BasePasswordHasher,
     check_password, make_password, PBKDF2PasswordHasher, load_hashers, PBKDF2SHA1PasswordHasher,
-    get_hasher, identify_hasher, UNUSABLE_PASSWORD_PREFIX, UNUSABLE_PASSWORD_SUFFIX_LENGTH)
-from django.test import SimpleTestCase
+    get_hasher, identify_hasher, UNUSABLE_PASSWORD_PREFIX, UNUSABLE_PASSWORD_SUFFIX_LENGTH,
+    password_upgrade_queue)
+from django.test import SimpleTestCase, override_settings
 from django.utils import six
 
 
@@ -26,6 +29,24 @@ class PBKDF2SingleIterationHasher(PBKDF2PasswordHasher):
     iterations = 1
 
 
+class ConcurrencyRecordingHasher(PBKDF2SingleIterationHasher):
+    """
+    Records the highest number of threads encoding at the same time.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = self.max_active = 0
+
+    def encode(self, password, salt):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.01)
+        with self.lock:
+            self.active -= 1
+        return super(ConcurrencyRecordingHasher, self).encode(password, salt)
+
+
 class TestUtilsHashPass(SimpleTestCase):
 
     def setUp(self):
@@ -311,6 +332,68 @@ class TestUtilsHashPass(SimpleTestCase):
             self.assertTrue(check_password('letmein', encoded, setter))
             self.assertTrue(state['upgraded'])
 
+    @override_settings(PASSWORD_UPGRADE_IN_BACKGROUND=True)
+    def test_upgrade_in_background(self):
+        encoded = make_password('lètmein', hasher='sha1')
+        state = {'upgraded': False}
+
+        def setter(password):
+            state['upgraded'] = True
+            state['thread'] = threading.current_thread()
+        self.assertTrue(check_password('lètmein', encoded, setter))
+        password_upgrade_queue.join()
+        self.assertTrue(state['upgraded'])
+        self.assertNotEqual(state['thread'], threading.current_thread())
+
+    def test_hashing_concurrency(self):
+        hasher = ConcurrencyRecordingHasher()
+
+        def hash_passwords():
+            threads = [
+                threading.Thread(target=make_password, args=('lètmein',), kwargs={'hasher': hasher})
+                for i in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        with self.settings(PASSWORD_HASHING_CONCURRENCY=1):
+            hash_passwords()
+        self.assertEqual(hasher.max_active, 1)
+        with self.settings(PASSWORD_HASHING_CONCURRENCY=2):
+            hash_passwords()
+        self.assertLessEqual(hasher.max_active, 2)
+
+    def test_hashing_semaphore_created_once(self):
+        """
+        Threads hashing passwords for the first time share one semaphore.
+        """
+        created = []
+        BoundedSemaphore = threading.BoundedSemaphore
+
+        def slow_semaphore(value):
+            created.append(value)
+            time.sleep(0.05)
+            return BoundedSemaphore(value)
+
+        hasher = ConcurrencyRecordingHasher()
+        threads = [
+            threading.Thread(target=make_password, args=('lètmein',), kwargs={'hasher': hasher})
+            for i in range(4)
+        ]
+        threading.BoundedSemaphore = slow_semaphore
+        try:
+            with self.settings(PASSWORD_HASHING_CONCURRENCY=1):
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+        finally:
+            threading.BoundedSemaphore = BoundedSemaphore
+        self.assertEqual(created, [1])
+        self.assertEqual(hasher.max_active, 1)
+
     def test_load_library_no_algorithm(self):
         with self.assertRaises(ValueError) as e:
             BasePasswordHasher()._load_library()
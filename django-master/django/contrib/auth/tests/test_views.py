@@ -22,7 +22,8 @@ from django.test.utils import patch_logger
 from django.middleware.csrf import CsrfViewMiddleware
 from django.contrib.sessions.middleware import SessionMiddleware
 
-from django.contrib.auth import SESSION_KEY, REDIRECT_FIELD_NAME
+from django.contrib.auth import (SESSION_KEY, HASH_SESSION_KEY,
+    REDIRECT_FIELD_NAME, authenticate, hashers, login)
 from django.contrib.auth.forms import (AuthenticationForm, PasswordChangeForm,
                 SetPasswordForm)
 # Needed so model is installed when tests are run independently:
@@ -464,6 +465,77 @@ class SessionAuthenticationTests(AuthViewsTestCase):
         # if the hash isn't updated, retrieving the redirection page will fail.
         self.assertRedirects(response, '/password_change/done/')
 
+    def record_password_upgrades(self):
+        """
+        Replaces the password upgrade queue with a list of the scheduled
+        upgrades, which the test runs.
+        """
+        upgrades = []
+
+        class RecordingQueue(object):
+            def put(self, setter, password):
+                upgrades.append((setter, password))
+                return True
+
+        self.addCleanup(setattr, hashers, 'password_upgrade_queue', hashers.password_upgrade_queue)
+        hashers.password_upgrade_queue = RecordingQueue()
+        return upgrades
+
+    @override_settings(
+        PASSWORD_UPGRADE_IN_BACKGROUND=True,
+        PASSWORD_HASHERS=(
+            'django.contrib.auth.hashers.MD5PasswordHasher',
+            'django.contrib.auth.hashers.SHA1PasswordHasher',
+        ),
+    )
+    def test_password_upgrade_in_background_keeps_session(self):
+        """
+        Upgrading the hash of the password after the login doesn't log the
+        user out.
+        """
+        upgrades = self.record_password_upgrades()
+        self.login()
+        self.assertEqual(len(upgrades), 1)
+        user = User.objects.get(username='testclient')
+        self.assertTrue(user.password.startswith('sha1$'))
+        for setter, password in upgrades:
+            setter(password)
+        user = User.objects.get(username='testclient')
+        self.assertTrue(user.password.startswith('md5$'))
+        for i in range(2):
+            response = self.client.get('/password_change/')
+            self.assertEqual(response.status_code, 200)
+        # A password change still logs other sessions out.
+        user.set_password('password1')
+        user.save()
+        response = self.client.get('/password_change/')
+        self.assertEqual(response.status_code, 302)
+
+    @override_settings(
+        PASSWORD_UPGRADE_IN_BACKGROUND=True,
+        PASSWORD_HASHERS=(
+            'django.contrib.auth.hashers.MD5PasswordHasher',
+            'django.contrib.auth.hashers.SHA1PasswordHasher',
+        ),
+    )
+    def test_password_upgrade_in_background_before_login(self):
+        """
+        The session gets the new session auth hash if the password was
+        upgraded before login() is called.
+        """
+        upgrades = self.record_password_upgrades()
+        user = authenticate(username='testclient', password='password')
+        for setter, password in upgrades:
+            setter(password)
+        # The user instance isn't changed by the upgrade.
+        self.assertTrue(user.password.startswith('sha1$'))
+        request = HttpRequest()
+        request.session = import_module(settings.SESSION_ENGINE).SessionStore()
+        login(request, user)
+        self.assertEqual(
+            request.session[HASH_SESSION_KEY],
+            User.objects.get(username='testclient').get_session_auth_hash())
+
 
 @skipIfCustomUser
 class LoginTest(AuthViewsTestCase):
@@ -1,8 +1,11 @@
 from __future__ import unicode_literals
 
 from django.apps import apps
+from django.conf import settings
+from django.core.cache import caches
 from django.db import models
 from django.db.utils import OperationalError, ProgrammingError
+from django.utils.crypto import get_random_string
 from django.utils.translation import ugettext_lazy as _
 from django.utils.encoding import smart_text, force_text
 from django.utils.encoding import python_2_unicode_compatible
@@ -13,10 +16,12 @@ class ContentTypeManager(models.Manager):
     # Cache to avoid re-looking up ContentType objects all over the place.
     # This cache is shared by all the get_for_* methods.
     _cache = {}
+    # Databases whose ContentType objects were all loaded in the cache.
+    _preloaded = set()
 
     def get_by_natural_key(self, app_label, model):
         try:
-            ct = self.__class__._cache[self.db][(app_label, model)]
+            ct = self._get_cached((app_label, model))
         except KeyError:
             ct = self.get(app_label=app_label, model=model)
             self._add_to_cache(self.db, ct)
@@ -31,8 +36,58 @@ class ContentTypeManager(models.Manager):
 
     def _get_from_cache(self, opts):
         key = (opts.app_label, opts.model_name)
+        return self._get_cached(key)
+
+    def _get_cached(self, key):
+        """
+        Returns a ContentType from the cache given its id or its (app_label,
+        model) natural key. On the first miss, all the ContentType objects of
+        the database are loaded if CONTENT_TYPES_PRELOAD is True.
+        """
+        try:
+            return self.__class__._cache[self.db][key]
+        except KeyError:
+            if not settings.CONTENT_TYPES_PRELOAD or self.db in self.__class__._preloaded:
+                raise
+        try:
+            self.preload()
+        except (OperationalError, ProgrammingError):
+            # The table doesn't exist yet; let the caller query it and fail.
+            raise KeyError(key)
         return self.__class__._cache[self.db][key]
 
+    def _get_shared_cache_keys(self):
+        """
+        Returns the shared cache and the key of the ContentType objects of the
+        database in it, or (None, None) if CONTENT_TYPES_CACHE_ALIAS isn't set.
+        """
+        if settings.CONTENT_TYPES_CACHE_ALIAS is None:
+            return None, None
+        cache = caches[settings.CONTENT_TYPES_CACHE_ALIAS]
+        version_key = 'django.contrib.contenttypes.version'
+        version = cache.get(version_key)
+        if version is None:
+            cache.add(version_key, get_random_string(12), None)
+            version = cache.get(version_key)
+        return cache, 'django.contrib.contenttypes.%s.%s' % (version, self.db)
+
+    def preload(self):
+        """
+        Loads all the ContentType objects of the database in the cache with a
+        single query, or from the cache set by CONTENT_TYPES_CACHE_ALIAS.
+        """
+        shared_cache, cache_key = self._get_shared_cache_keys()
+        cts = None
+        if shared_cache is not None:
+            cts = shared_cache.get(cache_key)
+        if cts is None:
+            cts = list(self.order_by())
+            if shared_cache is not None:
+                shared_cache.set(cache_key, cts, None)
+        for ct in cts:
+            self._add_to_cache(self.db, ct)
+        self.__class__._preloaded.add(self.db)
+
     def get_for_model(self, model, for_concrete_model=True):
         """
         Returns the ContentType object for a given model, creating the
@@ -118,7 +173,7 @@ class ContentTypeManager(models.Manager):
         (though ContentTypes are obviously not created on-the-fly by get_by_id).
         """
         try:
-            ct = self.__class__._cache[self.db][id]
+            ct = self._get_cached(id)
         except KeyError:
             # This could raise a DoesNotExist; that's correct behavior and will
             # make sure that only correct ctypes get stored in the cache dict.
@@ -132,8 +187,15 @@ class ContentTypeManager(models.Manager):
         flushes to prevent caching of "stale" content type IDs (see
         django.contrib.contenttypes.management.update_contenttypes for where
         this gets called).
+
+        The ContentType objects stored in the cache set by
+        CONTENT_TYPES_CACHE_ALIAS are invalidated as well.
         """
         self.__class__._cache.clear()
+        self.__class__._preloaded.clear()
+        if settings.CONTENT_TYPES_CACHE_ALIAS is not None:
+            caches[settings.CONTENT_TYPES_CACHE_ALIAS].set(
+                'django.contrib.contenttypes.version', get_random_string(12), None)
 
     def _add_to_cache(self, using, ct):
         """Insert a ContentType into the cache."""
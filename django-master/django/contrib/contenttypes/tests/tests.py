@@ -2,6 +2,7 @@ from __future__ import unicode_literals
 
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.contenttypes.views import shortcut
+from django.contrib.sites.models import Site
 from django.contrib.sites.shortcuts import get_current_site
 from django.http import HttpRequest, Http404
 from django.test import TestCase, override_settings
@@ -54,6 +55,46 @@ class ContentTypesTests(TestCase):
             ContentType.objects.get_by_natural_key('contenttypes',
                                                    'contenttype')
 
+    @override_settings(CONTENT_TYPES_PRELOAD=True)
+    def test_preload(self):
+        """
+        With CONTENT_TYPES_PRELOAD, the first lookup loads all the content
+        types.
+        """
+        with self.assertNumQueries(1):
+            ct = ContentType.objects.get_for_model(ContentType)
+        with self.assertNumQueries(0):
+            ContentType.objects.get_for_model(Site)
+            ContentType.objects.get_for_id(ct.id)
+            ContentType.objects.get_by_natural_key('contenttypes', 'contenttype')
+            ContentType.objects.get_for_models(ContentType, Site)
+        # A content type created after the preload is still found.
+        ct = ContentType.objects.create(app_label='contenttypes', model='other', name='other')
+        with self.assertNumQueries(1):
+            self.assertEqual(ContentType.objects.get_for_id(ct.id), ct)
+
+    @override_settings(
+        CONTENT_TYPES_PRELOAD=True,
+        CONTENT_TYPES_CACHE_ALIAS='default',
+        CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+    )
+    def test_preload_shared_cache(self):
+        """
+        With CONTENT_TYPES_CACHE_ALIAS, preloaded content types are shared
+        through the cache, and clear_cache() invalidates them.
+        """
+        ContentType.objects.clear_cache()
+        with self.assertNumQueries(1):
+            ct = ContentType.objects.get_for_model(ContentType)
+        # Simulate another process.
+        ContentType.objects.__class__._cache.clear()
+        ContentType.objects.__class__._preloaded.clear()
+        with self.assertNumQueries(0):
+            self.assertEqual(ContentType.objects.get_for_id(ct.id), ct)
+        ContentType.objects.clear_cache()
+        with self.assertNumQueries(1):
+            ContentType.objects.get_for_id(ct.id)
+
     def test_get_for_models_empty_cache(self):
         # Empty cache.
         with self.assertNumQueries(1):
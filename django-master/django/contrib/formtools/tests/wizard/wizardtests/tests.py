@@ -2,6 +2,8 @@ from __future__ import unicode_literals
 
 import copy
 import os
+import shutil
+import tempfile
 
 from django import forms
 from django.test import TestCase, override_settings
@@ -38,16 +40,15 @@ class WizardTests(object):
         # Get new step data, since we modify it during the tests.
         self.wizard_step_data = copy.deepcopy(self.wizard_step_data)
         self.wizard_step_data[0]['form1-user'] = self.testuser.pk
-
-    def tearDown(self):
-        # Ensure that there are no files in the storage which could lead to false
-        # results in the next tests. Deleting the whole storage dir is not really
-        # an option since the storage is defined on the module level and can't be
-        # easily reinitialized. (FIXME: The tests here should use the view classes
-        # directly instead of the test client, then the storage issues would go
-        # away too.)
-        for file in temp_storage.listdir('')[1]:
-            temp_storage.delete(file)
+        # Ensure that there are no files in the storage which could lead to
+        # false results, also from tests running in other processes. The
+        # storage is defined on the module level, so point it to an empty
+        # directory for each test. (FIXME: The tests here should use the view
+        # classes directly instead of the test client, then the storage
+        # issues would go away too.)
+        location = tempfile.mkdtemp(dir=os.environ.get('DJANGO_TEST_TEMP_DIR'))
+        self.addCleanup(shutil.rmtree, location)
+        temp_storage.base_location = temp_storage.location = location
 
     def test_initial_call(self):
         response = self.client.get(self.wizard_url)
@@ -3,12 +3,18 @@
  GeometryCollection, MultiPoint, MultiLineString, and MultiPolygon
 """
 from ctypes import c_int, c_uint, byref
+import struct
+
+from django.contrib.gis.geos.coordseq import (NATIVE_BYTEORDER,
+    array_from_bytes, array_to_bytes, ordinates_array)
 from django.contrib.gis.geos.geometry import GEOSGeometry
 from django.contrib.gis.geos.libgeos import get_pointer_arr
 from django.contrib.gis.geos.linestring import LineString, LinearRing
 from django.contrib.gis.geos.point import Point
 from django.contrib.gis.geos.polygon import Polygon
 from django.contrib.gis.geos import prototypes as capi
+from django.contrib.gis.geos.prototypes.io import wkb_r, wkb_w
+from django.utils import six
 from django.utils.six.moves import xrange
 
 
@@ -97,6 +103,44 @@ class MultiPoint(GeometryCollection):
     _allowed = Point
     _typeid = 4
 
+    @classmethod
+    def from_array(cls, ordinates, dim=2, srid=None):
+        """
+        Returns a new MultiPoint from a flat sequence of the ordinates of its
+        points, i.e. x1, y1[, z1], x2, y2[, z2], ... given as an array('d'),
+        a buffer, a NumPy array or a sequence of numbers.
+
+        The MultiPoint is built in a single call to GEOS, rather than creating
+        each point separately.
+        """
+        if dim not in (2, 3):
+            raise TypeError('Invalid point dimension: %s' % dim)
+        ordinates = ordinates_array(ordinates)
+        if not ordinates:
+            raise TypeError('Must provide at least one Geometry to initialize %s.' % cls.__name__)
+        if len(ordinates) % dim:
+            raise TypeError('Dimension mismatch.')
+        z_flag = 0x80000000 if dim == 3 else 0
+        data = array_to_bytes(ordinates)
+        size = 8 * dim
+        point_header = struct.pack(str('=BI'), NATIVE_BYTEORDER, 1 | z_flag)
+        wkb = [struct.pack(str('=BII'), NATIVE_BYTEORDER, cls._typeid | z_flag, len(data) // size)]
+        wkb.extend(point_header + data[i:i + size] for i in xrange(0, len(data), size))
+        return GEOSGeometry(wkb_r().read(six.memoryview(b''.join(wkb))), srid=srid)
+
+    def to_array(self):
+        """
+        Returns the ordinates of the points of this MultiPoint as a flat
+        array('d'), i.e. x1, y1[, z1], x2, y2[, z2], ...
+        """
+        dim = 3 if self.hasz else 2
+        wkb = bytes(wkb_w(dim).write(self))
+        # Each point has a byte order, a geometry type and its ordinates,
+        # after the byte order, type and number of points of the MultiPoint.
+        size = 8 * dim
+        data = b''.join(wkb[i:i + size] for i in xrange(14, len(wkb), size + 5))
+        return array_from_bytes(data, six.indexbytes(wkb, 0))
+
 
 class MultiLineString(GeometryCollection):
     _allowed = (LineString, LinearRing)
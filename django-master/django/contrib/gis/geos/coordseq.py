@@ -3,13 +3,58 @@
  by GEOSGeometry to house the actual coordinates of the Point,
  LineString, and LinearRing geometries.
 """
+import array
 from ctypes import c_double, c_uint, byref
+import sys
+
 from django.contrib.gis.geos.base import GEOSBase, numpy
 from django.contrib.gis.geos.error import GEOSException, GEOSIndexError
 from django.contrib.gis.geos.libgeos import CS_PTR
 from django.contrib.gis.geos import prototypes as capi
+from django.utils import six
 from django.utils.six.moves import xrange
 
+# The WKB byte order of the machine, 1 for little endian (NDR) and 0 for big
+# endian (XDR).
+NATIVE_BYTEORDER = 1 if sys.byteorder == 'little' else 0
+
+
+def ordinates_array(ordinates):
+    """
+    Returns the given ordinates as an array of doubles. They may be given as
+    an array('d'), a NumPy array, an object supporting the buffer protocol
+    holding doubles in the native byte order, or a sequence of numbers.
+    """
+    if isinstance(ordinates, array.array) and ordinates.typecode == 'd':
+        return ordinates
+    if numpy and isinstance(ordinates, numpy.ndarray):
+        ordinates = numpy.ascontiguousarray(ordinates, dtype=numpy.float64).tostring()
+    elif isinstance(ordinates, (bytes, bytearray, six.memoryview)):
+        ordinates = bytes(ordinates)
+    else:
+        return array.array('d', ordinates)
+    return array_from_bytes(ordinates, NATIVE_BYTEORDER)
+
+
+def array_from_bytes(data, byteorder):
+    """
+    Returns an array of the doubles of data, a bytestring whose byte order
+    is given as in WKB.
+    """
+    result = array.array('d')
+    if six.PY3:
+        result.frombytes(data)
+    else:
+        result.fromstring(data)
+    if byteorder != NATIVE_BYTEORDER:
+        result.byteswap()
+    return result
+
+
+def array_to_bytes(ordinates):
+    "Returns the doubles of an array as a bytestring in the native byte order."
+    return ordinates.tobytes() if six.PY3 else ordinates.tostring()
+
 
 class GEOSCoordSeq(GEOSBase):
     "The internal representation of a list of coordinates inside a Geometry."
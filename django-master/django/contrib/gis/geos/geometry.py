@@ -32,6 +32,7 @@ from django.contrib.gis.geometry.regex import hex_regex, wkt_regex, json_regex
 
 from django.utils import six
 from django.utils.encoding import force_bytes, force_text
+from django.utils.six.moves import xrange
 
 
 class GEOSGeometry(GEOSBase, ListMixin):
@@ -653,6 +654,15 @@ class GEOSGeometry(GEOSBase, ListMixin):
             raise TypeError('distance() works only on other GEOS Geometries.')
         return capi.geos_distance(self.ptr, other.ptr, byref(c_double()))
 
+    def distance_many(self, others):
+        """
+        Returns a list of the distances between this Geometry and each of the
+        others, a sequence of GEOS Geometries or a geometry collection.
+        """
+        distance = capi.geos_distance.bind()
+        ptr = self.ptr
+        return [distance(ptr, other, byref(c_double())) for other in geometry_pointers(others)]
+
     @property
     def extent(self):
         """
@@ -680,6 +690,24 @@ class GEOSGeometry(GEOSBase, ListMixin):
         "Clones this Geometry."
         return GEOSGeometry(capi.geom_clone(self.ptr), srid=self.srid)
 
+
+def geometry_pointers(geoms):
+    """
+    Iterates over the pointers of a sequence of GEOS Geometries, or of the
+    members of a geometry collection without creating a Geometry for each
+    of them.
+    """
+    if isinstance(geoms, GeometryCollection):
+        get_geomn = capi.get_geomn.bind()
+        ptr = geoms.ptr
+        for i in xrange(len(geoms)):
+            yield get_geomn(ptr, i)
+    else:
+        for geom in geoms:
+            if not isinstance(geom, GEOSGeometry):
+                raise TypeError('Expected a sequence of GEOS Geometries.')
+            yield geom.ptr
+
 # Class mapping dictionary.  Has to be at the end to avoid import
 # conflicts with GEOSGeometry.
 from django.contrib.gis.geos.linestring import LineString, LinearRing
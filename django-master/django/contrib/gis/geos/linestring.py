@@ -1,9 +1,14 @@
+import struct
+
 from django.contrib.gis.geos.base import numpy
-from django.contrib.gis.geos.coordseq import GEOSCoordSeq
+from django.contrib.gis.geos.coordseq import (GEOSCoordSeq, NATIVE_BYTEORDER,
+    array_from_bytes, array_to_bytes, ordinates_array)
 from django.contrib.gis.geos.error import GEOSException
 from django.contrib.gis.geos.geometry import GEOSGeometry
 from django.contrib.gis.geos.point import Point
 from django.contrib.gis.geos import prototypes as capi
+from django.contrib.gis.geos.prototypes.io import wkb_r, wkb_w
+from django.utils import six
 from django.utils.six.moves import xrange
 
 
@@ -76,6 +81,42 @@ class LineString(GEOSGeometry):
         #  from the function.
         super(LineString, self).__init__(self._init_func(cs.ptr), srid=srid)
 
+    @classmethod
+    def from_array(cls, ordinates, dim=2, srid=None):
+        """
+        Returns a new geometry of this class from a flat sequence of the
+        ordinates of its points, i.e. x1, y1[, z1], x2, y2[, z2], ... given
+        as an array('d'), a buffer, a NumPy array or a sequence of numbers.
+
+        The geometry is built in a single call to GEOS, rather than one call
+        per coordinate.
+        """
+        if dim not in (2, 3):
+            raise TypeError('Dimension mismatch.')
+        ordinates = ordinates_array(ordinates)
+        if not ordinates:
+            raise TypeError('Cannot initialize on empty sequence.')
+        if len(ordinates) % dim:
+            raise TypeError('Dimension mismatch.')
+        # WKB has no type for LinearRings, the coordinate sequence of the
+        # LineString read from WKB is used to create the geometry.
+        wkb_type = 2 | (0x80000000 if dim == 3 else 0)
+        wkb = struct.pack(str('=BII'), NATIVE_BYTEORDER, wkb_type, len(ordinates) // dim)
+        line = wkb_r().read(six.memoryview(wkb + array_to_bytes(ordinates)))
+        cs = capi.cs_clone(capi.get_cs(line))
+        capi.destroy_geom(line)
+        return GEOSGeometry(cls._init_func(cs), srid=srid)
+
+    def to_array(self):
+        """
+        Returns the ordinates of the points of this LineString as a flat
+        array('d'), i.e. x1, y1[, z1], x2, y2[, z2], ...
+        """
+        dim = 3 if self.hasz else 2
+        wkb = bytes(wkb_w(dim).write(self))
+        # Skipping the byte order, the geometry type and the number of points.
+        return array_from_bytes(wkb[9:], six.indexbytes(wkb, 0))
+
     def __iter__(self):
         "Allows iteration over this LineString."
         for i in xrange(len(self)):
@@ -1,6 +1,6 @@
 from .base import GEOSBase
 from .error import GEOSException
-from .geometry import GEOSGeometry
+from .geometry import GEOSGeometry, geometry_pointers
 from .libgeos import geos_version_info
 from .prototypes import prepared as capi
 
@@ -38,6 +38,26 @@ class PreparedGeometry(GEOSBase):
     def intersects(self, other):
         return capi.prepared_intersects(self.ptr, other.ptr)
 
+    # Batch versions of the predicates, each returning a list of booleans for
+    # a sequence of geometries or the members of a geometry collection.
+
+    def _evaluate_many(self, func, others):
+        func = func.bind()
+        ptr = self.ptr
+        return [func(ptr, other) for other in geometry_pointers(others)]
+
+    def contains_many(self, others):
+        return self._evaluate_many(capi.prepared_contains, others)
+
+    def contains_properly_many(self, others):
+        return self._evaluate_many(capi.prepared_contains_properly, others)
+
+    def covers_many(self, others):
+        return self._evaluate_many(capi.prepared_covers, others)
+
+    def intersects_many(self, others):
+        return self._evaluate_many(capi.prepared_intersects, others)
+
     # Added in GEOS 3.3:
 
     def crosses(self, other):
@@ -1,4 +1,6 @@
+from functools import partial
 import threading
+
 from django.contrib.gis.geos.libgeos import lgeos, notice_h, error_h, CONTEXT_PTR
 
 
@@ -54,6 +56,20 @@ class GEOSFunc(object):
         else:
             return self.cfunc(*args)
 
+    def bind(self):
+        """
+        Returns the C function, bound to the context handle of the current
+        thread if needed. Calling it avoids the overhead of __call__() when
+        calling the function many times in a row, but it must only be called
+        from the current thread.
+        """
+        if self.threaded:
+            if not self.thread_context.handle:
+                self.thread_context.handle = GEOSContextHandle()
+            return partial(self.cfunc, self.thread_context.handle.ptr)
+        else:
+            return self.cfunc
+
     def __str__(self):
         return self.cfunc.__name__
 
@@ -1,5 +1,6 @@
 from __future__ import unicode_literals
 
+import array
 import ctypes
 import json
 import random
@@ -763,6 +764,14 @@ class GEOSTest(unittest.TestCase, TestDataMixin):
         ls2 = LineString((5, 2), (6, 1), (7, 0))
         self.assertEqual(3, ls1.distance(ls2))
 
+    def test_distance_many(self):
+        "Testing the distance_many() method."
+        pnt = Point(0, 0)
+        others = [Point(0, 0), Point(0, 1), LineString((5, 2), (5, 0))]
+        self.assertEqual([0, 1, 5], pnt.distance_many(others))
+        self.assertEqual([0, 1], pnt.distance_many(MultiPoint(others[:2])))
+        self.assertRaises(TypeError, pnt.distance_many, [(0, 0)])
+
     def test_length(self):
         "Testing the length property."
         # Points have 0 length.
@@ -1028,6 +1037,39 @@ class GEOSTest(unittest.TestCase, TestDataMixin):
         del mpoly
         self.assertTrue(prep.covers(Point(5, 5)))
 
+    def test_prepared_many(self):
+        "Testing the batch predicates of PreparedGeometry."
+        mpoly = GEOSGeometry('MULTIPOLYGON(((0 0,0 5,5 5,5 0,0 0)),((5 5,5 10,10 10,10 5,5 5)))')
+        prep = mpoly.prepared
+        pnts = [Point(5, 5), Point(7.5, 7.5), Point(2.5, 7.5)]
+        for others in (pnts, MultiPoint(pnts)):
+            self.assertEqual([mpoly.contains(pnt) for pnt in pnts], prep.contains_many(others))
+            self.assertEqual([False, True, False], prep.contains_properly_many(others))
+            self.assertEqual([True, True, False], prep.covers_many(others))
+            self.assertEqual([mpoly.intersects(pnt) for pnt in pnts], prep.intersects_many(others))
+        self.assertEqual([], prep.contains_many([]))
+
+    def test_from_array(self):
+        "Testing bulk import and export of coordinates."
+        ordinates = array.array(str('d'), [0, 0, 0, 1, 1, 1, 0, 0])
+        for cls in (LineString, LinearRing, MultiPoint):
+            geom = cls.from_array(ordinates, srid=4326)
+            self.assertIsInstance(geom, cls)
+            self.assertEqual(4326, geom.srid)
+            self.assertEqual(((0, 0), (0, 1), (1, 1), (0, 0)), geom.tuple)
+            self.assertEqual(ordinates, geom.to_array())
+            self.assertEqual(geom, cls.from_array(bytearray(ordinates.tostring())))
+            self.assertEqual(geom, cls.from_array(list(ordinates)))
+            if numpy:
+                self.assertEqual(geom, cls.from_array(numpy.array(geom.tuple)))
+            ordinates3d = [0, 1, 2, 3, 4, 5, 6, 7, 8, 0, 1, 2]
+            geom3d = cls.from_array(ordinates3d, dim=3)
+            self.assertEqual(((0, 1, 2), (3, 4, 5), (6, 7, 8), (0, 1, 2)), geom3d.tuple)
+            self.assertEqual(array.array(str('d'), ordinates3d), geom3d.to_array())
+            self.assertRaises(TypeError, cls.from_array, [])
+            self.assertRaises(TypeError, cls.from_array, [0, 0, 1])
+            self.assertRaises(TypeError, cls.from_array, ordinates, dim=4)
+
     def test_line_merge(self):
         "Testing line merge support"
         ref_geoms = (fromstr('LINESTRING(1 1, 1 1, 3 3)'),
@@ -260,6 +260,43 @@ class LayerMapTest(TestCase):
             lm.save(step=st, strict=True)
             self.county_helper(county_feat=False)
 
+    def test_batch_size(self):
+        "Tests the `batch_size` keyword of .save()."
+        State.objects.bulk_create([
+            State(name='Colorado'), State(name='Hawaii'), State(name='Texas')
+        ])
+
+        # The features of a county in different batches, or in the same
+        # batch, are merged in a single model because of `unique`.
+        for batch_size in (2, 1000):
+            County.objects.all().delete()
+            lm = LayerMapping(County, co_shp, co_mapping, transform=False, unique='name')
+            lm.save(silent=True, strict=True, batch_size=batch_size)
+            self.county_helper(county_feat=False)
+
+        lm = LayerMapping(CountyFeat, co_shp, cofeat_mapping, transform=False)
+        lm.save(silent=True, strict=True, batch_size=3)
+        self.county_helper()
+        # The related states were retrieved once.
+        self.assertEqual(len(lm.fk_cache), 3)
+
+        # Saving again adds the geometries to the existing models.
+        lm = LayerMapping(County, co_shp, co_mapping, transform=False, unique='name')
+        lm.save(silent=True, strict=True, batch_size=1000)
+        for name, n in zip(NAMES, NUMS):
+            self.assertEqual(2 * n, len(County.objects.get(name=name).mpoly))
+
+        # Inherited models are saved one by one.
+        icity_mapping = {'name': 'Name',
+                         'population': 'Population',
+                         'density': 'Density',
+                         'point': 'POINT',
+                         'dt': 'Created',
+                         }
+        lm = LayerMapping(ICity2, city_shp, icity_mapping)
+        lm.save(batch_size=2)
+        self.assertEqual(3, ICity2.objects.count())
+
     def test_model_inheritance(self):
         "Tests LayerMapping on inherited models.  See #12093."
         icity_mapping = {'name': 'Name',
@@ -6,13 +6,17 @@
  For more information, please consult the GeoDjango documentation:
    http://geodjango.org/docs/layermapping.html
 """
+from collections import OrderedDict
+import operator
 import sys
 from decimal import Decimal, InvalidOperation as DecimalInvalidOperation
+from functools import reduce
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import connections, router
 from django.contrib.gis.db.models import GeometryField
 from django.contrib.gis.gdal import (CoordTransform, DataSource,
     OGRException, OGRGeometry, OGRGeomType, SpatialReference)
+from django.contrib.gis.geos import GEOSGeometry
 from django.contrib.gis.gdal.field import (
     OFTDate, OFTDateTime, OFTInteger, OFTReal, OFTString, OFTTime)
 from django.db import models, transaction
@@ -93,6 +97,9 @@ class LayerMapping(object):
         self.using = using if using is not None else router.db_for_write(model)
         self.spatial_backend = connections[self.using].ops
 
+        # Related models retrieved by `verify_fk`, by model and lookup.
+        self.fk_cache = {}
+
         # Setting the mapping & model attributes.
         self.mapping = mapping
         self.model = model
@@ -292,6 +299,16 @@ class LayerMapping(object):
         Given an OGR Feature, this will return a dictionary of keyword arguments
         for constructing the mapped model.
         """
+        kwargs = self.feature_values(feat)
+        if self.geom_field:
+            kwargs[self.geom_field] = kwargs[self.geom_field].wkt
+        return kwargs
+
+    def feature_values(self, feat):
+        """
+        Like `feature_kwargs`, but the geometry is returned as an OGRGeometry
+        rather than as WKT.
+        """
         # The keyword arguments for model construction.
         kwargs = {}
 
@@ -303,7 +320,7 @@ class LayerMapping(object):
             if isinstance(model_field, GeometryField):
                 # Verify OGR geometry.
                 try:
-                    val = self.verify_geom(feat.geom, model_field)
+                    val = self.verify_ogr_geom(feat.geom, model_field)
                 except OGRException:
                     raise LayerMapError('Could not retrieve geometry from feature.')
             elif isinstance(model_field, models.base.ModelBase):
@@ -396,23 +413,23 @@ class LayerMapping(object):
         this routine will retrieve the related model for the ForeignKey
         mapping.
         """
-        # TODO: It is expensive to retrieve a model for every record --
-        #  explore if an efficient mechanism exists for caching related
-        #  ForeignKey models.
-
         # Constructing and verifying the related model keyword arguments.
         fk_kwargs = {}
         for field_name, ogr_name in rel_mapping.items():
             fk_kwargs[field_name] = self.verify_ogr_field(feat[ogr_name], rel_model._meta.get_field(field_name))
 
-        # Attempting to retrieve and return the related model.
-        try:
-            return rel_model.objects.using(self.using).get(**fk_kwargs)
-        except ObjectDoesNotExist:
-            raise MissingForeignKey(
-                'No ForeignKey %s model found with keyword arguments: %s' %
-                (rel_model.__name__, fk_kwargs)
-            )
+        # Attempting to retrieve and return the related model, which is
+        # cached since many features usually refer to the same one.
+        cache_key = (rel_model, tuple(sorted(fk_kwargs.items())))
+        if cache_key not in self.fk_cache:
+            try:
+                self.fk_cache[cache_key] = rel_model.objects.using(self.using).get(**fk_kwargs)
+            except ObjectDoesNotExist:
+                raise MissingForeignKey(
+                    'No ForeignKey %s model found with keyword arguments: %s' %
+                    (rel_model.__name__, fk_kwargs)
+                )
+        return self.fk_cache[cache_key]
 
     def verify_geom(self, geom, model_field):
         """
@@ -420,6 +437,11 @@ class LayerMapping(object):
         if necessary (for example if the model field is MultiPolygonField while
         the mapped shapefile only contains Polygons).
         """
+        # Returning the WKT of the geometry.
+        return self.verify_ogr_geom(geom, model_field).wkt
+
+    def verify_ogr_geom(self, geom, model_field):
+        "Like `verify_geom`, but returns the OGRGeometry rather than its WKT."
         # Downgrade a 3D geom to a 2D one, if necessary.
         if self.coord_dim != geom.coord_dim:
             geom.coord_dim = self.coord_dim
@@ -437,9 +459,140 @@ class LayerMapping(object):
         # object.
         if self.transform:
             g.transform(self.transform)
+        return g
 
-        # Returning the WKT of the geometry.
-        return g.wkt
+    #### Saving routines ####
+    def save_model(self, m, kwargs, fid, is_update, verbose, silent, stream, strict):
+        """
+        Saves the model constructed for the feature with the given ID and
+        keyword arguments, returning whether it was saved.
+        """
+        try:
+            # Attempting to save.
+            m.save(using=self.using)
+            if verbose:
+                stream.write('%s: %s\n' % ('Updated' if is_update else 'Saved', m))
+            return True
+        except Exception as msg:
+            if strict:
+                # Bailing out if the `strict` keyword is set.
+                if not silent:
+                    stream.write(
+                        'Failed to save the feature (id: %s) into the '
+                        'model with the keyword arguments:\n' % fid
+                    )
+                    stream.write('%s\n' % kwargs)
+                raise
+            elif not silent:
+                stream.write('Failed to save %s:\n %s\nContinuing\n' % (kwargs, msg))
+            return False
+
+    def unique_key(self, values):
+        """
+        Returns a hashable key for the unique values of a feature or a model,
+        given by `unique_kwargs` or a model's attributes.
+        """
+        key = []
+        for name, value in sorted(values.items()):
+            if isinstance(value, (OGRGeometry, GEOSGeometry)):
+                value = bytes(value.wkb)
+            elif isinstance(value, models.Model):
+                value = value.pk
+            key.append(value)
+        return tuple(key)
+
+    def save_batch(self, batch, verbose, silent, stream, strict):
+        """
+        Saves the models constructed for a batch of (feature ID, keyword
+        arguments) pairs, where the geometries are OGRGeometry objects, and
+        returns the number of models saved.
+
+        When the `unique` keyword was given, the features sharing the same
+        unique values are merged in a single model, and the existing models
+        are retrieved with a single query, then updated one by one. The new
+        models are inserted with `bulk_create`.
+        """
+        manager = self.model.objects.using(self.using)
+        # Entries of [feature IDs, keyword arguments, model or None, geometry].
+        entries = OrderedDict()
+        if self.unique:
+            u_kwargs = OrderedDict()
+            for fid, kwargs in batch:
+                values = self.unique_kwargs(kwargs)
+                u_kwargs.setdefault(self.unique_key(values), values)
+
+            existing = {}
+            if isinstance(self.unique, six.string_types):
+                unique_fields = [self.unique]
+            else:
+                unique_fields = list(self.unique)
+            if self.geom_field in unique_fields:
+                # The geometries of the retrieved models can't be reliably
+                # matched with those of the features, retrieving the models
+                # one by one.
+                for key, values in u_kwargs.items():
+                    values = dict(values, **{self.geom_field: GEOSGeometry(values[self.geom_field].wkb)})
+                    try:
+                        existing[key] = manager.get(**values)
+                    except ObjectDoesNotExist:
+                        pass
+            else:
+                query = reduce(operator.or_, (models.Q(**values) for values in u_kwargs.values()))
+                for m in manager.filter(query):
+                    values = dict((name, getattr(m, self.model._meta.get_field(name).attname))
+                                  for name in unique_fields)
+                    existing[self.unique_key(values)] = m
+        else:
+            existing = {}
+
+        for fid, kwargs in batch:
+            key = self.unique_key(self.unique_kwargs(kwargs)) if self.unique else fid
+            if key in entries:
+                # Adding the geometries of the feature to the merged model.
+                entries[key][0].append(fid)
+                for g in kwargs[self.geom_field]:
+                    entries[key][3].add(g)
+            elif key in existing:
+                m = existing[key]
+                geom = getattr(m, self.geom_field).ogr
+                for g in kwargs[self.geom_field]:
+                    geom.add(g)
+                entries[key] = [[fid], kwargs, m, geom]
+            else:
+                entries[key] = [[fid], kwargs, None, kwargs.get(self.geom_field)]
+
+        num_saved = 0
+        new_models = []
+        for fids, kwargs, m, geom in entries.values():
+            if geom is not None:
+                geom = GEOSGeometry(geom.wkb)
+            if m is None:
+                kwargs = dict(kwargs)
+                if geom is not None:
+                    kwargs[self.geom_field] = geom
+                new_models.append((fids[0], kwargs, self.model(**kwargs)))
+            else:
+                setattr(m, self.geom_field, geom)
+                if self.save_model(m, kwargs, fids[0], True, verbose, silent, stream, strict):
+                    num_saved += 1
+
+        if new_models and not self.model._meta.parents:
+            try:
+                with transaction.atomic(using=self.using):
+                    manager.bulk_create([m for fid, kwargs, m in new_models])
+            except Exception:
+                # Saving the models one by one below to report the failures.
+                pass
+            else:
+                if verbose:
+                    for fid, kwargs, m in new_models:
+                        stream.write('Saved: %s\n' % m)
+                return num_saved + len(new_models)
+        # Inherited models can't be inserted with `bulk_create`.
+        for fid, kwargs, m in new_models:
+            if self.save_model(m, kwargs, fid, False, verbose, silent, stream, strict):
+                num_saved += 1
+        return num_saved
 
     #### Other model methods ####
     def coord_transform(self):
@@ -472,7 +625,8 @@ class LayerMapping(object):
                 model_field.__class__.__name__ == 'Multi%s' % geom_type.django)
 
     def save(self, verbose=False, fid_range=False, step=False,
-             progress=False, silent=False, stream=sys.stdout, strict=False):
+             progress=False, silent=False, stream=sys.stdout, strict=False,
+             batch_size=None):
         """
         Saves the contents from the OGR DataSource Layer into the database
         according to the mapping dictionary given at initialization.
@@ -511,6 +665,12 @@ class LayerMapping(object):
          strict:
            Execution of the model mapping will cease upon the first error
            encountered.  The default behavior is to attempt to continue.
+
+         batch_size:
+           If set with an integer, the features are saved by batches of this
+           size: the new models of a batch are inserted with `bulk_create`
+           and, when the `unique` keyword was given, the existing models are
+           retrieved with a single query per batch.
         """
         # Getting the default Feature ID range.
         default_range = self.check_fid_range(fid_range)
@@ -522,17 +682,24 @@ class LayerMapping(object):
             else:
                 progress_interval = progress
 
+        # Related models may have changed since the last save.
+        self.fk_cache = {}
+
         def _save(feat_range=default_range, num_feat=0, num_saved=0):
             if feat_range:
                 layer_iter = self.layer[feat_range]
             else:
                 layer_iter = self.layer
 
+            batch = []
             for feat in layer_iter:
                 num_feat += 1
                 # Getting the keyword arguments
                 try:
-                    kwargs = self.feature_kwargs(feat)
+                    if batch_size:
+                        kwargs = self.feature_values(feat)
+                    else:
+                        kwargs = self.feature_kwargs(feat)
                 except LayerMapError as msg:
                     # Something borked the validation
                     if strict:
@@ -540,56 +707,49 @@ class LayerMapping(object):
                     elif not silent:
                         stream.write('Ignoring Feature ID %s because: %s\n' % (feat.fid, msg))
                 else:
-                    # Constructing the model using the keyword args
-                    is_update = False
-                    if self.unique:
-                        # If we want unique models on a particular field, handle the
-                        # geometry appropriately.
-                        try:
-                            # Getting the keyword arguments and retrieving
-                            # the unique model.
-                            u_kwargs = self.unique_kwargs(kwargs)
-                            m = self.model.objects.using(self.using).get(**u_kwargs)
-                            is_update = True
-
-                            # Getting the geometry (in OGR form), creating
-                            # one from the kwargs WKT, adding in additional
-                            # geometries, and update the attribute with the
-                            # just-updated geometry WKT.
-                            geom = getattr(m, self.geom_field).ogr
-                            new = OGRGeometry(kwargs[self.geom_field])
-                            for g in new:
-                                geom.add(g)
-                            setattr(m, self.geom_field, geom.wkt)
-                        except ObjectDoesNotExist:
-                            # No unique model exists yet, create.
-                            m = self.model(**kwargs)
+                    if batch_size:
+                        batch.append((feat.fid, kwargs))
+                        if len(batch) >= batch_size:
+                            num_saved += self.save_batch(batch, verbose, silent, stream, strict)
+                            batch = []
                     else:
-                        m = self.model(**kwargs)
+                        # Constructing the model using the keyword args
+                        is_update = False
+                        if self.unique:
+                            # If we want unique models on a particular field, handle the
+                            # geometry appropriately.
+                            try:
+                                # Getting the keyword arguments and retrieving
+                                # the unique model.
+                                u_kwargs = self.unique_kwargs(kwargs)
+                                m = self.model.objects.using(self.using).get(**u_kwargs)
+                                is_update = True
+
+                                # Getting the geometry (in OGR form), creating
+                                # one from the kwargs WKT, adding in additional
+                                # geometries, and update the attribute with the
+                                # just-updated geometry WKT.
+                                geom = getattr(m, self.geom_field).ogr
+                                new = OGRGeometry(kwargs[self.geom_field])
+                                for g in new:
+                                    geom.add(g)
+                                setattr(m, self.geom_field, geom.wkt)
+                            except ObjectDoesNotExist:
+                                # No unique model exists yet, create.
+                                m = self.model(**kwargs)
+                        else:
+                            m = self.model(**kwargs)
 
-                    try:
-                        # Attempting to save.
-                        m.save(using=self.using)
-                        num_saved += 1
-                        if verbose:
-                            stream.write('%s: %s\n' % ('Updated' if is_update else 'Saved', m))
-                    except Exception as msg:
-                        if strict:
-                            # Bailing out if the `strict` keyword is set.
-                            if not silent:
-                                stream.write(
-                                    'Failed to save the feature (id: %s) into the '
-                                    'model with the keyword arguments:\n' % feat.fid
-                                )
-                                stream.write('%s\n' % kwargs)
-                            raise
-                        elif not silent:
-                            stream.write('Failed to save %s:\n %s\nContinuing\n' % (kwargs, msg))
+                        if self.save_model(m, kwargs, feat.fid, is_update, verbose, silent, stream, strict):
+                            num_saved += 1
 
                 # Printing progress information, if requested.
                 if progress and num_feat % progress_interval == 0:
                     stream.write('Processed %d features, saved %d ...\n' % (num_feat, num_saved))
 
+            if batch:
+                num_saved += self.save_batch(batch, verbose, silent, stream, strict)
+
             # Only used for status output purposes -- incremental saving uses the
             # values returned here.
             return num_saved, num_feat
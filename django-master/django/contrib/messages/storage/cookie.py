@@ -1,9 +1,12 @@
 import json
+import zlib
 
 from django.conf import settings
 from django.contrib.messages.storage.base import BaseStorage, Message
+from django.core.signing import b64_decode, b64_encode
 from django.http import SimpleCookie
 from django.utils.crypto import salted_hmac, constant_time_compare
+from django.utils.encoding import force_bytes, force_text
 from django.utils.safestring import SafeData, mark_safe
 from django.utils import six
 
@@ -50,6 +53,26 @@ class MessageDecoder(json.JSONDecoder):
         return self.process_messages(decoded)
 
 
+def compress_data(data):
+    """
+    Returns a compact version of serialized messages: the data compressed
+    with zlib and base64-encoded, prefixed by a dot. Returns the data itself
+    if compressing doesn't make it shorter.
+    """
+    compressed = '.' + force_text(b64_encode(zlib.compress(force_bytes(data))))
+    return compressed if len(compressed) < len(data) else data
+
+
+def decompress_data(data):
+    """
+    Reverses compress_data(). Data that was left uncompressed, which
+    includes JSON data, is returned as is.
+    """
+    if data.startswith('.'):
+        return force_text(zlib.decompress(b64_decode(force_bytes(data[1:]))))
+    return data
+
+
 class CookieStorage(BaseStorage):
     """
     Stores messages in a cookie.
@@ -60,6 +83,9 @@ class CookieStorage(BaseStorage):
     # restrict the session cookie to 1/2 of 4kb. See #18781.
     max_cookie_size = 2048
     not_finished = '__messagesnotfinished__'
+    # Compressing the messages makes the cookie smaller, unless they are few
+    # and short, at the expense of CPU time.
+    compress = False
 
     def _get(self, *args, **kwargs):
         """
@@ -109,13 +135,39 @@ class CookieStorage(BaseStorage):
             def stored_length(val):
                 return len(cookie.value_encode(val)[1])
 
-            while encoded_data and stored_length(encoded_data) > self.max_cookie_size:
+            if encoded_data and stored_length(encoded_data) > self.max_cookie_size:
+                # Serialize each message once, then find how many messages
+                # fit with a binary search on the length of the data.
+                encoder = MessageEncoder(separators=(',', ':'))
+                serialized = [encoder.encode(message) for message in messages]
+                not_finished = encoder.encode(self.not_finished)
+
+                def encode_kept(count):
+                    if remove_oldest:
+                        kept = serialized[len(serialized) - count:]
+                    else:
+                        kept = serialized[:count]
+                    return self._encode_serialized('[%s]' % ','.join(kept + [not_finished]))
+
+                low, high = 0, len(messages) - 1
+                while low < high:
+                    middle = (low + high + 1) // 2
+                    if stored_length(encode_kept(middle)) <= self.max_cookie_size:
+                        low = middle
+                    else:
+                        high = middle - 1
+                # The length of compressed data doesn't always grow with the
+                # number of messages.
+                while low and stored_length(encode_kept(low)) > self.max_cookie_size:
+                    low -= 1
+                unstored_count = len(messages) - low
                 if remove_oldest:
-                    unstored_messages.append(messages.pop(0))
+                    unstored_messages = messages[:unstored_count]
+                    del messages[:unstored_count]
                 else:
-                    unstored_messages.insert(0, messages.pop())
-                encoded_data = self._encode(messages + [self.not_finished],
-                                            encode_empty=unstored_messages)
+                    unstored_messages = messages[low:]
+                    del messages[low:]
+                encoded_data = encode_kept(low)
         self._update_cookie(encoded_data, response)
         return unstored_messages
 
@@ -137,8 +189,16 @@ class CookieStorage(BaseStorage):
         """
         if messages or encode_empty:
             encoder = MessageEncoder(separators=(',', ':'))
-            value = encoder.encode(messages)
-            return '%s$%s' % (self._hash(value), value)
+            return self._encode_serialized(encoder.encode(messages))
+
+    def _encode_serialized(self, value):
+        """
+        Returns the stored version of a JSON-serialized list of messages,
+        compressed if ``compress`` is True and signed with a hash.
+        """
+        if self.compress:
+            value = compress_data(value)
+        return '%s$%s' % (self._hash(value), value)
 
     def _decode(self, data):
         """
@@ -156,8 +216,8 @@ class CookieStorage(BaseStorage):
                 try:
                     # If we get here (and the JSON decode works), everything is
                     # good. In any other case, drop back and return None.
-                    return json.loads(value, cls=MessageDecoder)
-                except ValueError:
+                    return json.loads(decompress_data(value), cls=MessageDecoder)
+                except (ValueError, zlib.error):
                     pass
         # Mark the data as used (so it gets removed) since something was wrong
         # with the data.
@@ -1,7 +1,9 @@
 import json
 
 from django.contrib.messages.storage.base import BaseStorage
-from django.contrib.messages.storage.cookie import MessageEncoder, MessageDecoder
+from django.contrib.messages.storage.cookie import (
+    MessageEncoder, MessageDecoder, compress_data, decompress_data,
+)
 from django.utils import six
 
 
@@ -10,6 +12,9 @@ class SessionStorage(BaseStorage):
     Stores messages in the session (that is, django.contrib.sessions).
     """
     session_key = '_messages'
+    # Compressing the messages makes the session data smaller, at the expense
+    # of CPU time.
+    compress = False
 
     def __init__(self, request, *args, **kwargs):
         assert hasattr(request, 'session'), "The session-based temporary "\
@@ -31,16 +36,22 @@ class SessionStorage(BaseStorage):
         Stores a list of messages to the request's session.
         """
         if messages:
-            self.request.session[self.session_key] = self.serialize_messages(messages)
+            data = self.serialize_messages(messages)
+            # Avoid saving the session if the messages didn't change.
+            if self.request.session.get(self.session_key) != data:
+                self.request.session[self.session_key] = data
         else:
             self.request.session.pop(self.session_key, None)
         return []
 
     def serialize_messages(self, messages):
         encoder = MessageEncoder(separators=(',', ':'))
-        return encoder.encode(messages)
+        data = encoder.encode(messages)
+        if self.compress:
+            data = compress_data(data)
+        return data
 
     def deserialize_messages(self, data):
         if data and isinstance(data, six.string_types):
-            return json.loads(data, cls=MessageDecoder)
+            return json.loads(decompress_data(data), cls=MessageDecoder)
         return data
@@ -3,8 +3,9 @@ import json
 from django.contrib.messages import constants
 from django.contrib.messages.tests.base import BaseTests
 from django.contrib.messages.storage.cookie import (CookieStorage,
-    MessageEncoder, MessageDecoder)
+    MessageEncoder, MessageDecoder, compress_data, decompress_data)
 from django.contrib.messages.storage.base import Message
+from django.http import SimpleCookie
 from django.test import TestCase, override_settings
 from django.utils.safestring import SafeData, mark_safe
 
@@ -116,6 +117,75 @@ class CookieTest(BaseTests, TestCase):
         self.assertEqual(len(unstored_messages), 1)
         self.assertTrue(unstored_messages[0].message == '0' * msg_size)
 
+    def test_max_cookie_length_many_messages(self):
+        """
+        Tests that, when a lot of messages don't fit in the cookie, as many of
+        the newest messages as possible are stored and the older ones are
+        returned in their original order.
+        """
+        storage = self.get_storage()
+        response = self.get_response()
+        for i in range(500):
+            storage.add(constants.INFO, 'message %s' % i)
+        unstored_messages = storage.update(response)
+
+        cookie_storing = self.stored_messages_count(storage, response)
+        self.assertEqual(cookie_storing + len(unstored_messages), 500)
+        self.assertEqual([m.message for m in unstored_messages],
+                         ['message %s' % i for i in range(len(unstored_messages))])
+        data = storage._decode(response.cookies['messages'].value)
+        self.assertEqual(data[-1], CookieStorage.not_finished)
+        self.assertEqual(data[-2].message, 'message 499')
+        # Storing one more message wouldn't have fit.
+        encoded_data = storage._encode(unstored_messages[-1:] + data)
+        self.assertGreater(len(SimpleCookie().value_encode(encoded_data)[1]),
+                           CookieStorage.max_cookie_size)
+
+    def test_max_cookie_length_keep_oldest(self):
+        """
+        Tests that, with remove_oldest=False, the newest messages are removed
+        and returned.
+        """
+        storage = self.get_storage()
+        response = self.get_response()
+        messages = [Message(constants.INFO, 'message %s' % i) for i in range(500)]
+        unstored_messages = storage._store(messages, response, remove_oldest=False)
+        self.assertEqual(messages + unstored_messages,
+                         [Message(constants.INFO, 'message %s' % i) for i in range(500)])
+        data = storage._decode(response.cookies['messages'].value)
+        self.assertEqual(data, messages + [CookieStorage.not_finished])
+
+    def test_compress(self):
+        """
+        Tests that messages are compressed when ``compress`` is True, which
+        allows storing more messages in the cookie.
+        """
+        storage = self.get_storage()
+        storage.compress = True
+        response = self.get_response()
+        for i in range(100):
+            storage.add(constants.INFO, 'A repetitive message %s' % i)
+        unstored_messages = storage.update(response)
+        self.assertEqual(unstored_messages, [])
+        self.assertEqual(self.stored_messages_count(storage, response), 100)
+        value = response.cookies['messages'].value
+        self.assertTrue(value.split('$', 1)[1].startswith('.'))
+
+        # Compressed messages are read whatever the setting.
+        storage = self.storage_class(self.get_request())
+        storage.request.COOKIES = {CookieStorage.cookie_name: value}
+        self.assertEqual(len(list(storage)), 100)
+
+    def test_compress_data(self):
+        data = '["%s"]' % ('x' * 100)
+        compressed = compress_data(data)
+        self.assertTrue(compressed.startswith('.'))
+        self.assertLess(len(compressed), len(data))
+        self.assertEqual(decompress_data(compressed), data)
+        # Short data isn't compressed.
+        self.assertEqual(compress_data('[]'), '[]')
+        self.assertEqual(decompress_data('[]'), '[]')
+
     def test_json_encoder_decoder(self):
         """
         Tests that a complex nested data structure containing Message
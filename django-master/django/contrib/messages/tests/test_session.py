@@ -51,3 +51,13 @@ class SessionTest(BaseTests, TestCase):
         message = Message(constants.DEBUG, mark_safe("<b>Hello Django!</b>"))
         set_session_data(storage, [message])
         self.assertIsInstance(list(storage)[0].message, SafeData)
+
+    def test_compress(self):
+        storage = self.get_storage()
+        storage.compress = True
+        messages = [Message(constants.INFO, 'A repetitive message %s' % i) for i in range(20)]
+        storage._store(messages, self.get_response())
+        self.assertTrue(self.session[storage.session_key].startswith('.'))
+        # Compressed messages are read whatever the setting.
+        storage = self.storage_class(storage.request)
+        self.assertEqual(list(storage), messages)
@@ -1,8 +1,13 @@
+from __future__ import unicode_literals
+
 from django.apps import apps as django_apps
 from django.conf import settings
 from django.core import urlresolvers, paginator
 from django.core.exceptions import ImproperlyConfigured
-from django.utils import translation
+from django.db.models.query import QuerySet
+from django.utils import dateformat, translation
+from django.utils.html import escape
+from django.utils.timezone import template_localtime
 from django.utils.six.moves.urllib.parse import urlencode
 from django.utils.six.moves.urllib.request import urlopen
 
@@ -72,14 +77,14 @@ class Sitemap(object):
         return paginator.Paginator(self.items(), self.limit)
     paginator = property(_get_paginator)
 
-    def get_urls(self, page=1, site=None, protocol=None):
-        # Determine protocol
+    def _get_protocol(self, protocol=None):
         if self.protocol is not None:
             protocol = self.protocol
         if protocol is None:
             protocol = 'http'
+        return protocol
 
-        # Determine domain
+    def _get_domain(self, site=None):
         if site is None:
             if django_apps.is_installed('django.contrib.sites'):
                 Site = django_apps.get_model('sites.Site')
@@ -92,44 +97,123 @@ class Sitemap(object):
                     "To use sitemaps, either enable the sites framework or pass "
                     "a Site/RequestSite object in your view."
                 )
-        domain = site.domain
+        return site.domain
 
+    def get_urls(self, page=1, site=None, protocol=None):
+        return list(self.iter_urls(page, site, protocol))
+
+    def iter_urls(self, page=1, site=None, protocol=None):
+        """
+        Returns an iterator over the URLs of the items of the given page.
+
+        The page is fetched before this method returns, with a single count of
+        the items, so that an EmptyPage or PageNotAnInteger exception is
+        raised here rather than while iterating.
+        """
+        protocol = self._get_protocol(protocol)
+        domain = self._get_domain(site)
+        items = self.paginator.page(page).object_list
         if getattr(self, 'i18n', False):
-            urls = []
-            current_lang_code = translation.get_language()
-            for lang_code, lang_name in settings.LANGUAGES:
-                translation.activate(lang_code)
-                urls += self._urls(page, protocol, domain)
-            translation.activate(current_lang_code)
+            # The items are listed for each language.
+            items = list(items)
+        elif isinstance(items, QuerySet):
+            items = items.iterator()
+        return self._iter_urls(items, protocol, domain)
+
+    def iter_pages(self):
+        """
+        Yields the list of items of each page, the first one even if empty.
+
+        When items() returns a QuerySet, the items are ordered by primary key
+        and each page is fetched after the last primary key of the previous
+        one, rather than with an offset, and without counting them.
+        """
+        items = self.items()
+        if isinstance(items, QuerySet):
+            items = items.order_by('pk')
+            page = list(items[:self.limit])
+            yield page
+            while len(page) == self.limit:
+                page = list(items.filter(pk__gt=page[-1].pk)[:self.limit])
+                if not page:
+                    break
+                yield page
         else:
-            urls = self._urls(page, protocol, domain)
-
-        return urls
-
-    def _urls(self, page, protocol, domain):
-        urls = []
+            page, first = [], True
+            for item in items:
+                page.append(item)
+                if len(page) == self.limit:
+                    yield page
+                    page, first = [], False
+            if page or first:
+                yield page
+
+    def _iter_urls(self, items, protocol, domain):
         latest_lastmod = None
         all_items_lastmod = True  # track if all items have a lastmod
-        for item in self.paginator.page(page).object_list:
-            loc = "%s://%s%s" % (protocol, domain, self.__get('location', item))
-            priority = self.__get('priority', item, None)
-            lastmod = self.__get('lastmod', item, None)
-            if all_items_lastmod:
-                all_items_lastmod = lastmod is not None
-                if (all_items_lastmod and
-                        (latest_lastmod is None or lastmod > latest_lastmod)):
-                    latest_lastmod = lastmod
-            url_info = {
-                'item': item,
-                'location': loc,
-                'lastmod': lastmod,
-                'changefreq': self.__get('changefreq', item, None),
-                'priority': str(priority if priority is not None else ''),
-            }
-            urls.append(url_info)
+        if getattr(self, 'i18n', False):
+            lang_codes = [lang_code for lang_code, lang_name in settings.LANGUAGES]
+        else:
+            lang_codes = [None]
+        for lang_code in lang_codes:
+            for item in items:
+                if lang_code is None:
+                    url_info = self._url_info(item, protocol, domain)
+                else:
+                    with translation.override(lang_code):
+                        url_info = self._url_info(item, protocol, domain)
+                lastmod = url_info['lastmod']
+                if all_items_lastmod:
+                    all_items_lastmod = lastmod is not None
+                    if (all_items_lastmod and
+                            (latest_lastmod is None or lastmod > latest_lastmod)):
+                        latest_lastmod = lastmod
+                yield url_info
         if all_items_lastmod and latest_lastmod:
             self.latest_lastmod = latest_lastmod
-        return urls
+
+    def _url_info(self, item, protocol, domain):
+        priority = self.__get('priority', item, None)
+        return {
+            'item': item,
+            'location': "%s://%s%s" % (protocol, domain, self.__get('location', item)),
+            'lastmod': self.__get('lastmod', item, None),
+            'changefreq': self.__get('changefreq', item, None),
+            'priority': str(priority if priority is not None else ''),
+        }
+
+
+def urlset_xml(urls):
+    """
+    Yields the XML document of a sitemap listing the given URLs, as returned
+    by Sitemap.get_urls(), by chunks.
+    """
+    yield ('<?xml version="1.0" encoding="UTF-8"?>\n'
+           '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n')
+    for url in urls:
+        parts = ['<url><loc>', escape(url['location']), '</loc>']
+        if url['lastmod']:
+            lastmod = dateformat.format(template_localtime(url['lastmod']), 'Y-m-d')
+            parts.extend(['<lastmod>', lastmod, '</lastmod>'])
+        if url['changefreq']:
+            parts.extend(['<changefreq>', escape(url['changefreq']), '</changefreq>'])
+        if url['priority']:
+            parts.extend(['<priority>', escape(url['priority']), '</priority>'])
+        parts.append('</url>\n')
+        yield ''.join(parts)
+    yield '</urlset>\n'
+
+
+def sitemapindex_xml(locations):
+    """
+    Yields the XML document of a sitemap index listing the given sitemap
+    locations by chunks.
+    """
+    yield ('<?xml version="1.0" encoding="UTF-8"?>\n'
+           '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n')
+    for location in locations:
+        yield '<sitemap><loc>%s</loc></sitemap>\n' % escape(location)
+    yield '</sitemapindex>\n'
 
 
 class FlatPageSitemap(Sitemap):
@@ -0,0 +1,70 @@
+import io
+import os
+
+from django.contrib.sitemaps import Sitemap, sitemapindex_xml, urlset_xml
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.module_loading import import_string
+
+
+class Command(BaseCommand):
+    help = ("Writes each page of the given sitemaps, and their index, to a "
+            "static file.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('sitemaps',
+            help="Dotted path to a dictionary of sitemaps, as passed to the "
+                 "sitemap views.")
+        parser.add_argument('directory',
+            help="Directory in which the files are written.")
+        parser.add_argument('--url', default='/', dest='url',
+            help="URL at which the files are served, absolute or relative to "
+                 "the domain. Defaults to '/'.")
+        parser.add_argument('--domain', default=None, dest='domain',
+            help="Domain of the URLs. Defaults to the domain of the current "
+                 "site.")
+        parser.add_argument('--protocol', default='http', dest='protocol',
+            help="Protocol of the URLs, unless set by a sitemap. Defaults to "
+                 "'http'.")
+
+    def handle(self, **options):
+        try:
+            sitemaps = import_string(options['sitemaps'])
+        except ImportError as e:
+            raise CommandError("Couldn't import the sitemaps: %s" % e)
+        directory = options['directory']
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        domain = options['domain'] or Sitemap()._get_domain()
+        url = options['url']
+        if not url.endswith('/'):
+            url += '/'
+        if '://' not in url:
+            url = '%s://%s%s' % (options['protocol'], domain, url)
+
+        locations = []
+        for section, site in sitemaps.items():
+            if callable(site):
+                site = site()
+            protocol = site._get_protocol(options['protocol'])
+            for number, items in enumerate(site.iter_pages(), 1):
+                filename = 'sitemap-%s-%s.xml' % (section, number)
+                self.write(os.path.join(directory, filename),
+                           urlset_xml(site._iter_urls(items, protocol, domain)))
+                locations.append(url + filename)
+        self.write(os.path.join(directory, 'sitemap.xml'),
+                   sitemapindex_xml(locations))
+        if options['verbosity'] >= 1:
+            self.stdout.write("Wrote %d sitemaps and their index to '%s'." %
+                              (len(locations), directory))
+
+    def write(self, path, chunks):
+        # The file is renamed once written, so that it's never served partly.
+        with io.open(path + '.tmp', 'w', encoding='utf-8') as f:
+            for chunk in chunks:
+                f.write(chunk)
+        try:
+            os.rename(path + '.tmp', path)
+        except OSError:
+            # Windows doesn't replace existing files.
+            os.remove(path)
+            os.rename(path + '.tmp', path)
@@ -223,3 +223,46 @@ class HTTPSitemapTests(SitemapTestsBase):
 </urlset>
 """.format(self.base_url, self.i18n_model.pk)
         self.assertXMLEqual(response.content.decode('utf-8'), expected_content)
+
+    @override_settings(LANGUAGES=(('en', 'English'), ('pt', 'Portuguese')))
+    def test_i18nsitemap_queries(self):
+        "The items of an i18n sitemap are counted and fetched once"
+        with self.assertNumQueries(2):
+            self.client.get('/simple/i18n.xml')
+
+    def test_streaming_sitemap_index(self):
+        "A sitemap index is streamed without a template"
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", category=RemovedInDjango20Warning)
+            # See test_simple_sitemap_index().
+            response = self.client.get('/streaming/index.xml')
+        self.assertTrue(response.streaming)
+        expected_content = """<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+<sitemap><loc>%s/simple/sitemap-simple.xml</loc></sitemap>
+</sitemapindex>
+""" % self.base_url
+        self.assertXMLEqual(b''.join(response.streaming_content).decode('utf-8'), expected_content)
+
+    def test_streaming_sitemap(self):
+        "A sitemap is streamed without a template"
+        response = self.client.get('/streaming/sitemap.xml')
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['X-Robots-Tag'], 'noindex, noodp, noarchive')
+        expected_content = """<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+<url><loc>%s/location/</loc><lastmod>%s</lastmod><changefreq>never</changefreq><priority>0.5</priority></url>
+</urlset>
+""" % (self.base_url, date.today())
+        self.assertXMLEqual(b''.join(response.streaming_content).decode('utf-8'), expected_content)
+
+    @override_settings(LANGUAGES=(('en', 'English'), ('pt', 'Portuguese')))
+    def test_streaming_i18nsitemap(self):
+        "An i18n sitemap is streamed without a template"
+        response = self.client.get('/streaming/i18n.xml')
+        expected_content = """<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+<url><loc>{0}/en/i18n/testmodel/{1}/</loc><changefreq>never</changefreq><priority>0.5</priority></url><url><loc>{0}/pt/i18n/testmodel/{1}/</loc><changefreq>never</changefreq><priority>0.5</priority></url>
+</urlset>
+""".format(self.base_url, self.i18n_model.pk)
+        self.assertXMLEqual(b''.join(response.streaming_content).decode('utf-8'), expected_content)
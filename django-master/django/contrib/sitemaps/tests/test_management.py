@@ -0,0 +1,72 @@
+from __future__ import unicode_literals
+
+import os
+import shutil
+import tempfile
+
+from django.contrib.sitemaps import GenericSitemap
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils.six import StringIO
+
+from .base import TestModel, SitemapTestsBase
+
+
+class PagedSitemap(GenericSitemap):
+    limit = 2
+
+
+paged_sitemaps = {
+    'paged': PagedSitemap({'queryset': TestModel.objects.all()}),
+}
+
+
+@override_settings(ABSOLUTE_URL_OVERRIDES={})
+class GenerateSitemapsTests(SitemapTestsBase):
+
+    def setUp(self):
+        super(GenerateSitemapsTests, self).setUp()
+        TestModel.objects.create(name='Second Object')
+        TestModel.objects.create(name='Third Object')
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def read(self, filename):
+        with open(os.path.join(self.directory, filename), 'rb') as f:
+            return f.read().decode('utf-8')
+
+    def test_generate_sitemaps(self):
+        out = StringIO()
+        # The pages are fetched by primary key, without counting the items.
+        with self.assertNumQueries(2):
+            call_command(
+                'generate_sitemaps', 'django.contrib.sitemaps.tests.test_management.paged_sitemaps',
+                self.directory, domain='example.com', url='/sitemaps', stdout=out)
+        self.assertEqual(
+            sorted(os.listdir(self.directory)),
+            ['sitemap-paged-1.xml', 'sitemap-paged-2.xml', 'sitemap.xml'])
+        self.assertIn("Wrote 2 sitemaps", out.getvalue())
+        self.assertXMLEqual(self.read('sitemap.xml'), """<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+<sitemap><loc>http://example.com/sitemaps/sitemap-paged-1.xml</loc></sitemap>
+<sitemap><loc>http://example.com/sitemaps/sitemap-paged-2.xml</loc></sitemap>
+</sitemapindex>
+""")
+        pks = list(TestModel.objects.order_by('pk').values_list('pk', flat=True))
+        self.assertXMLEqual(self.read('sitemap-paged-2.xml'), """<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+<url><loc>http://example.com/testmodel/%s/</loc></url>
+</urlset>
+""" % pks[2])
+
+    def test_generate_empty_sitemap(self):
+        TestModel.objects.all().delete()
+        call_command(
+            'generate_sitemaps', 'django.contrib.sitemaps.tests.test_management.paged_sitemaps',
+            self.directory, domain='example.com', url='http://static.example.com/',
+            verbosity=0)
+        self.assertXMLEqual(self.read('sitemap-paged-1.xml'), """<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+</urlset>
+""")
+        self.assertIn('<loc>http://static.example.com/sitemap-paged-1.xml</loc>', self.read('sitemap.xml'))
@@ -132,6 +132,14 @@ urlpatterns = [
     url(r'^flatpages/sitemap\.xml$', views.sitemap,
         {'sitemaps': flatpage_sitemaps},
         name='django.contrib.sitemaps.views.sitemap'),
+    url(r'^streaming/index\.xml$', views.index,
+        {'sitemaps': simple_sitemaps, 'template_name': None}),
+    url(r'^streaming/sitemap\.xml$', views.sitemap,
+        {'sitemaps': simple_sitemaps, 'template_name': None},
+        name='django.contrib.sitemaps.views.sitemap'),
+    url(r'^streaming/i18n\.xml$', views.sitemap,
+        {'sitemaps': simple_i18nsitemaps, 'template_name': None},
+        name='django.contrib.sitemaps.views.sitemap'),
     url(r'^cached/index\.xml$', cache_page(1)(views.index),
         {'sitemaps': simple_sitemaps, 'sitemap_url_name': 'cached_sitemap'}),
     url(r'^cached/sitemap-(?P<section>.+)\.xml', cache_page(1)(views.sitemap),
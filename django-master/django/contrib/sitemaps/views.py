@@ -1,11 +1,13 @@
 from calendar import timegm
 import datetime
 from functools import wraps
+import itertools
 
+from django.contrib.sitemaps import sitemapindex_xml, urlset_xml
 from django.contrib.sites.shortcuts import get_current_site
 from django.core import urlresolvers
 from django.core.paginator import EmptyPage, PageNotAnInteger
-from django.http import Http404
+from django.http import Http404, StreamingHttpResponse
 from django.template.response import TemplateResponse
 from django.utils import six
 from django.utils.http import http_date
@@ -40,6 +42,9 @@ def index(request, sitemaps,
         for page in range(2, site.paginator.num_pages + 1):
             sites.append('%s?p=%s' % (absolute_url, page))
 
+    if template_name is None:
+        return StreamingHttpResponse(sitemapindex_xml(sites),
+                                     content_type=content_type)
     return TemplateResponse(request, template_name, {'sitemaps': sites},
                             content_type=content_type)
 
@@ -64,12 +69,21 @@ def sitemap(request, sitemaps, section=None,
         try:
             if callable(site):
                 site = site()
-            urls.extend(site.get_urls(page=page, site=req_site,
-                                      protocol=req_protocol))
+            if template_name is None:
+                urls.append(site.iter_urls(page=page, site=req_site,
+                                           protocol=req_protocol))
+            else:
+                urls.extend(site.get_urls(page=page, site=req_site,
+                                          protocol=req_protocol))
         except EmptyPage:
             raise Http404("Page %s empty" % page)
         except PageNotAnInteger:
             raise Http404("No page '%s'" % page)
+    if template_name is None:
+        # The XML is written as the items are fetched, so the Last-Modified
+        # header isn't known when the response starts.
+        return StreamingHttpResponse(urlset_xml(itertools.chain(*urls)),
+                                     content_type=content_type)
     response = TemplateResponse(request, template_name, {'urlset': urls},
                                 content_type=content_type)
     if hasattr(site, 'latest_lastmod'):
@@ -11,6 +11,7 @@ from django.utils.six.moves import input
 
 from django.contrib.staticfiles.finders import get_finders
 from django.contrib.staticfiles.storage import staticfiles_storage
+from django.contrib.staticfiles.utils import parallel_map
 
 
 class Command(BaseCommand):
@@ -61,6 +62,10 @@ class Command(BaseCommand):
             dest='use_default_ignore_patterns', default=True,
             help="Don't ignore the common private glob-style patterns 'CVS', "
                 "'.*' and '*~'.")
+        parser.add_argument('-j', '--jobs', action='store', dest='jobs',
+            type=int, default=1,
+            help="Number of threads used to copy and post-process files. "
+                 "Defaults to 1.")
 
     def set_options(self, **options):
         """
@@ -76,6 +81,7 @@ class Command(BaseCommand):
             ignore_patterns += ['CVS', '.*', '*~']
         self.ignore_patterns = list(set(ignore_patterns))
         self.post_process = options['post_process']
+        self.jobs = options.get('jobs', 1)
 
     def collect(self):
         """
@@ -105,13 +111,21 @@ class Command(BaseCommand):
 
                 if prefixed_path not in found_files:
                     found_files[prefixed_path] = (storage, path)
-                    handler(path, prefixed_path, storage)
+
+        def collect_file(item):
+            prefixed_path, (storage, path) = item
+            handler(path, prefixed_path, storage)
+
+        # The files are found before being copied or linked by a pool of
+        # threads, since the first file found for a path takes precedence.
+        list(parallel_map(collect_file, found_files.items(), self.jobs))
 
         # Here we check if the storage backend has a post_process
         # method and pass it the list of modified files.
         if self.post_process and hasattr(self.storage, 'post_process'):
             processor = self.storage.post_process(found_files,
-                                                  dry_run=self.dry_run)
+                                                  dry_run=self.dry_run,
+                                                  jobs=self.jobs)
             for original_path, processed_path, processed in processor:
                 if isinstance(processed, Exception):
                     self.stderr.write("Post-processing '%s' failed!" % original_path)
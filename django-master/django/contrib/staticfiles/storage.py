@@ -16,7 +16,8 @@ from django.utils.encoding import force_bytes, force_text
 from django.utils.functional import LazyObject
 from django.utils.six.moves.urllib.parse import unquote, urlsplit, urlunsplit, urldefrag
 
-from django.contrib.staticfiles.utils import check_settings, matches_patterns
+from django.contrib.staticfiles.utils import (check_settings,
+    matches_patterns, parallel_map)
 
 
 class StaticFilesStorage(FileSystemStorage):
@@ -61,6 +62,7 @@ class HashedFilesMixin(object):
         super(HashedFilesMixin, self).__init__(*args, **kwargs)
         self._patterns = OrderedDict()
         self.hashed_files = {}
+        self.content_hashes = {}
         for extension, patterns in self.patterns:
             for pattern in patterns:
                 if isinstance(pattern, (tuple, list)):
@@ -187,7 +189,52 @@ class HashedFilesMixin(object):
 
         return converter
 
-    def post_process(self, paths, dry_run=False, **options):
+    def convert_urls(self, name, content):
+        """
+        Returns the content of the file with the given name with the URLs
+        matched by the patterns replaced by their hashed counterparts.
+
+        The content is scanned once: at each step the earliest match of all
+        the patterns is converted, so that each part of the content is
+        rewritten at most once.
+        """
+        converters = []
+        for patterns in self._patterns.values():
+            for pattern, template in patterns:
+                converters.append((pattern, self.url_converter(name, template)))
+        matches = [pattern.search(content) for pattern, converter in converters]
+        result = []
+        position = 0
+        while True:
+            candidates = [(match.start(), index)
+                          for index, match in enumerate(matches) if match]
+            if not candidates:
+                break
+            start, index = min(candidates)
+            match = matches[index]
+            result.append(content[position:start])
+            result.append(converters[index][1](match))
+            position = match.end()
+            # Search again the patterns whose next match overlaps the
+            # converted text, moving forward on empty matches.
+            search_position = position if position > start else position + 1
+            for index, match in enumerate(matches):
+                if match and match.start() < search_position:
+                    matches[index] = converters[index][0].search(content, search_position)
+        result.append(content[position:])
+        return ''.join(result)
+
+    def get_processed_files(self):
+        """
+        Returns two dictionaries describing the files stored by the previous
+        run of post_process(): the first maps their names to their hashed
+        names, the second maps the names of adjusted files to the hash of
+        their adjusted content. The files which are unchanged since then
+        aren't checked nor saved again.
+        """
+        return {}, {}
+
+    def post_process(self, paths, dry_run=False, jobs=1, **options):
         """
         Post process the given OrderedDict of files (called from collectstatic).
 
@@ -200,6 +247,10 @@ class HashedFilesMixin(object):
 
         If either of these are performed on a file, then that file is considered
         post-processed.
+
+        The files are processed by a pool of ``jobs`` threads, first to hash
+        every file and copy those which don't need adjusting, then to adjust
+        the others once the hashed names of all files are known.
         """
         # don't even dare to process the files if we're in dry run mode
         if dry_run:
@@ -207,59 +258,76 @@ class HashedFilesMixin(object):
 
         # where to store the new paths
         hashed_files = OrderedDict()
+        processed_files, processed_hashes = self.get_processed_files()
 
         # build a list of adjustable files
         matches = lambda path: matches_patterns(path, self._patterns.keys())
-        adjustable_paths = [path for path in paths if matches(path)]
-
-        # then sort the files by the directory level
-        path_level = lambda name: len(name.split(os.sep))
-        for name in sorted(paths.keys(), key=path_level, reverse=True):
+        adjustable_paths = set(path for path in paths if matches(path))
 
+        def hash_file(name):
             # use the original, local file, not the copied-but-unprocessed
             # file, which might be somewhere far away, like S3
             storage, path = paths[name]
             with storage.open(path) as original_file:
-
                 # generate the hash with the original content, even for
                 # adjustable files.
                 hashed_name = self.hashed_name(name, original_file)
-
-                # then get the original's file content..
-                if hasattr(original_file, 'seek'):
-                    original_file.seek(0)
-
-                hashed_file_exists = self.exists(hashed_name)
                 processed = False
-
-                # ..to apply each replacement pattern to the content
                 if name in adjustable_paths:
-                    content = original_file.read().decode(settings.FILE_CHARSET)
-                    for patterns in self._patterns.values():
-                        for pattern, template in patterns:
-                            converter = self.url_converter(name, template)
-                            try:
-                                content = pattern.sub(converter, content)
-                            except ValueError as exc:
-                                yield name, None, exc
-                    if hashed_file_exists:
-                        self.delete(hashed_name)
-                    # then save the processed result
-                    content_file = ContentFile(force_bytes(content))
-                    saved_name = self._save(hashed_name, content_file)
-                    hashed_name = force_text(self.clean_name(saved_name))
-                    processed = True
-                else:
+                    pass
+                elif processed_files.get(name) == hashed_name:
+                    # the same content was stored by the previous run
+                    pass
+                elif not self.exists(hashed_name):
                     # or handle the case in which neither processing nor
                     # a change to the original file happened
-                    if not hashed_file_exists:
-                        processed = True
-                        saved_name = self._save(hashed_name, original_file)
-                        hashed_name = force_text(self.clean_name(saved_name))
+                    if hasattr(original_file, 'seek'):
+                        original_file.seek(0)
+                    processed = True
+                    saved_name = self._save(hashed_name, original_file)
+                    hashed_name = force_text(self.clean_name(saved_name))
+            return name, hashed_name, processed
+
+        def adjust_file(name):
+            storage, path = paths[name]
+            hashed_name = hashed_files[self.hash_key(name)]
+            with storage.open(path) as original_file:
+                content = original_file.read().decode(settings.FILE_CHARSET)
+            try:
+                content = force_bytes(self.convert_urls(name, content))
+            except ValueError as exc:
+                return name, None, exc, None
+            content_hash = hashlib.md5(content).hexdigest()
+            if (processed_files.get(name) == hashed_name and
+                    processed_hashes.get(name) == content_hash):
+                return name, hashed_name, False, content_hash
+            if self.exists(hashed_name):
+                self.delete(hashed_name)
+            # then save the processed result
+            saved_name = self._save(hashed_name, ContentFile(content))
+            hashed_name = force_text(self.clean_name(saved_name))
+            return name, hashed_name, True, content_hash
 
-                # and then set the cache accordingly
-                hashed_files[self.hash_key(name)] = hashed_name
+        # then sort the files by the directory level
+        path_level = lambda name: len(name.split(os.sep))
+        names = sorted(paths.keys(), key=path_level, reverse=True)
+        for name, hashed_name, processed in parallel_map(hash_file, names, jobs):
+            # and then set the cache accordingly
+            hashed_files[self.hash_key(name)] = hashed_name
+            if name not in adjustable_paths:
                 yield name, hashed_name, processed
+        # the adjusted files refer to the hashed names of the other files
+        self.hashed_files.update(hashed_files)
+
+        adjustable_names = [name for name in names if name in adjustable_paths]
+        for name, hashed_name, processed, content_hash in parallel_map(
+                adjust_file, adjustable_names, jobs):
+            if isinstance(processed, Exception):
+                yield name, None, processed
+                continue
+            hashed_files[self.hash_key(name)] = hashed_name
+            self.content_hashes[name] = content_hash
+            yield name, hashed_name, processed
 
         # Finally store the processed paths
         self.hashed_files.update(hashed_files)
@@ -296,10 +364,10 @@ class ManifestFilesMixin(HashedFilesMixin):
         except IOError:
             return None
 
-    def load_manifest(self):
+    def _load_manifest(self):
         content = self.read_manifest()
         if content is None:
-            return OrderedDict()
+            return {}
         try:
             stored = json.loads(content, object_pairs_hook=OrderedDict)
         except ValueError:
@@ -307,12 +375,21 @@ class ManifestFilesMixin(HashedFilesMixin):
         else:
             version = stored.get('version', None)
             if version == '1.0':
-                return stored.get('paths', OrderedDict())
+                return stored
         raise ValueError("Couldn't load manifest '%s' (version %s)" %
                          (self.manifest_name, self.manifest_version))
 
+    def load_manifest(self):
+        return self._load_manifest().get('paths', OrderedDict())
+
+    def get_processed_files(self):
+        # The manifest is read again in case the files were cleared.
+        stored = self._load_manifest()
+        return stored.get('paths', {}), stored.get('hashes', {})
+
     def post_process(self, *args, **kwargs):
         self.hashed_files = OrderedDict()
+        self.content_hashes = OrderedDict()
         all_post_processed = super(ManifestFilesMixin,
                                    self).post_process(*args, **kwargs)
         for post_processed in all_post_processed:
@@ -320,7 +397,11 @@ class ManifestFilesMixin(HashedFilesMixin):
         self.save_manifest()
 
     def save_manifest(self):
-        payload = {'paths': self.hashed_files, 'version': self.manifest_version}
+        payload = {
+            'paths': self.hashed_files,
+            'hashes': self.content_hashes,
+            'version': self.manifest_version,
+        }
         if self.exists(self.manifest_name):
             self.delete(self.manifest_name)
         contents = json.dumps(payload).encode('utf-8')
@@ -1,5 +1,7 @@
 import os
 import fnmatch
+from multiprocessing.pool import ThreadPool
+
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 
@@ -40,6 +42,24 @@ def get_files(storage, ignore_patterns=None, location=''):
             yield fn
 
 
+def parallel_map(function, items, jobs=1):
+    """
+    Yields the results of calling function on each item, in order. If jobs
+    is greater than 1, the calls are made by a pool of jobs threads.
+    """
+    if jobs <= 1:
+        for item in items:
+            yield function(item)
+        return
+    pool = ThreadPool(jobs)
+    try:
+        for result in pool.imap(function, items):
+            yield result
+    finally:
+        pool.terminate()
+        pool.join()
+
+
 def check_settings(base_url=None):
     """
     Checks if the staticfiles settings have sane values.
@@ -65,6 +65,8 @@ class FileUploadHandler(object):
     Base class for streaming upload handlers.
     """
     chunk_size = 64 * 2 ** 10  # : The default chunk size is 64 KB.
+    # Whether receive_data_chunk() accepts memoryviews rather than bytes.
+    accepts_memoryview = False
 
     def __init__(self, request=None):
         self.file_name = None
@@ -134,6 +136,8 @@ class TemporaryFileUploadHandler(FileUploadHandler):
     """
     Upload handler that streams data into a temporary file.
     """
+    accepts_memoryview = True
+
     def __init__(self, *args, **kwargs):
         super(TemporaryFileUploadHandler, self).__init__(*args, **kwargs)
 
@@ -157,6 +161,7 @@ class MemoryFileUploadHandler(FileUploadHandler):
     """
     File upload handler to stream uploads into memory (used for small files).
     """
+    accepts_memoryview = True
 
     def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None):
         """
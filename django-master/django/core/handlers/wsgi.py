@@ -157,6 +157,24 @@ class WSGIRequest(http.HttpRequest):
     REQUEST = property(_get_request)
 
 
+class FileToStream(object):
+    """
+    Proxy for the file of a FileResponse given to wsgi.file_wrapper. WSGI
+    servers close the file wrapper instead of the response, so closing the
+    proxy closes the response, which closes the file and sends the
+    request_finished signal.
+    """
+    def __init__(self, response):
+        self.response = response
+        self.file = response.file_to_stream
+
+    def __getattr__(self, attr):
+        return getattr(self.file, attr)
+
+    def close(self):
+        self.response.close()
+
+
 class WSGIHandler(base.BaseHandler):
     initLock = Lock()
     request_class = WSGIRequest
@@ -197,6 +215,8 @@ class WSGIHandler(base.BaseHandler):
         for c in response.cookies.values():
             response_headers.append((str('Set-Cookie'), str(c.output(header=''))))
         start_response(force_str(status), response_headers)
+        if getattr(response, 'file_to_stream', None) is not None and environ.get('wsgi.file_wrapper'):
+            response = environ['wsgi.file_wrapper'](FileToStream(response), response.block_size)
         return response
 
 
@@ -307,7 +307,7 @@ class ManagementUtility(object):
                 settings.configure()
 
         if settings.configured:
-            django.setup()
+            django.setup(defer_models=settings.DEFER_MODEL_IMPORTS)
 
         self.autocomplete()
 
@@ -166,6 +166,14 @@ class BaseCommand(object):
         wrapped with ``BEGIN;`` and ``COMMIT;``. Default value is
         ``False``.
 
+    ``requires_models``
+        A boolean; if ``False`` and the import of models was deferred (see
+        the ``DEFER_MODEL_IMPORTS`` setting), the command is executed without
+        importing models, calling the ``ready()`` method of applications or
+        running system checks. If ``True``, models are imported and
+        ``ready()`` methods are called before the command is executed.
+        Default value is ``True``.
+
     ``requires_system_checks``
         A boolean; if ``True``, entire Django project will be checked for errors
         prior to executing the command. Default value is ``True``.
@@ -215,6 +223,7 @@ class BaseCommand(object):
     can_import_settings = True
     output_transaction = False  # Whether to wrap the output in a "BEGIN; COMMIT;"
     leave_locale_alone = False
+    requires_models = True
 
     # Uncomment the following line of code after deprecation plan for
     # requires_model_validation comes to completion:
@@ -411,8 +420,17 @@ class BaseCommand(object):
             saved_locale = translation.get_language()
             translation.activate('en-us')
 
+        from django.apps import apps
+        if self.requires_models and apps._models_deferred:
+            # DEFER_MODEL_IMPORTS postponed importing models; do it now so
+            # that the ready() methods of applications run before handle().
+            apps.check_models_ready()
+
         try:
+            # System checks need models, so they're skipped by commands that
+            # don't require them when their import was deferred.
             if (self.requires_system_checks and
+                    not apps._models_deferred and
                     not options.get('skip_validation') and  # Remove at the end of deprecation for `skip_validation`.
                     not options.get('skip_checks')):
                 self.check()
@@ -450,6 +468,11 @@ class BaseCommand(object):
         If there are only light messages (like warnings), they are printed to
         stderr and no exception is raised.
         """
+        from django.apps import apps
+        # Applications register checks in their ready() method, which isn't
+        # called until models are imported.
+        apps.check_models_ready()
+
         all_issues = checks.run_checks(
             app_configs=app_configs,
             tags=tags,
@@ -32,6 +32,7 @@ class Command(BaseCommand):
     help = 'Compiles .po files to .mo files for use with builtin gettext support.'
 
     requires_system_checks = False
+    requires_models = False
     leave_locale_alone = True
 
     program = 'msgfmt'
@@ -54,6 +55,7 @@ class Command(BaseCommand):
                                "tools 0.15 or newer installed." % self.program)
 
         basedirs = [os.path.join('conf', 'locale'), 'locale']
+        settings = None
         if os.environ.get('DJANGO_SETTINGS_MODULE'):
             from django.conf import settings
             basedirs.extend([upath(path) for path in settings.LOCALE_PATHS])
@@ -88,6 +90,23 @@ class Command(BaseCommand):
             if locations:
                 self.compile_messages(locations)
 
+        if settings is not None and settings.LOCALE_CATALOGS_DIR is not None:
+            self.write_compiled_catalogs(settings, locale, exclude)
+
+    def write_compiled_catalogs(self, settings, locale, exclude):
+        """
+        Writes the merged catalogs of the languages in LANGUAGES to
+        LOCALE_CATALOGS_DIR.
+        """
+        from django.utils.translation import to_locale, trans_real
+        for language, name in settings.LANGUAGES:
+            code = to_locale(language)
+            if (locale and code not in locale) or code in exclude:
+                continue
+            path = trans_real.write_compiled_catalog(language)
+            if self.verbosity > 0:
+                self.stdout.write('writing merged catalog %s\n' % path)
+
     def compile_messages(self, locations):
         """
         Locations is a list of tuples: [(directory, file), ...]
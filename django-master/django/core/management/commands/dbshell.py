@@ -7,6 +7,7 @@ class Command(BaseCommand):
         "default database if none is provided.")
 
     requires_system_checks = False
+    requires_models = False
 
     def add_arguments(self, parser):
         parser.add_argument('--database', action='store', dest='database',
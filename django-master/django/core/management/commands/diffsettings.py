@@ -12,6 +12,7 @@ class Command(BaseCommand):
     followed by "###"."""
 
     requires_system_checks = False
+    requires_models = False
 
     def add_arguments(self, parser):
         parser.add_argument('--all', action='store_true', dest='all', default=False,
@@ -12,6 +12,7 @@ class Command(BaseCommand):
     help = "Introspects the database tables in the given database and outputs a Django model module."
 
     requires_system_checks = False
+    requires_models = False
 
     db_module = 'django.db'
 
@@ -2,7 +2,9 @@ from __future__ import unicode_literals
 
 import glob
 import gzip
+import json
 import os
+import sys
 import warnings
 import zipfile
 
@@ -13,7 +15,7 @@ from django.core.management.base import BaseCommand, CommandError
 from django.core.management.color import no_style
 from django.db import (connections, router, transaction, DEFAULT_DB_ALIAS,
       IntegrityError, DatabaseError)
-from django.utils import lru_cache
+from django.utils import lru_cache, six
 from django.utils.encoding import force_text
 from django.utils.functional import cached_property
 from django.utils._os import upath
@@ -31,6 +33,8 @@ class Command(BaseCommand):
     help = 'Installs the named fixture(s) in the database.'
     missing_args_message = ("No database fixture specified. Please provide the "
                             "path of at least one fixture in the command line.")
+    # Maximum number of objects of a model inserted at once in bulk mode.
+    bulk_batch_size = 1000
 
     def add_arguments(self, parser):
         parser.add_argument('args', metavar='fixture', nargs='+',
@@ -44,6 +48,9 @@ class Command(BaseCommand):
             dest='ignore', default=False,
             help='Ignores entries in the serialized data for fields that do not '
             'currently exist on the model.')
+        parser.add_argument('--bulk', action='store_true', dest='bulk',
+            default=False, help='Inserts objects in batches. The objects must '
+            'not exist in the database and no signals are sent.')
 
     def handle(self, *fixture_labels, **options):
 
@@ -52,6 +59,9 @@ class Command(BaseCommand):
         self.app_label = options.get('app_label')
         self.hide_empty = options.get('hide_empty', False)
         self.verbosity = options.get('verbosity')
+        self.bulk = options.get('bulk', False)
+        # Maps fixture files to their parsed data, see deserialize_fixture().
+        self.fixture_cache = options.get('fixture_cache')
 
         with transaction.atomic(using=self.using):
             self.loaddata(fixture_labels)
@@ -71,6 +81,8 @@ class Command(BaseCommand):
         self.loaded_object_count = 0
         self.fixture_object_count = 0
         self.models = set()
+        # Deserialized objects waiting to be inserted, by model, in bulk mode.
+        self.batches = {}
 
         self.serialization_formats = serializers.get_public_serializer_formats()
         # Forcing binary mode may be revisited after dropping Python 2 support (see #22399)
@@ -122,34 +134,23 @@ class Command(BaseCommand):
         """
         for fixture_file, fixture_dir, fixture_name in self.find_fixtures(fixture_label):
             _, ser_fmt, cmp_fmt = self.parse_name(os.path.basename(fixture_file))
-            open_method, mode = self.compression_formats[cmp_fmt]
-            fixture = open_method(fixture_file, mode)
+            self.fixture_count += 1
+            objects_in_fixture = 0
+            loaded_objects_in_fixture = 0
+            if self.verbosity >= 2:
+                self.stdout.write("Installing %s fixture '%s' from %s." %
+                    (ser_fmt, fixture_name, humanize(fixture_dir)))
             try:
-                self.fixture_count += 1
-                objects_in_fixture = 0
-                loaded_objects_in_fixture = 0
-                if self.verbosity >= 2:
-                    self.stdout.write("Installing %s fixture '%s' from %s." %
-                        (ser_fmt, fixture_name, humanize(fixture_dir)))
-
-                objects = serializers.deserialize(ser_fmt, fixture,
-                    using=self.using, ignorenonexistent=self.ignore)
-
-                for obj in objects:
+                for obj in self.deserialize_fixture(fixture_file, ser_fmt, cmp_fmt):
                     objects_in_fixture += 1
                     if router.allow_migrate(self.using, obj.object.__class__):
                         loaded_objects_in_fixture += 1
                         self.models.add(obj.object.__class__)
-                        try:
-                            obj.save(using=self.using)
-                        except (DatabaseError, IntegrityError) as e:
-                            e.args = ("Could not load %(app_label)s.%(object_name)s(pk=%(pk)s): %(error_msg)s" % {
-                                'app_label': obj.object._meta.app_label,
-                                'object_name': obj.object._meta.object_name,
-                                'pk': obj.object.pk,
-                                'error_msg': force_text(e)
-                            },)
-                            raise
+                        if self.bulk and self.can_bulk_insert(obj):
+                            self.add_to_batch(obj)
+                        else:
+                            self.save_object(obj)
+                self.flush_batches()
 
                 self.loaded_object_count += loaded_objects_in_fixture
                 self.fixture_object_count += objects_in_fixture
@@ -157,8 +158,6 @@ class Command(BaseCommand):
                 if not isinstance(e, CommandError):
                     e.args = ("Problem installing fixture '%s': %s" % (fixture_file, e),)
                 raise
-            finally:
-                fixture.close()
 
             # Warn if the fixture we loaded contains 0 objects.
             if objects_in_fixture == 0:
@@ -168,6 +167,143 @@ class Command(BaseCommand):
                     RuntimeWarning
                 )
 
+    def deserialize_fixture(self, fixture_file, ser_fmt, cmp_fmt):
+        """
+        Yields the deserialized objects of a fixture file.
+
+        If a fixture cache was given, JSON and YAML fixtures are parsed once
+        and their data is kept in the cache. The objects are built from that
+        data every time, so that natural keys are resolved, and primary keys
+        assigned, against the current state of the database.
+        """
+        if self.fixture_cache is not None:
+            if fixture_file not in self.fixture_cache:
+                self.fixture_cache[fixture_file] = self.parse_fixture(fixture_file, ser_fmt, cmp_fmt)
+            data = self.fixture_cache[fixture_file]
+            if data is not None:
+                return serializers.deserialize('python', data,
+                    using=self.using, ignorenonexistent=self.ignore)
+        return self.read_fixture(fixture_file, ser_fmt, cmp_fmt)
+
+    def read_fixture(self, fixture_file, ser_fmt, cmp_fmt):
+        """
+        Yields the objects deserialized from a fixture file.
+        """
+        open_method, mode = self.compression_formats[cmp_fmt]
+        fixture = open_method(fixture_file, mode)
+        try:
+            for obj in serializers.deserialize(ser_fmt, fixture,
+                    using=self.using, ignorenonexistent=self.ignore):
+                yield obj
+        finally:
+            fixture.close()
+
+    def parse_fixture(self, fixture_file, ser_fmt, cmp_fmt):
+        """
+        Returns the data of a JSON or YAML fixture file, as accepted by the
+        'python' deserializer, or None if the fixture is in another format.
+        """
+        module = serializers.get_deserializer(ser_fmt).__module__
+        if module not in ('django.core.serializers.json', 'django.core.serializers.pyyaml'):
+            return None
+        open_method, mode = self.compression_formats[cmp_fmt]
+        fixture = open_method(fixture_file, mode)
+        try:
+            if module == 'django.core.serializers.json':
+                data = fixture.read()
+                if isinstance(data, bytes):
+                    data = data.decode('utf-8')
+                return json.loads(data)
+            else:
+                from django.core.serializers.pyyaml import SafeLoader, yaml
+                return yaml.load(fixture, Loader=SafeLoader)
+        except Exception as e:
+            # Map to deserializer error, like the deserializers do.
+            six.reraise(serializers.base.DeserializationError,
+                        serializers.base.DeserializationError(e), sys.exc_info()[2])
+        finally:
+            fixture.close()
+
+    def save_object(self, obj):
+        """
+        Saves a deserialized object, and its many-to-many data.
+        """
+        try:
+            obj.save(using=self.using)
+        except (DatabaseError, IntegrityError) as e:
+            e.args = ("Could not load %(app_label)s.%(object_name)s(pk=%(pk)s): %(error_msg)s" % {
+                'app_label': obj.object._meta.app_label,
+                'object_name': obj.object._meta.object_name,
+                'pk': obj.object.pk,
+                'error_msg': force_text(e)
+            },)
+            raise
+
+    def can_bulk_insert(self, obj):
+        """
+        Returns whether a deserialized object can be inserted in a batch: its
+        primary key is needed for its many-to-many data and multi-table
+        inheritance requires a query per table.
+        """
+        return obj.object.pk is not None and not obj.object._meta.concrete_model._meta.parents
+
+    def add_to_batch(self, obj):
+        """
+        Adds a deserialized object to the batch of its model, which is
+        inserted when it reaches bulk_batch_size objects.
+        """
+        model = obj.object._meta.concrete_model
+        batch = self.batches.setdefault(model, [])
+        batch.append(obj)
+        if len(batch) >= self.bulk_batch_size:
+            self.flush_batch(model)
+
+    def flush_batches(self):
+        for model in list(self.batches):
+            self.flush_batch(model)
+
+    def flush_batch(self, model):
+        """
+        Inserts the pending objects of a model, then their many-to-many data,
+        with as few queries as possible.
+        """
+        batch = self.batches.pop(model, [])
+        if not batch:
+            return
+        connection = connections[self.using]
+        fields = model._meta.local_concrete_fields
+        objs = [obj.object for obj in batch]
+        try:
+            # Like Model.save_base(raw=True), insert field values as is.
+            batch_size = max(connection.ops.bulk_batch_size(fields, objs), 1)
+            for i in range(0, len(objs), batch_size):
+                model._base_manager._insert(objs[i:i + batch_size], fields=fields, using=self.using, raw=True)
+            through_rows = {}
+            for obj in batch:
+                obj.object._state.adding = False
+                obj.object._state.db = self.using
+                for field_name, pks in (obj.m2m_data or {}).items():
+                    field = model._meta.get_field(field_name)
+                    through = field.rel.through
+                    source = through._meta.get_field(field.m2m_field_name()).attname
+                    target = through._meta.get_field(field.m2m_reverse_field_name()).attname
+                    through_rows.setdefault(through, []).extend(
+                        through(**{source: obj.object.pk, target: pk}) for pk in pks)
+                obj.m2m_data = None
+            for through, rows in through_rows.items():
+                through._base_manager.using(self.using).bulk_create(rows)
+        except (DatabaseError, IntegrityError) as e:
+            e.args = ("Could not load %(count)d %(app_label)s.%(object_name)s objects "
+                      "(pk=%(first)s to %(last)s): %(error_msg)s" % {
+                          'count': len(objs),
+                          'app_label': model._meta.app_label,
+                          'object_name': model._meta.object_name,
+                          'first': objs[0].pk,
+                          'last': objs[-1].pk,
+                          'error_msg': force_text(e)
+                      },)
+            raise
+
     @lru_cache.lru_cache(maxsize=None)
     def find_fixtures(self, fixture_label):
         """
@@ -284,8 +420,11 @@ class SingleZipReader(zipfile.ZipFile):
         if len(self.namelist()) != 1:
             raise ValueError("Zip-compressed fixtures must contain one file.")
 
-    def read(self):
-        return zipfile.ZipFile.read(self, self.namelist()[0])
+    def read(self, size=-1):
+        # Deserializers may read the fixture in chunks.
+        if not hasattr(self, '_member'):
+            self._member = self.open(self.namelist()[0])
+        return self._member.read(size)
 
 
 def humanize(dirname):
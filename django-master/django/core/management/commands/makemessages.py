@@ -169,6 +169,7 @@ class Command(BaseCommand):
 "--locale, --exclude or --all options.")
 
     requires_system_checks = False
+    requires_models = False
     leave_locale_alone = True
 
     msgmerge_options = ['-q', '--previous']
@@ -36,6 +36,7 @@ class TemplateCommand(BaseCommand):
     :param options: The additional variables passed to project or app templates
     """
     requires_system_checks = False
+    requires_models = False
     # Can't import settings during this command, because they haven't
     # necessarily been created.
     can_import_settings = False
@@ -1,7 +1,10 @@
 import collections
+import json
 from math import ceil
 
 from django.utils import six
+from django.utils.encoding import force_text
+from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
 
 
 class InvalidPage(Exception):
@@ -16,6 +19,10 @@ class EmptyPage(InvalidPage):
     pass
 
 
+class InvalidCursor(InvalidPage):
+    pass
+
+
 class Paginator(object):
 
     def __init__(self, object_list, per_page, orphans=0,
@@ -159,3 +166,247 @@ class Page(collections.Sequence):
         if self.number == self.paginator.num_pages:
             return self.paginator.count
         return self.number * self.paginator.per_page
+
+
+class KeysetPaginator(object):
+    """
+    Paginates a QuerySet by filtering on the values of its ordering columns,
+    starting after (or before) the last row seen, rather than by slicing with
+    an OFFSET. Retrieving a page therefore costs the same wherever it is in
+    the results, and no COUNT query is needed.
+
+    Pages are identified by opaque cursors instead of numbers, see
+    KeysetPage.next_cursor() and KeysetPage.previous_cursor(). The primary
+    key is added to the ordering if it isn't already present, so that every
+    row has a distinct position.
+    """
+
+    def __init__(self, object_list, per_page):
+        self.per_page = int(per_page)
+        self.ordering = self._get_ordering(object_list)
+        object_list = object_list.order_by(*[
+            ('-' if descending else '') + name
+            for name, field, descending in self.ordering
+        ])
+        if not object_list.query.standard_ordering:
+            # The directions in self.ordering already account for reverse().
+            object_list = object_list.reverse()
+        self.object_list = object_list
+
+    def _get_ordering(self, queryset):
+        """
+        Returns a list of (name, field, descending) tuples describing the
+        ordering of the queryset, ending with the primary key.
+        """
+        query = queryset.query
+        if query.extra_order_by:
+            ordering = query.extra_order_by
+        elif not query.default_ordering:
+            ordering = query.order_by
+        else:
+            ordering = query.order_by or query.get_meta().ordering or []
+
+        opts = queryset.model._meta
+        result = []
+        seen = set()
+        for item in ordering:
+            name, descending = self._parse_ordering_item(item)
+            if not query.standard_ordering:
+                descending = not descending
+            for name, field, descending in self._resolve_ordering(opts, name, descending):
+                # Later occurrences of a column don't change the ordering.
+                if name not in seen:
+                    seen.add(name)
+                    result.append((name, field, descending))
+        if not any(name == 'pk' or (field.primary_key and '__' not in name)
+                   for name, field, descending in result):
+            # Keep the direction of the last column so that a composite index
+            # on the ordering can be used.
+            descending = result[-1][2] if result else False
+            result.append(('pk', opts.pk, descending))
+        return result
+
+    def _parse_ordering_item(self, item):
+        if not isinstance(item, six.string_types) or item == '?' or '.' in item:
+            raise ValueError(
+                "Keyset pagination only supports ordering by field names, "
+                "not %r." % (item,))
+        return item.lstrip('-+'), item.startswith('-')
+
+    def _resolve_ordering(self, opts, name, descending):
+        """
+        Returns the (name, field, descending) tuples for ordering by name.
+        Like the ORM, ordering by a relation means ordering by the related
+        model's default ordering, or by its primary key.
+        """
+        parts = name.split('__')
+        field_opts = opts
+        for part in parts[:-1]:
+            field = field_opts.pk if part == 'pk' else field_opts.get_field(part)
+            if not field.rel:
+                raise ValueError("Cannot order by %r: %r is not a relation." % (name, part))
+            field_opts = field.rel.to._meta
+        if parts[-1] == 'pk':
+            return [(name, field_opts.pk, descending)]
+        field = field_opts.get_field(parts[-1])
+        if not field.rel:
+            return [(name, field, descending)]
+        result = []
+        for item in field.rel.to._meta.ordering or ['pk']:
+            related_name, related_descending = self._parse_ordering_item(item)
+            result.extend(self._resolve_ordering(
+                opts, '%s__%s' % (name, related_name), descending != related_descending))
+        return result
+
+    def _get_values(self, obj):
+        values = []
+        for name, field, descending in self.ordering:
+            value = obj
+            for part in name.split('__'):
+                value = getattr(value, part)
+                # A NULL relation makes the ordering column NULL.
+                if value is None:
+                    break
+            values.append(value)
+        return values
+
+    def encode_cursor(self, values, reverse=False):
+        """
+        Returns an opaque token designating the position of the row with the
+        given ordering values. With reverse=True, the token refers to the
+        page ending before that row rather than starting after it.
+        """
+        data = [int(reverse), [
+            value if value is None or isinstance(value, six.integer_types + (float,))
+            else force_text(value)
+            for value in values
+        ]]
+        return urlsafe_base64_encode(json.dumps(data).encode('ascii')).decode('ascii')
+
+    def decode_cursor(self, cursor):
+        """
+        Returns a (values, reverse) tuple from a token built by
+        encode_cursor(). Raises InvalidCursor if the token is malformed.
+        """
+        try:
+            reverse, values = json.loads(urlsafe_base64_decode(cursor).decode('ascii'))
+            if len(values) != len(self.ordering):
+                raise ValueError
+            values = [None if value is None else field.to_python(value)
+                      for value, (name, field, descending) in zip(values, self.ordering)]
+        except Exception:
+            raise InvalidCursor('That cursor is invalid')
+        return values, bool(reverse)
+
+    def _get_filter(self, values, reverse):
+        """
+        Returns a Q object matching the rows after the position given by
+        values, in the paginator's ordering (or before it, with reverse=True).
+        This is the expansion of a row value comparison such as
+        (col, pk) > (value, pk_value) which supports mixed directions.
+
+        NULL values are compared with IS NULL and IS NOT NULL, and sorted as
+        the database sorts them: larger than any other value on some
+        databases, smaller on others.
+        """
+        from django.db import connections
+        from django.db.models import Q
+        nulls_largest = connections[self.object_list.db].features.nulls_order_largest
+        q = Q()
+        equal = Q()
+        for (name, field, descending), value in zip(self.ordering, values):
+            larger = descending == reverse
+            if value is None:
+                # Nothing is beyond NULL when it's sorted at that end.
+                if larger != nulls_largest:
+                    q |= equal & Q(**{'%s__isnull' % name: False})
+                equal &= Q(**{'%s__isnull' % name: True})
+            else:
+                condition = Q(**{'%s__%s' % (name, 'gt' if larger else 'lt'): value})
+                if larger == nulls_largest:
+                    condition |= Q(**{'%s__isnull' % name: True})
+                q |= equal & condition
+                equal &= Q(**{name: value})
+        return q
+
+    def page(self, cursor=None):
+        """
+        Returns a KeysetPage for the given cursor, or the first page if the
+        cursor is None.
+        """
+        if cursor is None:
+            values, reverse = None, False
+            queryset = self.object_list
+        else:
+            values, reverse = self.decode_cursor(cursor)
+            queryset = self.object_list.filter(self._get_filter(values, reverse))
+            if reverse:
+                queryset = queryset.reverse()
+        # Fetch one extra row to know if there's another page after this one.
+        object_list = list(queryset[:self.per_page + 1])
+        has_more = len(object_list) > self.per_page
+        object_list = object_list[:self.per_page]
+        if reverse:
+            object_list.reverse()
+            has_previous, has_next = has_more, True
+        else:
+            has_previous, has_next = cursor is not None, has_more
+        return self._get_page(object_list, self, has_previous, has_next)
+
+    def _get_page(self, *args, **kwargs):
+        """
+        Returns an instance of a single page.
+
+        This hook can be used by subclasses to use an alternative to the
+        standard :cls:`KeysetPage` object.
+        """
+        return KeysetPage(*args, **kwargs)
+
+
+class KeysetPage(collections.Sequence):
+
+    def __init__(self, object_list, paginator, has_previous, has_next):
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_previous = has_previous
+        self._has_next = has_next
+
+    def __repr__(self):
+        return '<KeysetPage of %s objects>' % len(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        if not isinstance(index, (slice,) + six.integer_types):
+            raise TypeError
+        return self.object_list[index]
+
+    def has_next(self):
+        return self._has_next and bool(self.object_list)
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self.has_previous() or self.has_next()
+
+    def next_cursor(self):
+        """
+        Returns the cursor of the following page, or None if this is the last
+        page.
+        """
+        if not self.has_next():
+            return None
+        return self.paginator.encode_cursor(
+            self.paginator._get_values(self.object_list[-1]))
+
+    def previous_cursor(self):
+        """
+        Returns the cursor of the preceding page, or None if this is the first
+        page.
+        """
+        if not self.has_previous() or not self.object_list:
+            return None
+        return self.paginator.encode_cursor(
+            self.paginator._get_values(self.object_list[0]), reverse=True)
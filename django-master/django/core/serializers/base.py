@@ -1,9 +1,11 @@
 """
 Module for abstract serializer/unserializer base classes.
 """
+from collections import OrderedDict
 import warnings
 
 from django.db import models
+from django.db.models.query import prefetch_related_objects
 from django.utils import six
 from django.utils.deprecation import RemovedInDjango19Warning
 
@@ -46,10 +48,11 @@ class Serializer(object):
                 RemovedInDjango19Warning)
         self.use_natural_foreign_keys = options.pop('use_natural_foreign_keys', False) or self.use_natural_keys
         self.use_natural_primary_keys = options.pop('use_natural_primary_keys', False)
+        self.chunk_size = options.pop('chunk_size', 100)
 
         self.start_serialization()
         self.first = True
-        for obj in queryset:
+        for obj in self._iter_prefetched(queryset):
             self.start_object(obj)
             # Use the concrete parent class' _meta instead of the object's _meta
             # This is to avoid local_fields problems for proxy models. Refs #17717.
@@ -72,6 +75,58 @@ class Serializer(object):
         self.end_serialization()
         return self.getvalue()
 
+    def _iter_prefetched(self, queryset):
+        """
+        Iterates over the objects to serialize by chunks of chunk_size
+        objects, fetching the related objects they need for each chunk with
+        a query per relation, rather than a query per object and relation.
+        """
+        chunk = []
+        for obj in queryset:
+            chunk.append(obj)
+            if len(chunk) >= self.chunk_size:
+                self.prefetch_related(chunk)
+                for obj in chunk:
+                    yield obj
+                chunk = []
+        self.prefetch_related(chunk)
+        for obj in chunk:
+            yield obj
+
+    def prefetch_related(self, objects):
+        """
+        Fetches the many-to-many relations of objects and, when natural keys
+        are used, the targets of their foreign keys.
+        """
+        by_model = OrderedDict()
+        for obj in objects:
+            by_model.setdefault(obj.__class__, []).append(obj)
+        for model, instances in by_model.items():
+            lookups = []
+            concrete_model = model._meta.concrete_model
+            if self.use_natural_foreign_keys:
+                for field in concrete_model._meta.local_fields:
+                    if (field.serialize and field.rel is not None and
+                            hasattr(field.rel.to, 'natural_key') and
+                            (self.selected_fields is None or field.attname[:-3] in self.selected_fields)):
+                        lookups.append(field.name)
+            for field in concrete_model._meta.many_to_many:
+                if (field.serialize and field.rel.through._meta.auto_created and
+                        (self.selected_fields is None or field.attname in self.selected_fields)):
+                    lookups.append(field.name)
+            if lookups:
+                prefetch_related_objects(instances, lookups)
+
+    def get_m2m_objects(self, obj, field):
+        """
+        Returns an iterable of the objects related to obj by the many-to-many
+        field, from the prefetched objects if possible.
+        """
+        manager = getattr(obj, field.name)
+        if field.name in getattr(obj, '_prefetched_objects_cache', ()):
+            return manager.all()
+        return manager.iterator()
+
     def start_serialization(self):
         """
         Called when serializing of the queryset starts.
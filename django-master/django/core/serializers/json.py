@@ -6,9 +6,11 @@ Serialize data to/from JSON
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import codecs
 import datetime
 import decimal
 import json
+import re
 import sys
 
 from django.core.serializers.base import DeserializationError
@@ -17,6 +19,8 @@ from django.core.serializers.python import Deserializer as PythonDeserializer
 from django.utils import six
 from django.utils.timezone import is_aware
 
+WHITESPACE = re.compile(r'\s*')
+
 
 class Serializer(PythonSerializer):
     """
@@ -62,16 +66,84 @@ class Serializer(PythonSerializer):
         return super(PythonSerializer, self).getvalue()
 
 
+def _read(stream, text_decoder, size):
+    """
+    Reads up to size characters or bytes from stream and returns them as text,
+    along with whether the end of the stream was reached.
+    """
+    chunk = stream.read(size)
+    if isinstance(chunk, bytes):
+        return text_decoder.decode(chunk, final=not chunk), not chunk
+    return chunk, not chunk
+
+
+def iterload(stream, chunk_size=64 * 1024):
+    """
+    Parses a stream of JSON data incrementally. If the data is an array, its
+    items are yielded as soon as they're parsed, so that the whole document
+    is never loaded in memory; otherwise the decoded value is yielded.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder('utf-8')()
+    buf, pos, eof = '', 0, False
+    # What comes next: '[', an item or ']', an item, ',' or ']', the end.
+    state = 'start'
+    while True:
+        pos = WHITESPACE.match(buf, pos).end()
+        if pos == len(buf) and not eof:
+            chunk, eof = _read(stream, text_decoder, chunk_size)
+            buf, pos = buf[pos:] + chunk, 0
+            continue
+        if state == 'start':
+            if buf[pos:pos + 1] != '[':
+                # Not an array: decode the whole document.
+                rest = stream.read()
+                if isinstance(rest, bytes):
+                    rest = text_decoder.decode(rest, final=True)
+                yield json.loads(buf[pos:] + rest)
+                return
+            state, pos = 'first', pos + 1
+        elif state == 'end':
+            if pos < len(buf):
+                raise ValueError("Extra data after the end of the JSON array.")
+            return
+        elif state == 'separator' or (state == 'first' and buf[pos:pos + 1] == ']'):
+            if buf[pos:pos + 1] == ']':
+                state = 'end'
+            elif buf[pos:pos + 1] == ',':
+                state = 'item'
+            else:
+                raise ValueError("Expecting ',' or ']' in the JSON array.")
+            pos += 1
+        else:
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except ValueError:
+                if eof:
+                    raise
+                end = len(buf)
+            if end == len(buf) and not eof:
+                # The item may be incomplete, e.g. a number.
+                chunk, eof = _read(stream, text_decoder, chunk_size)
+                buf, pos = buf[pos:] + chunk, 0
+                continue
+            yield item
+            state, pos = 'separator', end
+
+
 def Deserializer(stream_or_string, **options):
     """
     Deserialize a stream or string of JSON data.
+
+    Streams are parsed incrementally, see iterload().
     """
-    if not isinstance(stream_or_string, (bytes, six.string_types)):
-        stream_or_string = stream_or_string.read()
-    if isinstance(stream_or_string, bytes):
-        stream_or_string = stream_or_string.decode('utf-8')
     try:
-        objects = json.loads(stream_or_string)
+        if isinstance(stream_or_string, (bytes, six.string_types)):
+            if isinstance(stream_or_string, bytes):
+                stream_or_string = stream_or_string.decode('utf-8')
+            objects = json.loads(stream_or_string)
+        else:
+            objects = iterload(stream_or_string)
         for obj in PythonDeserializer(objects, **options):
             yield obj
     except GeneratorExit:
@@ -72,7 +72,7 @@ class Serializer(base.Serializer):
             else:
                 m2m_value = lambda value: smart_text(value._get_pk_val(), strings_only=True)
             self._current[field.name] = [m2m_value(related)
-                               for related in getattr(obj, field.name).iterator()]
+                               for related in self.get_m2m_objects(obj, field)]
 
     def getvalue(self):
         return self.objects
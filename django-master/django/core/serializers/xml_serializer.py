@@ -129,7 +129,7 @@ class Serializer(base.Serializer):
                     self.xml.addQuickElement("object", attrs={
                         'pk': smart_text(value._get_pk_val())
                     })
-            for relobj in getattr(obj, field.name).iterator():
+            for relobj in self.get_m2m_objects(obj, field):
                 handle_m2m(relobj)
 
             self.xml.endElement("field")
@@ -530,6 +530,10 @@ class BaseDatabaseFeatures(object):
     # Usually an indication that the test database is in-memory
     test_db_allows_multiple_connections = True
 
+    # Can the test database be cloned for the workers of the parallel test
+    # runner?
+    can_clone_databases = False
+
     # Can an object be saved without an explicit primary key?
     supports_unspecified_pk = False
 
@@ -932,6 +936,14 @@ class BaseDatabaseOperations(object):
         """
         return cursor.lastrowid
 
+    def estimated_row_count(self, cursor, table_name):
+        """
+        Returns the approximate number of rows in the given table according
+        to the statistics kept by the database, without counting them, or
+        None if no estimate is available.
+        """
+        return None
+
     def lookup_cast(self, lookup_type):
         """
         Returns the string to use in a query when performing lookups
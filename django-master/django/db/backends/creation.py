@@ -1,4 +1,5 @@
 import hashlib
+import inspect
 import sys
 import time
 
@@ -340,16 +341,27 @@ class BaseDatabaseCreation(object):
             ";",
         ]
 
-    def create_test_db(self, verbosity=1, autoclobber=False, serialize=True, keepdb=False):
+    def create_test_db(self, verbosity=1, autoclobber=False, serialize=True, keepdb=False,
+                       migrated_template=False):
         """
         Creates a test database, prompting the user for confirmation if the
         database already exists. Returns the name of the test database created.
+
+        If migrated_template is True and the backend can clone databases, the
+        migrated database is kept as a template, named after the fingerprint
+        of the migrations and models, and test databases are copied from this
+        template rather than migrated as long as the fingerprint is unchanged.
         """
         # Don't import django.core.management if it isn't needed.
         from django.core.management import call_command
 
         test_database_name = self._get_test_db_name()
 
+        template_name = None
+        if migrated_template and not keepdb and self.connection.features.can_clone_databases:
+            template_name = self._get_test_db_template_name(self.test_db_fingerprint())
+        use_template = template_name is not None and self._test_db_template_exists(template_name)
+
         if verbosity >= 1:
             test_db_repr = ''
             action = 'Creating'
@@ -357,6 +369,8 @@ class BaseDatabaseCreation(object):
                 test_db_repr = " ('%s')" % test_database_name
             if keepdb:
                 action = "Using existing"
+            if use_template:
+                test_db_repr += " from its migrated template"
 
             print("%s test database for alias '%s'%s..." % (
                 action, self.connection.alias, test_db_repr))
@@ -372,18 +386,27 @@ class BaseDatabaseCreation(object):
         settings.DATABASES[self.connection.alias]["NAME"] = test_database_name
         self.connection.settings_dict["NAME"] = test_database_name
 
-        self._create_test_db_pre_migrate_sql()
-
-        # We report migrate messages at one level lower than that requested.
-        # This ensures we don't get flooded with messages during testing
-        # (unless you really ask to be flooded).
-        call_command(
-            'migrate',
-            verbosity=max(verbosity - 1, 0),
-            interactive=False,
-            database=self.connection.alias,
-            test_flush=True,
-        )
+        if use_template:
+            self._copy_test_db_template(template_name, verbosity)
+        else:
+            self._create_test_db_pre_migrate_sql()
+
+            # We report migrate messages at one level lower than that requested.
+            # This ensures we don't get flooded with messages during testing
+            # (unless you really ask to be flooded).
+            call_command(
+                'migrate',
+                verbosity=max(verbosity - 1, 0),
+                interactive=False,
+                database=self.connection.alias,
+                test_flush=True,
+            )
+
+            if template_name is not None:
+                if verbosity >= 1:
+                    print("Saving migrated template of test database for alias '%s'..." % (
+                        self.connection.alias))
+                self._save_test_db_template(template_name, verbosity)
 
         # We then serialize the current state of the database into a string
         # and store it on the connection. This slightly horrific process is so people
@@ -445,6 +468,22 @@ class BaseDatabaseCreation(object):
         for obj in serializers.deserialize("json", data, using=self.connection.alias):
             obj.save()
 
+    def snapshot_test_db(self):
+        """
+        Saves the contents of the test database, so that restore_test_db()
+        can bring it back to this state. Does nothing unless the backend
+        supports it.
+        """
+        pass
+
+    def restore_test_db(self):
+        """
+        Restores the contents of the tables of the installed models, as saved
+        by snapshot_test_db(). Returns False if the database couldn't be
+        restored, e.g. because there's no snapshot.
+        """
+        return False
+
     def _get_test_db_name(self):
         """
         Internal implementation - returns the name of the test DB that will be
@@ -503,13 +542,126 @@ class BaseDatabaseCreation(object):
 
         return test_database_name
 
-    def destroy_test_db(self, old_database_name, verbosity=1, keepdb=False):
+    def test_db_fingerprint(self):
+        """
+        Returns a hash of the migrations on disk and of the models of the
+        installed apps. A freshly migrated test database only depends on them,
+        except for the data that migrations and post_migrate handlers load
+        from elsewhere, e.g. initial_data fixtures.
+        """
+        import django
+        from django.db.migrations.loader import MigrationLoader
+        from django.db.migrations.state import ModelState
+        from django.db.migrations.writer import MigrationWriter
+
+        def serialize(value):
+            try:
+                return MigrationWriter.serialize(value)[0]
+            except ValueError:
+                return repr(value)
+
+        digest = hashlib.md5()
+        digest.update(force_bytes(django.get_version()))
+        loader = MigrationLoader(None)
+        for key in sorted(loader.disk_migrations):
+            module = sys.modules[loader.disk_migrations[key].__module__]
+            try:
+                source = inspect.getsource(module)
+            except (IOError, TypeError):
+                # The source of the migration isn't available, only its name
+                # is taken into account.
+                source = ''
+            digest.update(force_bytes('%s.%s\n%s' % (key[0], key[1], source)))
+        for model in apps.get_models(include_auto_created=True):
+            model_state = ModelState.from_model(model)
+            digest.update(force_bytes('%s.%s\n' % (model_state.app_label, model_state.name)))
+            for name, field in model_state.fields:
+                digest.update(force_bytes('%s=%s\n' % (name, serialize(field))))
+            digest.update(force_bytes(serialize(model_state.options)))
+            digest.update(force_bytes(serialize(model_state.bases)))
+        return digest.hexdigest()
+
+    def _get_test_db_template_name(self, fingerprint):
+        """
+        Internal implementation - returns the name of the migrated template of
+        the test database for the given fingerprint, or None if the test
+        database can't have a template.
+        """
+        return '%s_template_%s' % (self._get_test_db_name(), fingerprint[:12])
+
+    def _test_db_template_exists(self, template_name):
+        """
+        Internal implementation - returns whether the given template exists.
+        """
+        raise NotImplementedError(
+            'subclasses of BaseDatabaseCreation that can clone databases must '
+            'provide a _test_db_template_exists() method')
+
+    def _copy_test_db_template(self, template_name, verbosity):
+        """
+        Internal implementation - replaces the test database, which has just
+        been created, by a copy of the given template.
+        """
+        raise NotImplementedError(
+            'subclasses of BaseDatabaseCreation that can clone databases must '
+            'provide a _copy_test_db_template() method')
+
+    def _save_test_db_template(self, template_name, verbosity):
+        """
+        Internal implementation - copies the migrated test database to the
+        given template and removes the templates for other fingerprints.
+        """
+        raise NotImplementedError(
+            'subclasses of BaseDatabaseCreation that can clone databases must '
+            'provide a _save_test_db_template() method')
+
+    def clone_test_db(self, number, verbosity=1, keepdb=False):
+        """
+        Clones the test database, created by create_test_db(), for the given
+        worker of the parallel test runner.
+        """
+        if verbosity >= 1:
+            test_db_repr = ''
+            action = 'Cloning'
+            if verbosity >= 2:
+                test_db_repr = " ('%s')" % self.get_test_db_clone_settings(number)['NAME']
+            if keepdb:
+                action = 'Using existing clone of'
+            print("%s test database for alias '%s'%s..." % (
+                action, self.connection.alias, test_db_repr))
+
+        # As in create_test_db(), the keepdb param handles the case where
+        # the clone doesn't exist yet.
+        self._clone_test_db(number, verbosity, keepdb)
+
+    def get_test_db_clone_settings(self, number):
+        """
+        Returns the settings dict of the connection to the given clone of
+        the test database.
+        """
+        settings_dict = self.connection.settings_dict.copy()
+        settings_dict['NAME'] = '%s_%d' % (settings_dict['NAME'], number)
+        return settings_dict
+
+    def _clone_test_db(self, number, verbosity, keepdb=False):
+        """
+        Internal implementation - duplicates the test db tables.
+        """
+        raise NotImplementedError(
+            "The database backend doesn't support cloning databases. "
+            "Disable the option to run tests in parallel processes.")
+
+    def destroy_test_db(self, old_database_name, verbosity=1, keepdb=False, number=None):
         """
         Destroy a test database, prompting the user for confirmation if the
-        database already exists.
+        database already exists. If number is given, destroys that clone of
+        the test database instead.
         """
         self.connection.close()
-        test_database_name = self.connection.settings_dict['NAME']
+        if number is None:
+            test_database_name = self.connection.settings_dict['NAME']
+        else:
+            test_database_name = self.get_test_db_clone_settings(number)['NAME']
         if verbosity >= 1:
             test_db_repr = ''
             action = 'Destroying'
@@ -517,6 +669,8 @@ class BaseDatabaseCreation(object):
                 test_db_repr = " ('%s')" % test_database_name
             if keepdb:
                 action = 'Preserving'
+            if number is not None:
+                action += ' clone of'
             print("%s test database for alias '%s'%s..." % (
                 action, self.connection.alias, test_db_repr))
 
@@ -51,6 +51,7 @@ class DatabaseFeatures(BaseDatabaseFeatures):
     has_select_for_update = True
     has_select_for_update_nowait = True
     has_bulk_insert = True
+    can_clone_databases = True
     uses_savepoints = True
     can_release_savepoints = True
     supports_tablespaces = True
@@ -1,3 +1,5 @@
+import sys
+
 from django.db.backends.creation import BaseDatabaseCreation
 from django.db.backends.utils import truncate_name
 
@@ -48,6 +50,70 @@ class DatabaseCreation(BaseDatabaseCreation):
             return "WITH ENCODING '%s'" % test_settings['CHARSET']
         return ''
 
+    def _clone_test_db(self, number, verbosity, keepdb=False):
+        # A database can't be used as a template while other sessions are
+        # connected to it.
+        self.connection.close()
+        qn = self.connection.ops.quote_name
+        source_database_name = self.connection.settings_dict['NAME']
+        target_database_name = self.get_test_db_clone_settings(number)['NAME']
+        create_sql = "CREATE DATABASE %s WITH TEMPLATE %s" % (
+            qn(target_database_name), qn(source_database_name))
+        with self._nodb_connection.cursor() as cursor:
+            try:
+                cursor.execute(create_sql)
+            except Exception:
+                if keepdb:
+                    return
+                try:
+                    if verbosity >= 1:
+                        print("Destroying old test database '%s'..." % target_database_name)
+                    cursor.execute("DROP DATABASE %s" % qn(target_database_name))
+                    cursor.execute(create_sql)
+                except Exception as e:
+                    sys.stderr.write("Got an error cloning the test database: %s\n" % e)
+                    sys.exit(2)
+
+    def _test_db_template_exists(self, template_name):
+        with self._nodb_connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_catalog.pg_database WHERE datname = %s", [template_name])
+            return cursor.fetchone() is not None
+
+    def _copy_test_db_template(self, template_name, verbosity):
+        self.connection.close()
+        qn = self.connection.ops.quote_name
+        test_database_name = self.connection.settings_dict['NAME']
+        with self._nodb_connection.cursor() as cursor:
+            try:
+                cursor.execute("DROP DATABASE %s" % qn(test_database_name))
+                cursor.execute("CREATE DATABASE %s WITH TEMPLATE %s" % (
+                    qn(test_database_name), qn(template_name)))
+            except Exception as e:
+                sys.stderr.write("Got an error copying the template of the test database: %s\n" % e)
+                sys.exit(2)
+
+    def _save_test_db_template(self, template_name, verbosity):
+        # A database can't be used as a template while other sessions are
+        # connected to it.
+        self.connection.close()
+        qn = self.connection.ops.quote_name
+        test_database_name = self.connection.settings_dict['NAME']
+        with self._nodb_connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT datname FROM pg_catalog.pg_database WHERE datname LIKE %s",
+                [test_database_name.replace('_', r'\_') + r'\_template\_%'])
+            for old_template_name, in cursor.fetchall():
+                if old_template_name != template_name:
+                    if verbosity >= 2:
+                        print("Removing old template '%s'..." % old_template_name)
+                    cursor.execute("DROP DATABASE %s" % qn(old_template_name))
+            try:
+                cursor.execute("CREATE DATABASE %s WITH TEMPLATE %s" % (
+                    qn(template_name), qn(test_database_name)))
+            except Exception as e:
+                sys.stderr.write("Got an error saving the template of the test database: %s\n" % e)
+                sys.exit(2)
+
     def sql_indexes_for_field(self, model, f, style):
         output = []
         db_type = f.db_type(connection=self.connection)
@@ -64,6 +64,17 @@ class DatabaseOperations(BaseDatabaseOperations):
     def deferrable_sql(self):
         return " DEFERRABLE INITIALLY DEFERRED"
 
+    def estimated_row_count(self, cursor, table_name):
+        # reltuples is maintained by VACUUM and ANALYZE for the planner. It's
+        # 0 (or -1 on PostgreSQL 14+) for tables that were never analyzed.
+        cursor.execute(
+            "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+            [self.quote_name(table_name)])
+        row = cursor.fetchone()
+        if row is None or row[0] <= 0:
+            return None
+        return int(row[0])
+
     def lookup_cast(self, lookup_type):
         lookup = '%s'
 
@@ -97,6 +97,7 @@ class DatabaseFeatures(BaseDatabaseFeatures):
     # go.
     can_use_chunked_reads = False
     test_db_allows_multiple_connections = False
+    can_clone_databases = True
     supports_unspecified_pk = True
     supports_timezones = False
     supports_1000_query_parameters = False
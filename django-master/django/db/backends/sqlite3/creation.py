@@ -1,6 +1,11 @@
 import os
+import re
+import shutil
 import sys
 
+from django.conf import settings
+from django.core.management.color import no_style
+from django.db import DatabaseError, transaction
 from django.db.backends.creation import BaseDatabaseCreation
 from django.utils.six.moves import input
 
@@ -78,10 +83,149 @@ class DatabaseCreation(BaseDatabaseCreation):
                     sys.exit(1)
         return test_database_name
 
+    def get_test_db_clone_settings(self, number):
+        settings_dict = self.connection.settings_dict.copy()
+        # Forked worker processes get a copy of the in-memory database.
+        if settings_dict['NAME'] != ':memory:':
+            root, ext = os.path.splitext(settings_dict['NAME'])
+            settings_dict['NAME'] = '%s_%d%s' % (root, number, ext)
+        return settings_dict
+
+    def _clone_test_db(self, number, verbosity, keepdb=False):
+        source_database_name = self.connection.settings_dict['NAME']
+        target_database_name = self.get_test_db_clone_settings(number)['NAME']
+        if source_database_name == ':memory:':
+            return
+        if os.access(target_database_name, os.F_OK):
+            if keepdb:
+                return
+            if verbosity >= 1:
+                print("Destroying old test database '%s'..." % target_database_name)
+            try:
+                os.remove(target_database_name)
+            except Exception as e:
+                sys.stderr.write("Got an error deleting the old test database: %s\n" % e)
+                sys.exit(2)
+        self.connection.close()
+        try:
+            shutil.copy(source_database_name, target_database_name)
+        except Exception as e:
+            sys.stderr.write("Got an error cloning the test database: %s\n" % e)
+            sys.exit(2)
+
+    def _get_test_db_template_name(self, fingerprint):
+        test_database_name = self._get_test_db_name()
+        # An in-memory database doesn't outlive the test run.
+        if test_database_name == ':memory:':
+            return None
+        root, ext = os.path.splitext(test_database_name)
+        return '%s_template_%s%s' % (root, fingerprint[:12], ext)
+
+    def _test_db_template_exists(self, template_name):
+        return os.access(template_name, os.F_OK)
+
+    def _copy_test_db_template(self, template_name, verbosity):
+        self.connection.close()
+        try:
+            shutil.copy(template_name, self.connection.settings_dict['NAME'])
+        except Exception as e:
+            sys.stderr.write("Got an error copying the template of the test database: %s\n" % e)
+            sys.exit(2)
+
+    def _save_test_db_template(self, template_name, verbosity):
+        root, ext = os.path.splitext(self._get_test_db_name())
+        directory, prefix = os.path.split(root)
+        old_template_re = re.compile(r'%s_template_[0-9a-f]{12}%s$' % (re.escape(prefix), re.escape(ext)))
+        for filename in os.listdir(directory or os.curdir):
+            old_template_name = os.path.join(directory, filename)
+            if old_template_re.match(filename) and old_template_name != template_name:
+                if verbosity >= 2:
+                    print("Removing old template '%s'..." % old_template_name)
+                os.remove(old_template_name)
+        self.connection.close()
+        try:
+            shutil.copy(self.connection.settings_dict['NAME'], template_name)
+        except Exception as e:
+            sys.stderr.write("Got an error saving the template of the test database: %s\n" % e)
+            sys.exit(2)
+
+    def _get_test_db_snapshot_name(self, test_database_name):
+        # The snapshot of an in-memory database is kept in memory as well, in
+        # a database attached to the connection, which is never closed.
+        if test_database_name == ':memory:':
+            return ':memory:'
+        root, ext = os.path.splitext(test_database_name)
+        return '%s_snapshot%s' % (root, ext)
+
+    def snapshot_test_db(self):
+        test_database_name = self.connection.settings_dict['NAME']
+        snapshot_name = self._get_test_db_snapshot_name(test_database_name)
+        qn = self.connection.ops.quote_name
+        table_names = self.connection.introspection.django_table_names(
+            only_existing=True, include_views=False)
+        with self.connection.cursor() as cursor:
+            if snapshot_name == ':memory:':
+                if getattr(self.connection, '_test_snapshot_tables', None) is not None:
+                    cursor.execute("DETACH DATABASE django_snapshot")
+            elif os.access(snapshot_name, os.F_OK):
+                os.remove(snapshot_name)
+            self.connection._test_snapshot_tables = None
+            cursor.execute("ATTACH DATABASE %s AS django_snapshot", [snapshot_name])
+            try:
+                # Only the tables that contain rows are saved, usually those
+                # filled by post_migrate handlers.
+                snapshot_tables = set()
+                for table_name in table_names:
+                    cursor.execute("SELECT 1 FROM main.%s LIMIT 1" % qn(table_name))
+                    if cursor.fetchone() is not None:
+                        cursor.execute("CREATE TABLE django_snapshot.%s AS SELECT * FROM main.%s" % (
+                            qn(table_name), qn(table_name)))
+                        snapshot_tables.add(table_name)
+            except Exception:
+                cursor.execute("DETACH DATABASE django_snapshot")
+                raise
+            if snapshot_name != ':memory:':
+                cursor.execute("DETACH DATABASE django_snapshot")
+        self.connection._test_snapshot_tables = snapshot_tables
+        # The contents of the database depend on the installed apps and on
+        # the routers, e.g. through post_migrate handlers, as do the tables.
+        self.connection._test_snapshot_key = (tuple(settings.INSTALLED_APPS), frozenset(table_names))
+
+    def restore_test_db(self):
+        snapshot_tables = getattr(self.connection, '_test_snapshot_tables', None)
+        if snapshot_tables is None:
+            return False
+        table_names = self.connection.introspection.django_table_names(
+            only_existing=True, include_views=False)
+        if self.connection._test_snapshot_key != (tuple(settings.INSTALLED_APPS), frozenset(table_names)):
+            return False
+        snapshot_name = self._get_test_db_snapshot_name(self.connection.settings_dict['NAME'])
+        qn = self.connection.ops.quote_name
+        with self.connection.cursor() as cursor:
+            if snapshot_name != ':memory:':
+                cursor.execute("ATTACH DATABASE %s AS django_snapshot", [snapshot_name])
+            try:
+                with transaction.atomic(using=self.connection.alias):
+                    for sql in self.connection.ops.sql_flush(no_style(), table_names, []):
+                        cursor.execute(sql)
+                    for table_name in snapshot_tables.intersection(table_names):
+                        cursor.execute("INSERT INTO main.%s SELECT * FROM django_snapshot.%s" % (
+                            qn(table_name), qn(table_name)))
+            except DatabaseError:
+                # The schema of a table may have changed since the snapshot.
+                return False
+            finally:
+                if snapshot_name != ':memory:':
+                    cursor.execute("DETACH DATABASE django_snapshot")
+        return True
+
     def _destroy_test_db(self, test_database_name, verbosity):
         if test_database_name and test_database_name != ":memory:":
             # Remove the SQLite database file
             os.remove(test_database_name)
+            snapshot_name = self._get_test_db_snapshot_name(test_database_name)
+            if os.access(snapshot_name, os.F_OK):
+                os.remove(snapshot_name)
 
     def test_db_signature(self):
         """
@@ -27,7 +27,7 @@ __all__ = (
     'ModelForm', 'BaseModelForm', 'model_to_dict', 'fields_for_model',
     'save_instance', 'ModelChoiceField', 'ModelMultipleChoiceField',
     'ALL_FIELDS', 'BaseModelFormSet', 'modelformset_factory',
-    'BaseInlineFormSet', 'inlineformset_factory',
+    'BaseInlineFormSet', 'inlineformset_factory', 'SharedModelChoices',
 )
 
 ALL_FIELDS = '__all__'
@@ -552,6 +552,8 @@ class BaseModelFormSet(BaseFormSet):
     A ``FormSet`` for editing a queryset and/or adding new objects to it.
     """
     model = None
+    # Whether the ModelChoiceFields of the forms share their choices.
+    share_choices = True
 
     def __init__(self, data=None, files=None, auto_id='id_%s', prefix=None,
                  queryset=None, **kwargs):
@@ -808,6 +810,12 @@ class BaseModelFormSet(BaseFormSet):
                 widget = HiddenInput
             form.fields[self._pk_field.name] = ModelChoiceField(qs, initial=pk_value, required=False, widget=widget)
         super(BaseModelFormSet, self).add_fields(form, index)
+        if self.share_choices:
+            if not hasattr(self, '_shared_choices'):
+                self._shared_choices = SharedModelChoices()
+            for field in form.fields.values():
+                if isinstance(field, ModelChoiceField):
+                    field.shared_choices = self._shared_choices
 
 
 def modelformset_factory(model, form=ModelForm, formfield_callback=None,
@@ -1072,6 +1080,48 @@ class InlineForeignKeyField(Field):
         return False
 
 
+class SharedModelChoices(object):
+    """
+    Holds the choices of the ModelChoiceFields of several forms, e.g. the
+    forms of a formset, so that each queryset is evaluated once and the
+    options of the widgets displaying the same choices are rendered once.
+
+    Querysets are identified by their SQL, so a field whose queryset was
+    changed, e.g. in the __init__() method of a form, doesn't share the
+    choices of the other fields.
+    """
+    def __init__(self):
+        self._entries = {}
+
+    def _get_key(self, field):
+        from django.db.models.sql.datastructures import EmptyResultSet
+        queryset = field.queryset
+        try:
+            sql, params = queryset.query.get_compiler(queryset.db).as_sql()
+        except EmptyResultSet:
+            sql, params = None, ()
+        return (type(field), field.to_field_name, queryset.db, sql, repr(params),
+                repr(queryset._prefetch_related_lookups))
+
+    def get(self, field, load=True):
+        """
+        Returns a dictionary holding the ``choices`` of the field, without
+        its empty label, the objects of its queryset by prepared value
+        (``objects``) and the ``rendered`` options of widgets. If the choices
+        haven't been loaded yet, returns None unless load is True.
+        """
+        key = self._get_key(field)
+        entry = self._entries.get(key)
+        if entry is None and load:
+            choices, objects = [], {}
+            for obj in field.queryset.all():
+                choice = (field.prepare_value(obj), field.label_from_instance(obj))
+                choices.append(choice)
+                objects[force_text(choice[0])] = obj
+            entry = self._entries[key] = {'choices': choices, 'objects': objects, 'rendered': {}}
+        return entry
+
+
 class ModelChoiceIterator(object):
     def __init__(self, field):
         self.field = field
@@ -1080,7 +1130,10 @@ class ModelChoiceIterator(object):
     def __iter__(self):
         if self.field.empty_label is not None:
             yield ("", self.field.empty_label)
-        if self.field.cache_choices:
+        if self.field.shared_choices is not None:
+            for choice in self.field.shared_choices.get(self.field)['choices']:
+                yield choice
+        elif self.field.cache_choices:
             if self.field.choice_cache is None:
                 self.field.choice_cache = [
                     self.choice(obj) for obj in self.queryset.all()
@@ -1092,8 +1145,25 @@ class ModelChoiceIterator(object):
                 yield self.choice(obj)
 
     def __len__(self):
-        return (len(self.queryset) +
-            (1 if self.field.empty_label is not None else 0))
+        if self.field.shared_choices is not None:
+            length = len(self.field.shared_choices.get(self.field)['choices'])
+        else:
+            length = len(self.queryset)
+        return length + (1 if self.field.empty_label is not None else 0)
+
+    @property
+    def rendered_options(self):
+        """
+        A dictionary in which widgets may store the options they render for
+        these choices, if they are shared with other fields, or None.
+        """
+        if self.field.shared_choices is None:
+            return None
+        rendered = self.field.shared_choices.get(self.field)['rendered']
+        empty_label = self.field.empty_label
+        if empty_label is not None:
+            empty_label = force_text(empty_label)
+        return rendered.setdefault(empty_label, {})
 
     def choice(self, obj):
         return (self.field.prepare_value(obj), self.field.label_from_instance(obj))
@@ -1132,6 +1202,8 @@ class ModelChoiceField(ChoiceField):
         self.limit_choices_to = limit_choices_to   # limit the queryset later.
         self.choice_cache = None
         self.to_field_name = to_field_name
+        # A SharedModelChoices instance, set e.g. by model formsets.
+        self.shared_choices = None
 
     def __deepcopy__(self, memo):
         result = super(ChoiceField, self).__deepcopy__(memo)
@@ -1186,6 +1258,11 @@ class ModelChoiceField(ChoiceField):
     def to_python(self, value):
         if value in self.empty_values:
             return None
+        if self.shared_choices is not None:
+            # Avoid a query if the choices have already been loaded.
+            entry = self.shared_choices.get(self, load=False)
+            if entry is not None and force_text(value) in entry['objects']:
+                return entry['objects'][force_text(value)]
         try:
             key = self.to_field_name or 'pk'
             value = self.queryset.get(**{key: value})
@@ -10,8 +10,9 @@ except ImportError:  # Python 2
 
 from django.conf import settings
 from django.utils.encoding import force_text, python_2_unicode_compatible
-from django.utils.html import format_html, format_html_join, escape
+from django.utils.html import conditional_escape, format_html, format_html_join, escape
 from django.utils import timezone
+from django.utils.safestring import mark_safe
 from django.utils.translation import ugettext_lazy as _
 from django.utils import six
 
@@ -29,18 +30,15 @@ def flatatt(attrs):
 
     The result is passed through 'mark_safe'.
     """
-    boolean_attrs = []
-    for attr, value in list(attrs.items()):
+    key_value_attrs, boolean_attrs = [], []
+    # Build the output in a single pass, as this is called for every
+    # rendered widget.
+    for attr, value in sorted(attrs.items()):
         if value is True:
-            boolean_attrs.append((attr,))
-            del attrs[attr]
-        elif value is False:
-            del attrs[attr]
-
-    return (
-        format_html_join('', ' {0}="{1}"', sorted(attrs.items())) +
-        format_html_join('', ' {0}', sorted(boolean_attrs))
-    )
+            boolean_attrs.append(' %s' % conditional_escape(attr))
+        elif value is not False:
+            key_value_attrs.append(' %s="%s"' % (conditional_escape(attr), conditional_escape(value)))
+    return mark_safe(''.join(key_value_attrs + boolean_attrs))
 
 
 @python_2_unicode_compatible
@@ -537,6 +537,22 @@ class Select(Widget):
     def render_options(self, choices, selected_choices):
         # Normalize to strings.
         selected_choices = set(force_text(v) for v in selected_choices)
+        rendered_options = getattr(self.choices, 'rendered_options', None)
+        if rendered_options is not None and not choices:
+            # The choices are shared with other widgets, e.g. in the forms of
+            # a model formset, so only the selected options are rendered.
+            options = rendered_options.get(type(self))
+            if options is None:
+                options = rendered_options[type(self)] = [
+                    (force_text(option_value), option_value, option_label,
+                     self.render_option(set(), option_value, option_label))
+                    for option_value, option_label in self.choices
+                ]
+            return '\n'.join(
+                self.render_option(selected_choices, option_value, option_label)
+                if value in selected_choices else html
+                for value, option_value, option_label, html in options
+            )
         output = []
         for option_value, option_label in chain(self.choices, choices):
             if isinstance(option_label, (list, tuple)):
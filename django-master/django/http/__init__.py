@@ -2,7 +2,7 @@ from django.http.cookie import SimpleCookie, parse_cookie
 from django.http.request import (HttpRequest, QueryDict,
     RawPostDataException, UnreadablePostError, build_request_repr)
 from django.http.response import (HttpResponse, StreamingHttpResponse,
-    HttpResponseRedirect, HttpResponsePermanentRedirect,
+    FileResponse, HttpResponseRedirect, HttpResponsePermanentRedirect,
     HttpResponseNotModified, HttpResponseBadRequest, HttpResponseForbidden,
     HttpResponseNotFound, HttpResponseNotAllowed, HttpResponseGone,
     HttpResponseServerError, Http404, BadHeaderError, JsonResponse)
@@ -11,7 +11,8 @@ from django.http.utils import fix_location_header, conditional_content_removal
 __all__ = [
     'SimpleCookie', 'parse_cookie', 'HttpRequest', 'QueryDict',
     'RawPostDataException', 'UnreadablePostError', 'build_request_repr',
-    'HttpResponse', 'StreamingHttpResponse', 'HttpResponseRedirect',
+    'HttpResponse', 'StreamingHttpResponse', 'FileResponse',
+    'HttpResponseRedirect',
     'HttpResponsePermanentRedirect', 'HttpResponseNotModified',
     'HttpResponseBadRequest', 'HttpResponseForbidden', 'HttpResponseNotFound',
     'HttpResponseNotAllowed', 'HttpResponseGone', 'HttpResponseServerError',
@@ -12,7 +12,6 @@ import cgi
 import sys
 
 from django.conf import settings
-from django.core.exceptions import SuspiciousMultipartForm
 from django.utils.datastructures import MultiValueDict
 from django.utils.encoding import force_text
 from django.utils import six
@@ -137,14 +136,18 @@ class MultiPartParser(object):
         self._files = MultiValueDict()
 
         # Instantiate the parser and stream:
-        stream = LazyStream(ChunkIter(self._input_data, self._chunk_size))
+        stream = MultiPartBuffer(self._input_data, self._boundary, self._chunk_size)
 
         # Whether or not to signal a file-completion at the beginning of the loop.
         old_field_name = None
         counters = [0] * len(handlers)
+        # accepts_memoryview isn't inherited: a subclass which overrides
+        # receive_data_chunk() may not expect memoryviews.
+        accepts_memoryview = [type(handler).__dict__.get('accepts_memoryview', False)
+                              for handler in handlers]
 
         try:
-            for item_type, meta_data, field_stream in Parser(stream, self._boundary):
+            for item_type, meta_data, field_stream in stream.parts():
                 if old_field_name:
                     # We run this at the beginning of the next loop
                     # since we cannot be sure a file is complete until
@@ -209,7 +212,7 @@ class MultiPartParser(object):
                                 # We should always decode base64 chunks by multiple of 4,
                                 # ignoring whitespace.
 
-                                stripped_chunk = b"".join(chunk.split())
+                                stripped_chunk = b"".join(chunk.tobytes().split())
 
                                 remaining = len(stripped_chunk) % 4
                                 while remaining != 0:
@@ -225,6 +228,8 @@ class MultiPartParser(object):
                                     six.reraise(MultiPartParserError, MultiPartParserError(msg), sys.exc_info()[2])
 
                             for i, handler in enumerate(handlers):
+                                if isinstance(chunk, memoryview) and not accepts_memoryview[i]:
+                                    chunk = chunk.tobytes()
                                 chunk_length = len(chunk)
                                 chunk = handler.receive_data_chunk(chunk,
                                                                    counters[i])
@@ -243,6 +248,9 @@ class MultiPartParser(object):
                 else:
                     # If this is neither a FIELD or a FILE, just exhaust the stream.
                     exhaust(stream)
+            if old_field_name and stream.finished:
+                # The last file is complete if the closing boundary was found.
+                self.handle_file_complete(old_field_name, counters)
         except StopUpload as e:
             self._close_files()
             if not e.connection_reset:
@@ -285,116 +293,204 @@ class MultiPartParser(object):
                 handler.file.close()
 
 
-class LazyStream(six.Iterator):
+class MultiPartBuffer(six.Iterator):
     """
-    The LazyStream wrapper allows one to get and "unget" bytes from a stream.
+    Reads a multipart body from a file-like object and splits it into parts.
 
-    Given a producer object (an iterator that yields bytestrings), the
-    LazyStream object will support iteration, reading, and keeping a "look-back"
-    variable in case you need to "unget" some bytes.
-    """
-    def __init__(self, producer, length=None):
-        """
-        Every LazyStream must have a producer when instantiated.
-
-        A producer is an iterable that returns a string each time it
-        is called.
-        """
-        self._producer = producer
-        self._empty = False
-        self._leftover = b''
-        self.length = length
-        self.position = 0
-        self._remaining = length
-        self._unget_history = []
-
-    def tell(self):
-        return self.position
-
-    def read(self, size=None):
-        def parts():
-            remaining = self._remaining if size is None else size
-            # do the whole thing in one shot if no limit was provided.
-            if remaining is None:
-                yield b''.join(self)
-                return
-
-            # otherwise do some bookkeeping to return exactly enough
-            # of the stream and stashing any extra content we get from
-            # the producer
-            while remaining != 0:
-                assert remaining > 0, 'remaining bytes to read should never go negative'
+    The body is read in ``chunk_size`` chunks into a single bytearray, which
+    is reused for the whole body: data is appended to its end as it's read
+    and dropped from its start once it's been consumed. Boundaries are
+    searched with ``bytearray.find()``, without scanning the same bytes
+    twice, and the content of the parts is returned as memoryview slices of
+    the buffer rather than copied.
 
-                chunk = next(self)
-
-                emitting = chunk[:remaining]
-                self.unget(chunk[remaining:])
-                remaining -= len(emitting)
-                yield emitting
+    Iterating over a MultiPartBuffer yields the unconsumed data as bytes.
+    """
+    def __init__(self, flo, boundary, chunk_size=64 * 1024):
+        self._flo = flo
+        self._chunk_size = chunk_size
+        self._separator = b'--' + boundary
+        self._buffer = bytearray()
+        self._pos = 0
+        self._eof = False
+        # Whether the closing boundary was found.
+        self.finished = False
 
-        out = b''.join(parts())
-        return out
+    def __iter__(self):
+        return self
 
     def __next__(self):
-        """
-        Used when the exact number of bytes to read is unimportant.
+        if self._pos == len(self._buffer) and not self._fill():
+            raise StopIteration()
+        data = bytes(self._buffer[self._pos:])
+        self._pos = len(self._buffer)
+        return data
 
-        This procedure just returns whatever is chunk is conveniently returned
-        from the iterator instead. Useful to avoid unnecessary bookkeeping if
-        performance is an issue.
+    def _fill(self):
         """
-        if self._leftover:
-            output = self._leftover
-            self._leftover = b''
-        else:
-            output = next(self._producer)
-            self._unget_history = []
-        self.position += len(output)
-        return output
-
-    def close(self):
+        Reads the next chunk of the input into the buffer and drops the data
+        already consumed. Returns False if the input is exhausted.
         """
-        Used to invalidate/disable this lazy stream.
-
-        Replaces the producer with an empty list. Any leftover bytes that have
-        already been read will still be reported upon read() and/or next().
+        if self._eof:
+            return False
+        try:
+            data = self._flo.read(self._chunk_size)
+        except InputStreamExhausted:
+            data = b''
+        if not data:
+            self._eof = True
+            return False
+        try:
+            del self._buffer[:self._pos]
+            self._buffer += data
+        except BufferError:
+            # A memoryview of the buffer is still in use, so it can't be
+            # resized. Leave it to its user and start a new one.
+            self._buffer = self._buffer[self._pos:] + data
+        self._pos = 0
+        return True
+
+    def _find(self, sub, max_size):
         """
-        self._producer = []
-
-    def __iter__(self):
-        return self
-
-    def unget(self, bytes):
+        Returns the offset of sub from the current position, reading the
+        input as needed, or -1 if it isn't within the next max_size bytes.
+        """
+        searched = 0
+        while True:
+            index = self._buffer.find(sub, self._pos + searched)
+            if index >= 0:
+                return index - self._pos if index - self._pos <= max_size else -1
+            # The bytes before the last len(sub) - 1 don't start sub.
+            searched = max(searched, len(self._buffer) - self._pos - len(sub) + 1)
+            if searched > max_size or not self._fill():
+                return -1
+
+    def _skip_past(self, sub):
         """
-        Places bytes back onto the front of the lazy stream.
+        Consumes the data up to and including sub. Returns False if the input
+        is exhausted first.
+        """
+        while True:
+            index = self._buffer.find(sub, self._pos)
+            if index >= 0:
+                self._pos = index + len(sub)
+                return True
+            self._pos = max(self._pos, len(self._buffer) - len(sub) + 1)
+            if not self._fill():
+                return False
+
+    def _read_part(self):
+        """
+        Yields the content of the current part as memoryviews of at most
+        chunk_size bytes, and consumes the boundary that ends it.
 
-        Future calls to read() will return those bytes first. The
-        stream position and thus tell() will be rewound.
+        Each memoryview is released when the next one is requested, when the
+        Python version allows it, so that the buffer may be reused.
         """
-        if not bytes:
-            return
-        self._update_unget_history(len(bytes))
-        self.position -= len(bytes)
-        self._leftover = b''.join([bytes, self._leftover])
+        separator = self._separator
+        while True:
+            buffer = self._buffer
+            index = buffer.find(separator, self._pos)
+            if index >= 0:
+                # The line break before the boundary isn't part of the
+                # content. It's usually a CRLF, but a bare LF is accepted.
+                end = index
+                if end > self._pos and buffer[end - 1:end] == b'\n':
+                    end -= 1
+                if end > self._pos and buffer[end - 1:end] == b'\r':
+                    end -= 1
+                if end == self._pos:
+                    self._pos = index + len(separator)
+                    return
+            elif self._eof:
+                end = len(buffer)
+            else:
+                # Keep the bytes that may start a boundary and the line break
+                # that precedes it.
+                end = len(buffer) - len(separator) - 1
+            end = min(end, self._pos + self._chunk_size)
+            if end > self._pos:
+                view = memoryview(buffer)[self._pos:end]
+                self._pos = end
+                try:
+                    yield view
+                finally:
+                    if hasattr(view, 'release'):
+                        try:
+                            view.release()
+                        except BufferError:
+                            pass
+            elif self._eof:
+                return
+            else:
+                self._fill()
 
-    def _update_unget_history(self, num_bytes):
+    def parts(self, max_header_size=1024):
         """
-        Updates the unget history as a sanity check to see if we've pushed
-        back the same number of bytes in one chunk. If we keep ungetting the
-        same number of bytes many times (here, 50), we're mostly likely in an
-        infinite loop of some sort. This is usually caused by a
-        maliciously-malformed MIME request.
+        Yields a (item_type, meta_data, part_stream) tuple for each part of
+        the body. The headers of a part must fit within max_header_size bytes.
+        If the headers of a part can't be found or parsed, it's returned as
+        RAW along with its headers.
         """
-        self._unget_history = [num_bytes] + self._unget_history[:49]
-        number_equal = len([current_number for current_number in self._unget_history
-                            if current_number == num_bytes])
+        if not self._skip_past(self._separator):
+            return
+        while True:
+            while len(self._buffer) - self._pos < 2 and self._fill():
+                pass
+            if self._buffer[self._pos:self._pos + 2] == b'--':
+                self.finished = True
+                return
+            if self._pos == len(self._buffer):
+                return
+            header_end = self._find(b'\r\n\r\n', max_header_size)
+            if header_end == -1:
+                item_type, meta_data = RAW, {}
+            else:
+                header = bytes(self._buffer[self._pos:self._pos + header_end])
+                item_type, meta_data = parse_part_headers(header)
+                if item_type != RAW:
+                    self._pos += header_end + 4
+            part = PartStream(self._read_part())
+            yield item_type, meta_data, part
+            exhaust(part)
 
-        if number_equal > 40:
-            raise SuspiciousMultipartForm(
-                "The multipart parser got stuck, which shouldn't happen with"
-                " normal uploaded files. Check for malicious upload activity;"
-                " if there is none, report this to the Django developers."
-            )
+
+class PartStream(six.Iterator):
+    """
+    The content of a part of a multipart body.
+
+    Iterating over a PartStream yields memoryviews, which are only valid until
+    the next one is requested. read() returns bytes.
+    """
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._leftover = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._leftover is not None:
+            chunk, self._leftover = self._leftover, None
+            return chunk
+        return next(self._chunks)
+
+    def read(self, size=None):
+        parts = []
+        if size is None:
+            for chunk in self:
+                parts.append(chunk.tobytes())
+        else:
+            while size > 0:
+                try:
+                    chunk = next(self)
+                except StopIteration:
+                    break
+                if len(chunk) > size:
+                    chunk, self._leftover = chunk[:size], chunk[size:]
+                parts.append(chunk.tobytes())
+                size -= len(chunk)
+        return b''.join(parts)
 
 
 class ChunkIter(six.Iterator):
@@ -421,121 +517,6 @@ class ChunkIter(six.Iterator):
         return self
 
 
-class InterBoundaryIter(six.Iterator):
-    """
-    A Producer that will iterate over boundaries.
-    """
-    def __init__(self, stream, boundary):
-        self._stream = stream
-        self._boundary = boundary
-
-    def __iter__(self):
-        return self
-
-    def __next__(self):
-        try:
-            return LazyStream(BoundaryIter(self._stream, self._boundary))
-        except InputStreamExhausted:
-            raise StopIteration()
-
-
-class BoundaryIter(six.Iterator):
-    """
-    A Producer that is sensitive to boundaries.
-
-    Will happily yield bytes until a boundary is found. Will yield the bytes
-    before the boundary, throw away the boundary bytes themselves, and push the
-    post-boundary bytes back on the stream.
-
-    The future calls to next() after locating the boundary will raise a
-    StopIteration exception.
-    """
-
-    def __init__(self, stream, boundary):
-        self._stream = stream
-        self._boundary = boundary
-        self._done = False
-        # rollback an additional six bytes because the format is like
-        # this: CRLF<boundary>[--CRLF]
-        self._rollback = len(boundary) + 6
-
-        # Try to use mx fast string search if available. Otherwise
-        # use Python find. Wrap the latter for consistency.
-        unused_char = self._stream.read(1)
-        if not unused_char:
-            raise InputStreamExhausted()
-        self._stream.unget(unused_char)
-
-    def __iter__(self):
-        return self
-
-    def __next__(self):
-        if self._done:
-            raise StopIteration()
-
-        stream = self._stream
-        rollback = self._rollback
-
-        bytes_read = 0
-        chunks = []
-        for bytes in stream:
-            bytes_read += len(bytes)
-            chunks.append(bytes)
-            if bytes_read > rollback:
-                break
-            if not bytes:
-                break
-        else:
-            self._done = True
-
-        if not chunks:
-            raise StopIteration()
-
-        chunk = b''.join(chunks)
-        boundary = self._find_boundary(chunk, len(chunk) < self._rollback)
-
-        if boundary:
-            end, next = boundary
-            stream.unget(chunk[next:])
-            self._done = True
-            return chunk[:end]
-        else:
-            # make sure we don't treat a partial boundary (and
-            # its separators) as data
-            if not chunk[:-rollback]:  # and len(chunk) >= (len(self._boundary) + 6):
-                # There's nothing left, we should just return and mark as done.
-                self._done = True
-                return chunk
-            else:
-                stream.unget(chunk[-rollback:])
-                return chunk[:-rollback]
-
-    def _find_boundary(self, data, eof=False):
-        """
-        Finds a multipart boundary in data.
-
-        Should no boundary exist in the data None is returned instead. Otherwise
-        a tuple containing the indices of the following are returned:
-
-         * the end of current encapsulation
-         * the start of the next encapsulation
-        """
-        index = data.find(self._boundary)
-        if index < 0:
-            return None
-        else:
-            end = index
-            next = index + len(self._boundary)
-            # backup over CRLF
-            last = max(0, end - 1)
-            if data[last:last + 1] == b'\n':
-                end -= 1
-            last = max(0, end - 1)
-            if data[last:last + 1] == b'\r':
-                end -= 1
-            return end, next
-
-
 def exhaust(stream_or_iterable):
     """
     Completely exhausts an iterator or stream.
@@ -555,20 +536,10 @@ def exhaust(stream_or_iterable):
         pass
 
 
-def parse_boundary_stream(stream, max_header_size):
+def parse_part_headers(header):
     """
-    Parses one and exactly one stream that encapsulates a boundary.
+    Parses the headers of a part. Returns a (item_type, meta_data) tuple.
     """
-    # Stream at beginning of header, look for end of header
-    # and parse it if found. The header must fit within one
-    # chunk.
-    chunk = stream.read(max_header_size)
-
-    # 'find' returns the top of these four bytes, so we'll
-    # need to munch them later to prevent them from polluting
-    # the payload.
-    header_end = chunk.find(b'\r\n\r\n')
-
     def _parse_header(line):
         main_value_pair, params = parse_header(line)
         try:
@@ -577,18 +548,6 @@ def parse_boundary_stream(stream, max_header_size):
             raise ValueError("Invalid header: %r" % line)
         return name, (value, params)
 
-    if header_end == -1:
-        # we find no header, so we just mark this fact and pass on
-        # the stream verbatim
-        stream.unget(chunk)
-        return (RAW, {}, stream)
-
-    header = chunk[:header_end]
-
-    # here we place any excess chunk back onto the stream, as
-    # well as throwing away the CRLFCRLF bytes from above.
-    stream.unget(chunk[header_end + 4:])
-
     TYPE = RAW
     outdict = {}
 
@@ -608,22 +567,7 @@ def parse_boundary_stream(stream, max_header_size):
 
         outdict[name] = value, params
 
-    if TYPE == RAW:
-        stream.unget(chunk)
-
-    return (TYPE, outdict, stream)
-
-
-class Parser(object):
-    def __init__(self, stream, boundary):
-        self._stream = stream
-        self._separator = b'--' + boundary
-
-    def __iter__(self):
-        boundarystream = InterBoundaryIter(self._stream, self._separator)
-        for sub_stream in boundarystream:
-            # Iterate over each part
-            yield parse_boundary_stream(sub_stream, 1024)
+    return TYPE, outdict
 
 
 def parse_header(line):
@@ -2,7 +2,9 @@ from __future__ import unicode_literals
 
 import datetime
 import json
+import os
 import re
+import stat
 import sys
 import time
 from email.header import Header
@@ -402,6 +404,9 @@ class StreamingHttpResponse(HttpResponseBase):
 
     @streaming_content.setter
     def streaming_content(self, value):
+        self._set_streaming_content(value)
+
+    def _set_streaming_content(self, value):
         # Ensure we can never iterate on "value" more than once.
         self._iterator = iter(value)
         if hasattr(value, 'close'):
@@ -411,6 +416,46 @@ class StreamingHttpResponse(HttpResponseBase):
         return self.streaming_content
 
 
+class FileResponse(StreamingHttpResponse):
+    """
+    A streaming HTTP response class optimized for files.
+
+    The WSGI handler passes the file to the server's wsgi.file_wrapper when
+    there's one, which may send it with the operating system's sendfile(),
+    without reading it into Python.
+    """
+    block_size = 4096
+
+    def _set_streaming_content(self, value):
+        if hasattr(value, 'read'):
+            self.file_to_stream = filelike = value
+            if hasattr(filelike, 'close'):
+                self._closable_objects.append(filelike)
+            if 'Content-Length' not in self:
+                self._set_content_length(filelike)
+            value = iter(lambda: filelike.read(self.block_size), b'')
+        else:
+            self.file_to_stream = None
+        super(FileResponse, self)._set_streaming_content(value)
+
+    def _set_content_length(self, filelike):
+        """
+        Sets the Content-Length header to the number of bytes remaining in
+        filelike when it's a regular file.
+        """
+        if 'b' not in getattr(filelike, 'mode', 'b'):
+            # Text files may not read as many characters as they have bytes.
+            return
+        try:
+            statobj = os.fstat(filelike.fileno())
+            position = filelike.tell()
+        except (AttributeError, EnvironmentError, ValueError):
+            # The file-like object has no file descriptor.
+            return
+        if stat.S_ISREG(statobj.st_mode):
+            self['Content-Length'] = max(statobj.st_size - position, 0)
+
+
 class HttpResponseRedirectBase(HttpResponse):
     allowed_schemes = ['http', 'https', 'ftp']
 
@@ -0,0 +1,230 @@
+"""
+Compression Middleware.
+
+This module provides a middleware that compresses responses with the content
+codings accepted by the client, and a registry of the encoders implementing
+these content codings.
+"""
+from collections import OrderedDict
+import hashlib
+import re
+import zlib
+
+from django.core.cache import caches
+from django.utils.cache import patch_vary_headers
+from django.utils.encoding import force_bytes
+from django.utils.text import compress_sequence, compress_string
+
+
+class Encoder(object):
+    """
+    Base class for the implementations of a content coding.
+
+    Subclasses must set ``name`` to the content coding, as it appears in the
+    Accept-Encoding and Content-Encoding headers, and implement compress()
+    and compress_sequence().
+    """
+    name = None
+
+    def compress(self, content, level):
+        """
+        Returns the compressed version of the bytestring content.
+        """
+        raise NotImplementedError('subclasses of Encoder must provide a compress() method')
+
+    def compress_sequence(self, sequence, level, flush_size):
+        """
+        Returns an iterator of the compressed version of an iterator of
+        bytestrings. The compressed data should be flushed at least every
+        flush_size bytes of input.
+        """
+        raise NotImplementedError('subclasses of Encoder must provide a compress_sequence() method')
+
+
+class GZipEncoder(Encoder):
+    name = 'gzip'
+
+    def compress(self, content, level):
+        return compress_string(content, compresslevel=level)
+
+    def compress_sequence(self, sequence, level, flush_size):
+        return compress_sequence(sequence, compresslevel=level, flush_size=flush_size)
+
+
+class DeflateEncoder(Encoder):
+    """
+    The 'deflate' content coding, that is the zlib format.
+    """
+    name = 'deflate'
+
+    def compress(self, content, level):
+        return zlib.compress(content, level)
+
+    def compress_sequence(self, sequence, level, flush_size):
+        compressor = zlib.compressobj(level)
+        unflushed = 0
+        for item in sequence:
+            data = compressor.compress(item)
+            unflushed += len(item)
+            if unflushed >= flush_size:
+                data += compressor.flush(zlib.Z_SYNC_FLUSH)
+                unflushed = 0
+            if data:
+                yield data
+        yield compressor.flush()
+
+
+_encoders = OrderedDict()
+
+
+def register_encoder(encoder):
+    """
+    Registers an Encoder instance under its name, replacing any encoder
+    previously registered for the same content coding.
+    """
+    _encoders[encoder.name] = encoder
+
+
+def get_encoder(name):
+    """
+    Returns the encoder registered for the content coding name, or None.
+    """
+    return _encoders.get(name)
+
+
+register_encoder(GZipEncoder())
+register_encoder(DeflateEncoder())
+
+
+def parse_accept_encoding(header):
+    """
+    Parses an Accept-Encoding header and returns a dictionary mapping the
+    content codings it contains to their quality values.
+    """
+    qualities = {}
+    for item in header.split(','):
+        params = item.split(';')
+        coding = params.pop(0).strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+    return qualities
+
+
+class CompressionMiddleware(object):
+    """
+    This middleware compresses content with the first of its ``encodings``
+    that the browser accepts with the highest quality. It sets the Vary
+    header accordingly, so that caches will base their storage on the
+    Accept-Encoding header.
+
+    The compression level depends on the response's content type, see
+    get_compress_level(). Streaming content is compressed on the fly and
+    flushed every ``streaming_flush_size`` bytes of input. When
+    ``cache_alias`` is set, the compressed content of responses with a strong
+    ETag is cached, so that it isn't compressed for every request.
+    """
+    encodings = ('gzip',)
+    # It's not worth attempting to compress really short responses.
+    min_length = 200
+    compress_level = 6
+    # Levels by content type, e.g. 'text/html', or by type, e.g. 'image/*'.
+    # A level of None disables compression.
+    compress_levels = {}
+    streaming_flush_size = 32 * 1024
+    cache_alias = None
+    cache_timeout = None
+
+    def process_response(self, request, response):
+        if not response.streaming and len(response.content) < self.min_length:
+            return response
+
+        # Avoid compressing if we've already got a content-encoding.
+        if response.has_header('Content-Encoding'):
+            return response
+
+        level = self.get_compress_level(request, response)
+        if level is None:
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        encoder = self.get_encoder(request, response)
+        if encoder is None:
+            return response
+
+        if response.streaming:
+            # Delete the `Content-Length` header for streaming content, because
+            # we won't know the compressed size until we stream it.
+            response.streaming_content = encoder.compress_sequence(
+                response.streaming_content, level, self.streaming_flush_size)
+            del response['Content-Length']
+        else:
+            # Return the compressed content only if it's actually shorter.
+            compressed_content = self.compress(request, response, encoder, level)
+            if len(compressed_content) >= len(response.content):
+                return response
+            response.content = compressed_content
+            response['Content-Length'] = str(len(response.content))
+
+        if response.has_header('ETag'):
+            response['ETag'] = re.sub('"$', ';%s"' % encoder.name, response['ETag'])
+        response['Content-Encoding'] = encoder.name
+
+        return response
+
+    def get_compress_level(self, request, response):
+        """
+        Returns the compression level for the response, looked up in
+        compress_levels by content type, then by type, and defaulting to
+        compress_level. Returns None if the response shouldn't be compressed.
+        """
+        content_type = response.get('Content-Type', '').split(';')[0].strip().lower()
+        for key in (content_type, content_type.split('/')[0] + '/*'):
+            if key in self.compress_levels:
+                return self.compress_levels[key]
+        return self.compress_level
+
+    def get_encoder(self, request, response):
+        """
+        Returns the encoder to compress the response with, or None if the
+        browser doesn't accept any of the encodings.
+        """
+        qualities = parse_accept_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        best, best_quality = None, 0
+        for name in self.encodings:
+            quality = qualities.get(name, qualities.get('*', 0))
+            encoder = get_encoder(name)
+            if quality > best_quality and encoder is not None:
+                best, best_quality = encoder, quality
+        return best
+
+    def compress(self, request, response, encoder, level):
+        """
+        Returns the compressed content of a non-streaming response, from the
+        cache if the response has a strong ETag and cache_alias is set.
+        """
+        etag = response.get('ETag')
+        if self.cache_alias is None or not etag or etag.startswith('W/'):
+            return encoder.compress(response.content, level)
+        cache = caches[self.cache_alias]
+        # The ETag identifies the content of a resource, not the resource.
+        url = hashlib.md5(force_bytes(request.get_full_path()))
+        cache_key = 'middleware.compression.%s.%s.%s.%s' % (
+            encoder.name, level, url.hexdigest(), hashlib.md5(force_bytes(etag)).hexdigest())
+        compressed_content = cache.get(cache_key)
+        if compressed_content is None:
+            compressed_content = encoder.compress(response.content, level)
+            if self.cache_timeout is None:
+                cache.set(cache_key, compressed_content)
+            else:
+                cache.set(cache_key, compressed_content, self.cache_timeout)
+        return compressed_content
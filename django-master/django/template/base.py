@@ -143,6 +143,9 @@ class Template(object):
     def _render(self, context):
         return self.nodelist.render(context)
 
+    def _stream(self, context):
+        return self.nodelist.stream(context)
+
     def render(self, context):
         "Display stage -- can be called many times"
         context.render_context.push()
@@ -151,6 +154,18 @@ class Template(object):
         finally:
             context.render_context.pop()
 
+    def stream(self, context):
+        """
+        Display stage, like render(), but returns a generator yielding the
+        output in chunks as it is produced rather than a single string.
+        """
+        context.render_context.push()
+        try:
+            for bit in self._stream(context):
+                yield bit
+        finally:
+            context.render_context.pop()
+
 
 def compile_string(template_string, origin):
     "Compiles template_string into NodeList ready for rendering"
@@ -825,6 +840,16 @@ class Node(object):
         """
         pass
 
+    def stream(self, context):
+        """
+        Return an iterable of strings which, joined, form the rendered node.
+
+        Nodes whose output can usefully be produced piecemeal, such as loops
+        and blocks, override this; the default yields the whole rendered node
+        at once.
+        """
+        yield self.render(context)
+
     def __iter__(self):
         yield self
 
@@ -858,6 +883,14 @@ class NodeList(list):
             bits.append(force_text(bit))
         return mark_safe(''.join(bits))
 
+    def stream(self, context):
+        for node in self:
+            if isinstance(node, Node):
+                for bit in self.stream_node(node, context):
+                    yield mark_safe(force_text(bit))
+            else:
+                yield mark_safe(force_text(node))
+
     def get_nodes_by_type(self, nodetype):
         "Return a list of all nodes of the given type"
         nodes = []
@@ -868,6 +901,9 @@ class NodeList(list):
     def render_node(self, node, context):
         return node.render(context)
 
+    def stream_node(self, node, context):
+        return node.stream(context)
+
 
 class TextNode(Node):
     def __init__(self, s):
@@ -4,6 +4,7 @@ from __future__ import unicode_literals
 import os
 import sys
 import re
+from contextlib import closing
 from datetime import datetime
 from itertools import groupby, cycle as itertools_cycle
 import warnings
@@ -144,7 +145,12 @@ class ForNode(Node):
         for node in self.nodelist_empty:
             yield node
 
-    def render(self, context):
+    def _iter_nodelists(self, context):
+        """
+        Yield the nodelist to render for each pass through the loop, with the
+        context set up for that pass, or ``nodelist_empty`` once if there is
+        nothing to loop over.
+        """
         if 'forloop' in context:
             parentloop = context['forloop']
         else:
@@ -156,12 +162,14 @@ class ForNode(Node):
                 values = []
             if values is None:
                 values = []
+            # The length is needed for the forloop variables, so the values
+            # are loaded before streaming the first iteration.
             if not hasattr(values, '__len__'):
                 values = list(values)
             len_values = len(values)
             if len_values < 1:
-                return self.nodelist_empty.render(context)
-            nodelist = []
+                yield self.nodelist_empty
+                return
             if self.is_reversed:
                 values = reversed(values)
             num_loopvars = len(self.loopvars)
@@ -208,19 +216,7 @@ class ForNode(Node):
                         context.update(unpacked_vars)
                 else:
                     context[self.loopvars[0]] = item
-                # In TEMPLATE_DEBUG mode provide source of the node which
-                # actually raised the exception
-                if settings.TEMPLATE_DEBUG:
-                    for node in self.nodelist_loop:
-                        try:
-                            nodelist.append(node.render(context))
-                        except Exception as e:
-                            if not hasattr(e, 'django_template_source'):
-                                e.django_template_source = node.source
-                            raise
-                else:
-                    for node in self.nodelist_loop:
-                        nodelist.append(node.render(context))
+                yield self.nodelist_loop
                 if pop_context:
                     # The loop variables were pushed on to the context so pop them
                     # off again. This is necessary because the tag lets the length
@@ -228,7 +224,19 @@ class ForNode(Node):
                     # don't want to leave any vars from the previous loop on the
                     # context.
                     context.pop()
-        return mark_safe(''.join(force_text(n) for n in nodelist))
+
+    def render(self, context):
+        # In TEMPLATE_DEBUG mode the nodelists are DebugNodeLists, which
+        # provide the source of the node which actually raised an exception.
+        with closing(self._iter_nodelists(context)) as nodelists:
+            return mark_safe(''.join(
+                nodelist.render(context) for nodelist in nodelists))
+
+    def stream(self, context):
+        with closing(self._iter_nodelists(context)) as nodelists:
+            for nodelist in nodelists:
+                for bit in nodelist.stream(context):
+                    yield bit
 
 
 class IfChangedNode(Node):
@@ -313,7 +321,8 @@ class IfNode(Node):
     def nodelist(self):
         return NodeList(node for _, nodelist in self.conditions_nodelists for node in nodelist)
 
-    def render(self, context):
+    def _get_nodelist(self, context):
+        "Return the nodelist of the first matching branch, if any."
         for condition, nodelist in self.conditions_nodelists:
 
             if condition is not None:           # if / elif clause
@@ -325,9 +334,21 @@ class IfNode(Node):
                 match = True
 
             if match:
-                return nodelist.render(context)
+                return nodelist
 
-        return ''
+        return None
+
+    def render(self, context):
+        nodelist = self._get_nodelist(context)
+        if nodelist is None:
+            return ''
+        return nodelist.render(context)
+
+    def stream(self, context):
+        nodelist = self._get_nodelist(context)
+        if nodelist is not None:
+            for bit in nodelist.stream(context):
+                yield bit
 
 
 class LoremNode(Node):
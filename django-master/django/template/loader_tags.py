@@ -1,4 +1,5 @@
 from collections import defaultdict
+from contextlib import contextmanager
 
 from django.conf import settings
 from django.template.base import TemplateSyntaxError, Library, Node, TextNode,\
@@ -48,12 +49,17 @@ class BlockNode(Node):
     def __repr__(self):
         return "<Block Node: %s. Contents: %r>" % (self.name, self.nodelist)
 
-    def render(self, context):
+    @contextmanager
+    def _enter_block(self, context):
+        """
+        Set up the context for rendering this block and yield the nodelist
+        to render, which may come from a block overriding this one.
+        """
         block_context = context.render_context.get(BLOCK_CONTEXT_KEY)
         with context.push():
             if block_context is None:
                 context['block'] = self
-                result = self.nodelist.render(context)
+                yield self.nodelist
             else:
                 push = block = block_context.pop(self.name)
                 if block is None:
@@ -62,10 +68,18 @@ class BlockNode(Node):
                 block = type(self)(block.name, block.nodelist)
                 block.context = context
                 context['block'] = block
-                result = block.nodelist.render(context)
+                yield block.nodelist
                 if push is not None:
                     block_context.push(self.name, push)
-        return result
+
+    def render(self, context):
+        with self._enter_block(context) as nodelist:
+            return nodelist.render(context)
+
+    def stream(self, context):
+        with self._enter_block(context) as nodelist:
+            for bit in nodelist.stream(context):
+                yield bit
 
     def super(self):
         if not hasattr(self, 'context'):
@@ -105,7 +119,12 @@ class ExtendsNode(Node):
             return parent  # parent is a Template object
         return get_template(parent)
 
-    def render(self, context):
+    def _prepare_parent(self, context):
+        """
+        Return the compiled parent template, after adding the blocks from
+        this template (and the parent, if it is the root) to the block
+        context.
+        """
         compiled_parent = self.get_parent(context)
 
         if BLOCK_CONTEXT_KEY not in context.render_context:
@@ -126,9 +145,16 @@ class ExtendsNode(Node):
                     block_context.add_blocks(blocks)
                 break
 
+        return compiled_parent
+
+    def render(self, context):
         # Call Template._render explicitly so the parser context stays
         # the same.
-        return compiled_parent._render(context)
+        return self._prepare_parent(context)._render(context)
+
+    def stream(self, context):
+        for bit in self._prepare_parent(context)._stream(context):
+            yield bit
 
 
 class IncludeNode(Node):
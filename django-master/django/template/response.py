@@ -1,4 +1,4 @@
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from django.template import loader, Context, RequestContext
 from django.utils import six
 
@@ -7,7 +7,54 @@ class ContentNotRenderedError(Exception):
     pass
 
 
-class SimpleTemplateResponse(HttpResponse):
+class TemplateRenderingMixin(object):
+    """
+    Deferred template rendering shared by the buffered and the streaming
+    template responses.
+    """
+    def resolve_template(self, template):
+        "Accepts a template object, path-to-template or list of paths"
+        if isinstance(template, (list, tuple)):
+            return loader.select_template(template)
+        elif isinstance(template, six.string_types):
+            return loader.get_template(template)
+        else:
+            return template
+
+    def resolve_context(self, context):
+        """Converts context data into a full Context object
+        (assuming it isn't already a Context object).
+        """
+        if isinstance(context, Context):
+            return context
+        else:
+            return Context(context)
+
+    def add_post_render_callback(self, callback):
+        """Adds a new post-rendering callback.
+
+        If the response has already been rendered,
+        invoke the callback immediately.
+        """
+        if self._is_rendered:
+            callback(self)
+        else:
+            self._post_render_callbacks.append(callback)
+
+    def _run_post_render_callbacks(self):
+        retval = self
+        for post_callback in self._post_render_callbacks:
+            newretval = post_callback(retval)
+            if newretval is not None:
+                retval = newretval
+        return retval
+
+    @property
+    def is_rendered(self):
+        return self._is_rendered
+
+
+class SimpleTemplateResponse(TemplateRenderingMixin, HttpResponse):
     rendering_attrs = ['template_name', 'context_data', '_post_render_callbacks']
 
     def __init__(self, template, context=None, content_type=None, status=None,
@@ -49,24 +96,6 @@ class SimpleTemplateResponse(HttpResponse):
 
         return obj_dict
 
-    def resolve_template(self, template):
-        "Accepts a template object, path-to-template or list of paths"
-        if isinstance(template, (list, tuple)):
-            return loader.select_template(template)
-        elif isinstance(template, six.string_types):
-            return loader.get_template(template)
-        else:
-            return template
-
-    def resolve_context(self, context):
-        """Converts context data into a full Context object
-        (assuming it isn't already a Context object).
-        """
-        if isinstance(context, Context):
-            return context
-        else:
-            return Context(context)
-
     @property
     def rendered_content(self):
         """Returns the freshly rendered content for the template and context
@@ -81,17 +110,6 @@ class SimpleTemplateResponse(HttpResponse):
         content = template.render(context)
         return content
 
-    def add_post_render_callback(self, callback):
-        """Adds a new post-rendering callback.
-
-        If the response has already been rendered,
-        invoke the callback immediately.
-        """
-        if self._is_rendered:
-            callback(self)
-        else:
-            self._post_render_callbacks.append(callback)
-
     def render(self):
         """Renders (thereby finalizing) the content of the response.
 
@@ -102,16 +120,9 @@ class SimpleTemplateResponse(HttpResponse):
         retval = self
         if not self._is_rendered:
             self.content = self.rendered_content
-            for post_callback in self._post_render_callbacks:
-                newretval = post_callback(retval)
-                if newretval is not None:
-                    retval = newretval
+            retval = self._run_post_render_callbacks()
         return retval
 
-    @property
-    def is_rendered(self):
-        return self._is_rendered
-
     def __iter__(self):
         if not self._is_rendered:
             raise ContentNotRenderedError('The response content must be '
@@ -155,3 +166,83 @@ class TemplateResponse(SimpleTemplateResponse):
         if isinstance(context, Context):
             return context
         return RequestContext(self._request, context, current_app=self._current_app)
+
+
+class SimpleStreamingTemplateResponse(TemplateRenderingMixin, StreamingHttpResponse):
+    """
+    A StreamingHttpResponse whose content is generated by streaming a
+    template, so output is sent while the template is still being rendered.
+    """
+    def __init__(self, template, context=None, content_type=None, status=None,
+                 charset=None):
+        self.template_name = template
+        self.context_data = context
+
+        self._post_render_callbacks = []
+
+        super(SimpleStreamingTemplateResponse, self).__init__(
+            content_type=content_type, status=status, charset=charset)
+
+        # As in SimpleTemplateResponse, the super __init__ has set an empty
+        # iterator as the content, marking the response as rendered.
+        self._is_rendered = False
+
+    @property
+    def rendered_content(self):
+        """Returns a generator yielding the content of the template rendered
+        with the context described by the response.
+
+        The template and context are resolved immediately, but the template
+        is only rendered as the generator is consumed.
+        """
+        template = self.resolve_template(self.template_name)
+        context = self.resolve_context(self.context_data)
+        return template.stream(context)
+
+    def render(self):
+        """Prepares the streaming content of the response.
+
+        If the content has already been prepared, this is a no-op.
+
+        Returns the baked response instance.
+        """
+        retval = self
+        if not self._is_rendered:
+            self.streaming_content = self.rendered_content
+            retval = self._run_post_render_callbacks()
+        return retval
+
+    def __iter__(self):
+        if not self._is_rendered:
+            raise ContentNotRenderedError('The response content must be '
+                                          'rendered before it can be iterated over.')
+        return super(SimpleStreamingTemplateResponse, self).__iter__()
+
+    @property
+    def streaming_content(self):
+        if not self._is_rendered:
+            raise ContentNotRenderedError('The response content must be '
+                                          'rendered before it can be accessed.')
+        return super(SimpleStreamingTemplateResponse, self).streaming_content
+
+    @streaming_content.setter
+    def streaming_content(self, value):
+        StreamingHttpResponse.streaming_content.fset(self, value)
+        self._is_rendered = True
+
+
+class StreamingTemplateResponse(SimpleStreamingTemplateResponse):
+    def __init__(self, request, template, context=None, content_type=None,
+            status=None, current_app=None, charset=None):
+        self._request = request
+        self._current_app = current_app
+        super(StreamingTemplateResponse, self).__init__(
+            template, context, content_type, status, charset)
+
+    def resolve_context(self, context):
+        """Convert context data into a full RequestContext object
+        (assuming it isn't already a Context object).
+        """
+        if isinstance(context, Context):
+            return context
+        return RequestContext(self._request, context, current_app=self._current_app)
@@ -1,13 +1,221 @@
+import ctypes
 from importlib import import_module
+import itertools
+import multiprocessing
 import os
+import pickle
 import unittest
 from unittest import TestSuite, defaultTestLoader
+from unittest.suite import _ErrorHolder
 
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
+from django.db import connections
 from django.test import SimpleTestCase, TestCase
 from django.test.utils import setup_test_environment, teardown_test_environment
 
+try:
+    import tblib.pickling_support
+except ImportError:
+    tblib = None
+
+
+class RemoteTestError(Exception):
+    """
+    Carries the formatted traceback of an error or a failure raised in a
+    worker process of the parallel test runner.
+    """
+    pass
+
+
+class RemoteTestResult(unittest.TestResult):
+    """
+    Records the outcomes of the tests run in a worker process of the parallel
+    test runner, so that they can be replayed on the result of the main
+    process.
+
+    Each event refers to a test by its index in the subsuite run by the
+    worker, since test cases can't be assumed to be picklable.
+    """
+    def __init__(self, *args, **kwargs):
+        super(RemoteTestResult, self).__init__(*args, **kwargs)
+        if tblib is not None:
+            tblib.pickling_support.install()
+        self.events = []
+        self._current_test = None
+
+    def _test_ref(self, test):
+        if test is self._current_test:
+            return self.testsRun - 1
+        # Errors in class or module fixtures are reported on placeholders
+        # which aren't part of the subsuite.
+        return _ErrorHolder(str(test))
+
+    def _picklable_err(self, err, test):
+        """
+        Returns a picklable version of the sys.exc_info() tuple err.
+        Tracebacks can only be pickled with tblib, without it or if the
+        exception can't be pickled, the formatted traceback is sent instead.
+        """
+        if tblib is not None:
+            try:
+                pickle.dumps(err)
+            except Exception:
+                pass
+            else:
+                return err
+        message = self._exc_info_to_string(err, test).rstrip('\n')
+        return (RemoteTestError, RemoteTestError(message), None)
+
+    def startTest(self, test):
+        self.testsRun += 1
+        self._current_test = test
+        self.events.append(('startTest', self.testsRun - 1))
+
+    def stopTest(self, test):
+        self.events.append(('stopTest', self._test_ref(test)))
+
+    def addError(self, test, err):
+        self.events.append(('addError', self._test_ref(test), self._picklable_err(err, test)))
+        if self.failfast:
+            self.stop()
+
+    def addFailure(self, test, err):
+        self.events.append(('addFailure', self._test_ref(test), self._picklable_err(err, test)))
+        if self.failfast:
+            self.stop()
+
+    def addSubTest(self, test, subtest, err):
+        # Failures of subtests are reported on their test.
+        if err is not None:
+            if issubclass(err[0], test.failureException):
+                self.addFailure(test, err)
+            else:
+                self.addError(test, err)
+
+    def addSuccess(self, test):
+        self.events.append(('addSuccess', self._test_ref(test)))
+
+    def addSkip(self, test, reason):
+        self.events.append(('addSkip', self._test_ref(test), reason))
+
+    def addExpectedFailure(self, test, err):
+        self.events.append(('addExpectedFailure', self._test_ref(test), self._picklable_err(err, test)))
+
+    def addUnexpectedSuccess(self, test):
+        self.events.append(('addUnexpectedSuccess', self._test_ref(test)))
+        if self.failfast:
+            self.stop()
+
+
+# State of the worker processes of the parallel test runner. These have to be
+# module-level for the multiprocessing module. The subsuites are inherited
+# from the main process when the worker is forked, rather than pickled.
+_worker_id = 0
+_worker_subsuites = []
+
+
+def _init_worker(counter, subsuites):
+    """
+    Switches the connections of a new worker process to its clones of the
+    test databases.
+    """
+    global _worker_id, _worker_subsuites
+
+    with counter.get_lock():
+        counter.value += 1
+        _worker_id = counter.value
+    _worker_subsuites = subsuites
+
+    for alias in connections:
+        connection = connections[alias]
+        # settings_dict must be updated in place for the change to be seen
+        # by the copies of the settings dict held by other objects.
+        connection.settings_dict.update(
+            connection.creation.get_test_db_clone_settings(_worker_id))
+        connection.close()
+
+
+def _run_subsuite(args):
+    """
+    Runs a subsuite in a worker process, returning its index and the events
+    recorded by a RemoteTestResult.
+    """
+    subsuite_index, failfast = args
+    result = RemoteTestResult()
+    result.failfast = failfast
+    unittest.registerResult(result)
+    _worker_subsuites[subsuite_index].run(result)
+    return subsuite_index, result.events
+
+
+class ParallelTestSuite(unittest.TestSuite):
+    """
+    Runs a list of subsuites, typically made by partition_suite_by_case(),
+    in a pool of worker processes. Each worker uses its own clones of the
+    test databases, see setup_databases().
+
+    The outcomes of the tests are replayed on the result of the main process
+    as each subsuite completes.
+    """
+    def __init__(self, subsuites, processes, failfast=False):
+        self.subsuites = subsuites
+        self.processes = processes
+        self.failfast = failfast
+        super(ParallelTestSuite, self).__init__()
+
+    def __iter__(self):
+        return itertools.chain.from_iterable(self.subsuites)
+
+    def countTestCases(self):
+        return sum(subsuite.countTestCases() for subsuite in self.subsuites)
+
+    def run(self, result):
+        if multiprocessing.current_process().daemon:
+            # The workers of a pool are daemonic processes, which can't have
+            # children, e.g. when this suite is itself run in parallel.
+            for subsuite in self.subsuites:
+                if result.shouldStop:
+                    break
+                subsuite.run(result)
+            return result
+
+        # Connections mustn't be shared with the forked workers.
+        for connection in connections.all():
+            connection.close()
+
+        counter = multiprocessing.Value(ctypes.c_int, 0)
+        pool = multiprocessing.Pool(
+            processes=self.processes,
+            initializer=_init_worker,
+            initargs=[counter, self.subsuites],
+        )
+        args = [(index, self.failfast) for index in range(len(self.subsuites))]
+        test_results = pool.imap_unordered(_run_subsuite, args)
+
+        while True:
+            if result.shouldStop:
+                pool.terminate()
+                break
+            # Waiting with a timeout lets the main process handle interrupts.
+            try:
+                subsuite_index, events = test_results.next(timeout=0.1)
+            except multiprocessing.TimeoutError:
+                continue
+            except StopIteration:
+                pool.close()
+                break
+
+            tests = list(self.subsuites[subsuite_index])
+            for event in events:
+                event_name, test = event[:2]
+                if not isinstance(test, _ErrorHolder):
+                    test = tests[test]
+                getattr(result, event_name)(test, *event[2:])
+
+        pool.join()
+        return result
+
 
 class DiscoverRunner(object):
     """
@@ -15,13 +223,14 @@ class DiscoverRunner(object):
     """
 
     test_suite = TestSuite
+    parallel_test_suite = ParallelTestSuite
     test_runner = unittest.TextTestRunner
     test_loader = defaultTestLoader
     reorder_by = (TestCase, SimpleTestCase)
 
     def __init__(self, pattern=None, top_level=None,
                  verbosity=1, interactive=True, failfast=False, keepdb=False,
-                 **kwargs):
+                 parallel=1, **kwargs):
 
         self.pattern = pattern
         self.top_level = top_level
@@ -30,6 +239,7 @@ class DiscoverRunner(object):
         self.interactive = interactive
         self.failfast = failfast
         self.keepdb = keepdb
+        self.parallel = parallel
 
     @classmethod
     def add_arguments(cls, parser):
@@ -42,6 +252,11 @@ class DiscoverRunner(object):
         parser.add_argument('-k', '--keepdb', action='store_true', dest='keepdb',
             default=False,
             help='Preserve the test DB between runs. Defaults to False')
+        parser.add_argument('--parallel', action='store', dest='parallel',
+            type=int, nargs='?', default=1, const=default_test_processes(),
+            metavar='N',
+            help='Run tests in N parallel processes, each using its own clone '
+                 'of the test databases. Defaults to the number of CPUs.')
 
     def setup_test_environment(self, **kwargs):
         setup_test_environment()
@@ -107,10 +322,28 @@ class DiscoverRunner(object):
         for test in extra_tests:
             suite.addTest(test)
 
-        return reorder_suite(suite, self.reorder_by)
+        suite = reorder_suite(suite, self.reorder_by)
+
+        if self.parallel > 1:
+            subsuites = partition_suite_by_case(suite)
+            # Tests are distributed to the workers by test case, there's no
+            # need for more workers than test cases.
+            self.parallel = min(self.parallel, len(subsuites))
+            for alias in connections:
+                if not connections[alias].features.can_clone_databases:
+                    if self.verbosity >= 1:
+                        print("The test database for alias '%s' can't be cloned, "
+                              "running tests in a single process." % alias)
+                    self.parallel = 1
+                    break
+            if self.parallel > 1:
+                suite = self.parallel_test_suite(subsuites, self.parallel, self.failfast)
+
+        return suite
 
     def setup_databases(self, **kwargs):
-        return setup_databases(self.verbosity, self.interactive, self.keepdb, **kwargs)
+        return setup_databases(
+            self.verbosity, self.interactive, self.keepdb, parallel=self.parallel, **kwargs)
 
     def run_suite(self, suite, **kwargs):
         return self.test_runner(
@@ -125,6 +358,10 @@ class DiscoverRunner(object):
         old_names, mirrors = old_config
         for connection, old_name, destroy in old_names:
             if destroy:
+                if self.parallel > 1:
+                    for index in range(self.parallel):
+                        connection.creation.destroy_test_db(
+                            old_name, self.verbosity, self.keepdb, number=index + 1)
                 connection.creation.destroy_test_db(old_name, self.verbosity, self.keepdb)
 
     def teardown_test_environment(self, **kwargs):
@@ -231,6 +468,36 @@ def reorder_suite(suite, classes):
     return bins[0]
 
 
+def partition_suite_by_case(suite):
+    """
+    Partitions a test suite into a list of suites, one for each run of
+    consecutive tests of the same test case class, preserving their order.
+    """
+    groups = []
+    suite_class = type(suite)
+    for test_type, test_group in itertools.groupby(suite, type):
+        if issubclass(test_type, unittest.TestCase):
+            groups.append(suite_class(test_group))
+        else:
+            for item in test_group:
+                groups.extend(partition_suite_by_case(item))
+    return groups
+
+
+def default_test_processes():
+    """
+    Returns the default number of processes of the parallel test runner: the
+    DJANGO_TEST_PROCESSES environment variable, or the number of CPUs.
+    Running tests in parallel requires forking worker processes.
+    """
+    if not hasattr(os, 'fork'):
+        return 1
+    try:
+        return int(os.environ['DJANGO_TEST_PROCESSES'])
+    except KeyError:
+        return multiprocessing.cpu_count()
+
+
 def partition_suite(suite, classes, bins):
     """
     Partitions a test suite by test type.
@@ -254,7 +521,7 @@ def partition_suite(suite, classes, bins):
                 bins[-1].addTest(test)
 
 
-def setup_databases(verbosity, interactive, keepdb=False, **kwargs):
+def setup_databases(verbosity, interactive, keepdb=False, parallel=1, **kwargs):
     from django.db import connections, DEFAULT_DB_ALIAS
 
     # First pass -- work out which databases actually need to be created,
@@ -297,12 +564,25 @@ def setup_databases(verbosity, interactive, keepdb=False, **kwargs):
         for alias in aliases:
             connection = connections[alias]
             if test_db_name is None:
+                create_kwargs = {}
+                # Only passed when it's set, for the create_test_db() methods
+                # of third-party backends which don't accept it.
+                if connection.settings_dict.get("TEST", {}).get("MIGRATED_TEMPLATE", False):
+                    create_kwargs['migrated_template'] = True
                 test_db_name = connection.creation.create_test_db(
                     verbosity,
                     autoclobber=not interactive,
                     keepdb=keepdb,
                     serialize=connection.settings_dict.get("TEST", {}).get("SERIALIZE", True),
+                    **create_kwargs
                 )
+                if parallel > 1:
+                    for index in range(parallel):
+                        connection.creation.clone_test_db(
+                            number=index + 1,
+                            verbosity=verbosity,
+                            keepdb=keepdb,
+                        )
                 destroy = True
             else:
                 connection.settings_dict['NAME'] = test_db_name
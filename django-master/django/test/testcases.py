@@ -789,10 +789,11 @@ class TransactionTestCase(SimpleTestCase):
 
             raise
 
-    def _databases_names(self, include_mirrors=True):
+    @classmethod
+    def _databases_names(cls, include_mirrors=True):
         # If the test case has a multi_db=True flag, act on all databases,
         # including mirrors or not. Otherwise, just on the default DB.
-        if getattr(self, 'multi_db', False):
+        if getattr(cls, 'multi_db', False):
             return [alias for alias in connections
                     if include_mirrors or not connections[alias].settings_dict['TEST']['MIRROR']]
         else:
@@ -832,12 +833,16 @@ class TransactionTestCase(SimpleTestCase):
                 call_command('loaddata', *self.fixtures,
                              **{'verbosity': 0, 'database': db_name, 'skip_checks': True})
 
+    def _should_reload_connections(self):
+        return True
+
     def _post_teardown(self):
         """Performs any post-test things. This includes:
 
         * Flushing the contents of the database, to leave a clean slate. If
           the class has an 'available_apps' attribute, post_migrate isn't fired.
-        * Force-closing the connection, so the next test gets a clean cursor.
+        * Force-closing the connection, so the next test gets a clean cursor,
+          unless _should_reload_connections() returns False.
         """
         try:
             self._fixture_teardown()
@@ -848,8 +853,9 @@ class TransactionTestCase(SimpleTestCase):
             # tests (e.g., losing a timezone setting causing objects to be
             # created with the wrong time). To make sure this doesn't happen,
             # get a clean connection at the start of every test.
-            for conn in connections.all():
-                conn.close()
+            if self._should_reload_connections():
+                for conn in connections.all():
+                    conn.close()
         finally:
             if self.available_apps is not None:
                 apps.unset_available_apps()
@@ -862,12 +868,19 @@ class TransactionTestCase(SimpleTestCase):
         # Allow TRUNCATE ... CASCADE and don't emit the post_migrate signal
         # when flushing only a subset of the apps
         for db_name in self._databases_names(include_mirrors=False):
+            creation = connections[db_name].creation
+            # Restoring a snapshot of the flushed database is faster than
+            # flushing it and emitting post_migrate, on backends supporting it.
+            if self.available_apps is None and creation.restore_test_db():
+                continue
             # Flush the database
             call_command('flush', verbosity=0, interactive=False,
                          database=db_name, skip_checks=True,
                          reset_sequences=False,
                          allow_cascade=self.available_apps is not None,
                          inhibit_post_migrate=self.available_apps is not None)
+            if self.available_apps is None:
+                creation.snapshot_test_db()
 
     def assertQuerysetEqual(self, qs, values, transform=repr, ordered=True, msg=None):
         items = six.moves.map(transform, qs)
@@ -901,6 +914,11 @@ def connections_support_transactions():
                for conn in connections.all())
 
 
+# Parsed fixtures shared by the TestCase classes of a test run, see the
+# fixture_cache option of loaddata.
+_fixture_cache = {}
+
+
 class TestCase(TransactionTestCase):
     """
     Does basically the same as TransactionTestCase, but surrounds every test
@@ -908,34 +926,113 @@ class TestCase(TransactionTestCase):
     to do nothing, and rollsback the test transaction at the end of the test.
     You have to use TransactionTestCase, if you need transaction management
     inside a test.
+
+    Fixtures and the data created by setUpTestData() are loaded once for the
+    class, in a transaction which is rolled back after its last test. The
+    transaction of each test is nested in it, with a savepoint.
     """
+    cls_atomics = None
+
+    @classmethod
+    def _enter_atomics(cls):
+        """Helper method to open atomic blocks for multiple databases"""
+        atomics = {}
+        for db_name in cls._databases_names():
+            atomics[db_name] = transaction.atomic(using=db_name)
+            atomics[db_name].__enter__()
+        return atomics
+
+    @classmethod
+    def _rollback_atomics(cls, atomics):
+        """Rollback atomic blocks opened through the previous method"""
+        for db_name in reversed(cls._databases_names()):
+            transaction.set_rollback(True, using=db_name)
+            atomics[db_name].__exit__(None, None, None)
+
+    @classmethod
+    def _load_test_data(cls):
+        """
+        Loads the fixtures of the class, then calls setUpTestData().
+        """
+        if cls.fixtures:
+            for db_name in cls._databases_names(include_mirrors=False):
+                call_command('loaddata', *cls.fixtures,
+                             **{
+                                 'verbosity': 0,
+                                 'commit': False,
+                                 'database': db_name,
+                                 'skip_checks': True,
+                                 'fixture_cache': _fixture_cache,
+                             })
+        cls.setUpTestData()
+
+    @classmethod
+    def setUpClass(cls):
+        super(TestCase, cls).setUpClass()
+        if not connections_support_transactions():
+            return
+        cls.cls_atomics = cls._enter_atomics()
+        # Settings overridden on the class are only enabled around each test,
+        # but they may affect the test data, e.g. USE_TZ.
+        contexts = []
+        if cls._overridden_settings:
+            contexts.append(override_settings(**cls._overridden_settings))
+        if cls._modified_settings:
+            contexts.append(modify_settings(cls._modified_settings))
+        try:
+            for context in contexts:
+                context.enable()
+            try:
+                cls._load_test_data()
+            finally:
+                for context in reversed(contexts):
+                    context.disable()
+        except Exception:
+            cls._rollback_atomics(cls.cls_atomics)
+            cls.cls_atomics = None
+            raise
+
+    @classmethod
+    def tearDownClass(cls):
+        if cls.cls_atomics is not None:
+            cls._rollback_atomics(cls.cls_atomics)
+            cls.cls_atomics = None
+            for conn in connections.all():
+                conn.close()
+        super(TestCase, cls).tearDownClass()
+
+    @classmethod
+    def setUpTestData(cls):
+        """Load initial data for the TestCase"""
+        pass
+
+    def _should_reload_connections(self):
+        if connections_support_transactions():
+            return False
+        return super(TestCase, self)._should_reload_connections()
 
     def _fixture_setup(self):
         if not connections_support_transactions():
-            return super(TestCase, self)._fixture_setup()
+            # Without transactions, the test data must be loaded for each
+            # test, after the database is flushed.
+            super(TestCase, self)._fixture_setup()
+            self.setUpTestData()
+            return
 
         assert not self.reset_sequences, 'reset_sequences cannot be used on TestCase instances'
 
-        self.atomics = {}
-        for db_name in self._databases_names():
-            self.atomics[db_name] = transaction.atomic(using=db_name)
-            self.atomics[db_name].__enter__()
+        self.atomics = self._enter_atomics()
         # Remove this when the legacy transaction management goes away.
         disable_transaction_methods()
 
-        for db_name in self._databases_names(include_mirrors=False):
-            if self.fixtures:
-                try:
-                    call_command('loaddata', *self.fixtures,
-                                 **{
-                                     'verbosity': 0,
-                                     'commit': False,
-                                     'database': db_name,
-                                     'skip_checks': True,
-                                 })
-                except Exception:
-                    self._fixture_teardown()
-                    raise
+        if self.cls_atomics is None:
+            # setUpClass() wasn't called, e.g. because a subclass overrides
+            # it without calling super(). Load the test data for this test.
+            try:
+                self._load_test_data()
+            except Exception:
+                self._fixture_teardown()
+                raise
 
     def _fixture_teardown(self):
         if not connections_support_transactions():
@@ -943,10 +1040,7 @@ class TestCase(TransactionTestCase):
 
         # Remove this when the legacy transaction management goes away.
         restore_transaction_methods()
-        for db_name in reversed(self._databases_names()):
-            # Hack to force a rollback
-            connections[db_name].needs_rollback = True
-            self.atomics[db_name].__exit__(None, None, None)
+        self._rollback_atomics(self.atomics)
 
 
 class CheckCondition(object):
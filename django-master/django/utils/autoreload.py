@@ -73,6 +73,10 @@ RUN_RELOADER = True
 FILE_MODIFIED = 1
 I18N_MODIFIED = 2
 
+# Changes are reported once no other change happened for this many seconds,
+# so that saving or checking out many files causes a single reload.
+DEBOUNCE_DELAY = 0.2
+
 _mtimes = {}
 _win = (sys.platform == "win32")
 
@@ -91,7 +95,10 @@ def gen_filenames(only_new=False):
     # fail with RuntimeError: cannot mutate dictionary while iterating
     global _cached_modules, _cached_filenames
     module_values = set(sys.modules.values())
-    _cached_filenames = clean_files(_cached_filenames)
+    if not only_new:
+        # Cached filenames aren't returned when only_new is True, don't spend
+        # a system call per file checking whether they still exist.
+        _cached_filenames = clean_files(_cached_filenames)
     if _cached_modules == module_values:
         # No changes in module list, short-circuit the function
         if only_new:
@@ -156,14 +163,23 @@ def inotify_code_changed():
     """
     Checks for changed code using inotify. After being called
     it blocks until a change event has been fired.
+
+    The directories containing the files are watched rather than the files
+    themselves, which requires fewer watches and catches editors replacing
+    files when saving them. Events are collected until none happens for
+    DEBOUNCE_DELAY seconds.
     """
+    watched_files = set()
+    watched_dirs = set()
+
     class EventHandler(pyinotify.ProcessEvent):
         modified_code = None
 
         def process_default(self, event):
-            if event.path.endswith('.mo'):
-                EventHandler.modified_code = I18N_MODIFIED
-            else:
+            if event.pathname.endswith('.mo'):
+                if EventHandler.modified_code is None:
+                    EventHandler.modified_code = I18N_MODIFIED
+            elif event.pathname in watched_files:
                 EventHandler.modified_code = FILE_MODIFIED
 
     wm = pyinotify.WatchManager()
@@ -182,35 +198,57 @@ def inotify_code_changed():
             pyinotify.IN_MOVED_TO |
             pyinotify.IN_CREATE
         )
-        for path in gen_filenames(only_new=True):
-            wm.add_watch(path, mask)
+        # The first call watches all the files, later calls only the files of
+        # modules imported since.
+        for path in gen_filenames(only_new=bool(watched_files)):
+            # Modules imported from the current directory may have a relative
+            # __file__, whose dirname is empty. Events have absolute paths.
+            path = os.path.abspath(path)
+            watched_files.add(path)
+            dirname = os.path.dirname(path)
+            if dirname not in watched_dirs:
+                watched_dirs.add(dirname)
+                wm.add_watch(dirname, mask)
 
     # New modules may get imported when a request is processed.
     request_finished.connect(update_watch)
 
-    # Block until an event happens.
+    # Block until a change happens, then until changes stop happening.
     update_watch()
-    notifier.check_events(timeout=None)
-    notifier.read_events()
-    notifier.process_events()
+    while EventHandler.modified_code is None:
+        notifier.check_events(timeout=None)
+        notifier.read_events()
+        notifier.process_events()
+    while notifier.check_events(timeout=int(DEBOUNCE_DELAY * 1000)):
+        notifier.read_events()
+        notifier.process_events()
     notifier.stop()
+    request_finished.disconnect(update_watch)
 
     # If we are here the code must have changed.
     return EventHandler.modified_code
 
 
 def code_changed():
-    global _mtimes, _win
-    for filename in gen_filenames():
-        stat = os.stat(filename)
+    """
+    Checks for changed code by comparing the modification times of the files.
+    Files are collected from the modules imported since the last call, and
+    stat'ed once per call.
+    """
+    for filename in gen_filenames(only_new=bool(_mtimes)) + clean_files(_error_files):
+        _mtimes.setdefault(filename, None)
+    for filename, old_mtime in list(_mtimes.items()):
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            # The file was deleted.
+            del _mtimes[filename]
+            continue
         mtime = stat.st_mtime
         if _win:
             mtime -= stat.st_ctime
-        if filename not in _mtimes:
-            _mtimes[filename] = mtime
-            continue
-        if mtime != _mtimes[filename]:
-            _mtimes = {}
+        _mtimes[filename] = mtime
+        if old_mtime is not None and mtime != old_mtime:
             try:
                 del _error_files[_error_files.index(filename)]
             except ValueError:
@@ -219,6 +257,22 @@ def code_changed():
     return False
 
 
+def debounced_code_changed():
+    """
+    Like code_changed(), but once a change is found, keeps checking until no
+    other change happens for DEBOUNCE_DELAY seconds.
+    """
+    change = code_changed()
+    if change:
+        while True:
+            time.sleep(DEBOUNCE_DELAY)
+            other_change = code_changed()
+            if not other_change:
+                break
+            change = min(change, other_change)
+    return change
+
+
 def check_errors(fn):
     def wrapper(*args, **kwargs):
         try:
@@ -262,7 +316,7 @@ def reloader_thread():
     if USE_INOTIFY:
         fn = inotify_code_changed
     else:
-        fn = code_changed
+        fn = debounced_code_changed
     while RUN_RELOADER:
         change = fn()
         if change == FILE_MODIFIED:
@@ -288,9 +288,9 @@ phone2numeric = allow_lazy(phone2numeric)
 
 # From http://www.xhaus.com/alan/python/httpcomp.html#gzip
 # Used with permission.
-def compress_string(s):
+def compress_string(s, compresslevel=6):
     zbuf = BytesIO()
-    zfile = GzipFile(mode='wb', compresslevel=6, fileobj=zbuf)
+    zfile = GzipFile(mode='wb', compresslevel=compresslevel, fileobj=zbuf)
     zfile.write(s)
     zfile.close()
     return zbuf.getvalue()
@@ -315,16 +315,24 @@ class StreamingBuffer(object):
         return
 
 
-# Like compress_string, but for iterators of strings.
-def compress_sequence(sequence):
+# Like compress_string, but for iterators of strings. The compressed data is
+# flushed once flush_size bytes were written since the last flush, so that
+# the compression isn't restarted after every small string.
+def compress_sequence(sequence, compresslevel=6, flush_size=0):
     buf = StreamingBuffer()
-    zfile = GzipFile(mode='wb', compresslevel=6, fileobj=buf)
+    zfile = GzipFile(mode='wb', compresslevel=compresslevel, fileobj=buf)
     # Output headers...
     yield buf.read()
+    unflushed = 0
     for item in sequence:
         zfile.write(item)
-        zfile.flush()
-        yield buf.read()
+        unflushed += len(item)
+        if unflushed >= flush_size:
+            zfile.flush()
+            unflushed = 0
+        data = buf.read()
+        if data:
+            yield data
     zfile.close()
     yield buf.read()
 
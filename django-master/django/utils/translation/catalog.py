@@ -0,0 +1,163 @@
+"""
+Reading and writing of merged translation catalogs.
+
+A catalog is written in the GNU .mo format, including its hash table, which
+the gettext module ignores. MappedCatalog maps the file in memory and uses
+the hash table to look messages up, so that loading a catalog doesn't require
+parsing it, and the pages of the file are shared by the processes using it.
+"""
+from __future__ import unicode_literals
+
+import collections
+import mmap
+import struct
+
+from django.utils import six
+
+MO_MAGIC = 0x950412de
+HEADER_FORMAT = str('<7I')
+
+
+def hash_string(value):
+    """
+    The hashpjw function used by GNU gettext for the hash table of .mo
+    files, limited to 32 bits.
+    """
+    hval = 0
+    for byte in six.iterbytes(value):
+        hval = ((hval << 4) + byte) & 0xffffffff
+        g = hval & 0xf0000000
+        if g:
+            hval ^= g >> 24
+            hval ^= g
+    return hval
+
+
+def next_prime(n):
+    n |= 1
+    while any(n % i == 0 for i in range(3, int(n ** 0.5) + 1, 2)):
+        n += 2
+    return n
+
+
+def _encode(value):
+    return value.encode('utf-8') if isinstance(value, six.text_type) else value
+
+
+def write_catalog(path, catalog, info):
+    """
+    Writes a catalog, as built by gettext.GNUTranslations, to a .mo file at
+    path. Its metadata is set from the info dictionary.
+    """
+    messages = {}
+    plurals = collections.defaultdict(dict)
+    for key, value in catalog.items():
+        if isinstance(key, tuple):
+            plurals[_encode(key[0])][key[1]] = _encode(value)
+        else:
+            messages[_encode(key)] = _encode(value)
+    messages[b''] = _encode(''.join('%s: %s\n' % item for item in sorted(info.items())))
+    entries = sorted(messages.items())
+    for msgid, forms in sorted(plurals.items()):
+        # The plural form of the msgid is unknown but not needed.
+        entries.append((msgid + b'\0', b'\0'.join(forms[i] for i in sorted(forms))))
+
+    count = len(entries)
+    hash_size = next_prime(max(3, count * 4 // 3))
+    originals_offset = struct.calcsize(HEADER_FORMAT)
+    translations_offset = originals_offset + 8 * count
+    hash_offset = translations_offset + 8 * count
+    strings_offset = hash_offset + 4 * hash_size
+
+    hash_table = [0] * hash_size
+    originals, translations, strings = [], [], []
+    offset = strings_offset
+    for msgid, msgstr in entries:
+        originals.append((len(msgid), offset))
+        offset += len(msgid) + 1
+        strings.append(msgid + b'\0')
+    for msgid, msgstr in entries:
+        translations.append((len(msgstr), offset))
+        offset += len(msgstr) + 1
+        strings.append(msgstr + b'\0')
+    for index, (msgid, msgstr) in enumerate(entries):
+        hval = hash_string(msgid.split(b'\0')[0])
+        slot = hval % hash_size
+        increment = 1 + (hval % (hash_size - 2))
+        while hash_table[slot]:
+            slot = (slot + increment) % hash_size
+        hash_table[slot] = index + 1
+
+    with open(path, 'wb') as f:
+        f.write(struct.pack(
+            HEADER_FORMAT, MO_MAGIC, 0, count, originals_offset,
+            translations_offset, hash_size, hash_offset))
+        for pairs in (originals, translations):
+            for length, string_offset in pairs:
+                f.write(struct.pack(str('<2I'), length, string_offset))
+        f.write(struct.pack(str('<%dI' % hash_size), *hash_table))
+        f.write(b''.join(strings))
+
+
+class MappedCatalog(collections.Mapping):
+    """
+    A read-only mapping with the same keys and values as the catalog of a
+    gettext.GNUTranslations, backed by a .mo file written by
+    write_catalog().
+    """
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, revision, self._count, self._originals_offset, self._translations_offset,
+         self._hash_size, self._hash_offset) = struct.unpack_from(HEADER_FORMAT, self._data)
+        if magic != MO_MAGIC or self._hash_size < 3:
+            raise ValueError("%s isn't a compiled catalog." % path)
+
+    def _string(self, table_offset, index):
+        length, offset = struct.unpack_from(str('<2I'), self._data, table_offset + 8 * index)
+        return self._data[offset:offset + length]
+
+    def _find(self, msgid, plural):
+        """
+        Returns the translation of the entry for msgid, a bytestring, or
+        None. If plural is True, only entries with plural forms match.
+        """
+        hval = hash_string(msgid)
+        slot = hval % self._hash_size
+        increment = 1 + (hval % (self._hash_size - 2))
+        original = msgid + b'\0' if plural else msgid
+        while True:
+            index = struct.unpack_from(str('<I'), self._data, self._hash_offset + 4 * slot)[0]
+            if not index:
+                return None
+            candidate = self._string(self._originals_offset, index - 1)
+            if candidate == original or (plural and candidate.startswith(original)):
+                return self._string(self._translations_offset, index - 1)
+            slot = (slot + increment) % self._hash_size
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            msgstr = self._find(_encode(key[0]), plural=True)
+            if msgstr is not None:
+                forms = msgstr.split(b'\0')
+                if 0 <= key[1] < len(forms):
+                    return forms[key[1]].decode('utf-8')
+        else:
+            msgstr = self._find(_encode(key), plural=False)
+            if msgstr is not None:
+                return msgstr.decode('utf-8')
+        raise KeyError(key)
+
+    def __iter__(self):
+        for index in range(self._count):
+            msgid = self._string(self._originals_offset, index)
+            if b'\0' in msgid:
+                msgid = msgid.split(b'\0')[0].decode('utf-8')
+                msgstr = self._string(self._translations_offset, index)
+                for form in range(msgstr.count(b'\0') + 1):
+                    yield (msgid, form)
+            else:
+                yield msgid.decode('utf-8')
+
+    def __len__(self):
+        return sum(1 for key in self)
@@ -2,6 +2,7 @@
 from __future__ import unicode_literals
 
 from collections import OrderedDict
+import hashlib
 import os
 import re
 import sys
@@ -22,6 +23,7 @@ from django.utils.safestring import mark_safe, SafeData
 from django.utils import six, lru_cache
 from django.utils.six import StringIO
 from django.utils.translation import TranslatorCommentWarning, trim_whitespace, LANGUAGE_SESSION_KEY
+from django.utils.translation.catalog import MappedCatalog, write_catalog
 
 # Translations are cached in a dictionary for every language.
 # The active translations are stored by threadid to make them thread local.
@@ -97,6 +99,19 @@ def to_language(locale):
         return locale.lower()
 
 
+# The header of merged catalogs which identifies the catalogs they were
+# merged from, see catalog_sources_fingerprint().
+SOURCES_HEADER = 'x-django-sources'
+
+
+def catalog_sources_fingerprint(mofiles):
+    """
+    Returns a fingerprint of the list of paths of the catalogs a merged
+    catalog is made of.
+    """
+    return hashlib.md5('\n'.join(mofiles).encode('utf-8')).hexdigest()
+
+
 class DjangoTranslation(gettext_module.GNUTranslations):
     """
     This class sets up the GNUTranslations context with regard to output
@@ -106,8 +121,11 @@ class DjangoTranslation(gettext_module.GNUTranslations):
     objects by merging their catalogs. It will construct an object for the
     requested language and add a fallback to the default language, if it's
     different from the requested language.
+
+    If LOCALE_CATALOGS_DIR contains an up to date merged catalog for the
+    language, written by write_compiled_catalog(), it's used instead.
     """
-    def __init__(self, language):
+    def __init__(self, language, use_compiled_catalog=True):
         """Create a GNUTranslations() using many locale directories"""
         gettext_module.GNUTranslations.__init__(self)
 
@@ -116,9 +134,10 @@ class DjangoTranslation(gettext_module.GNUTranslations):
         self.__locale = to_locale(language)
         self.plural = lambda n: int(n != 1)
 
-        self._init_translation_catalog()
-        self._add_installed_apps_translations()
-        self._add_local_translations()
+        if not (use_compiled_catalog and self._load_compiled_catalog()):
+            self._init_translation_catalog()
+            self._add_installed_apps_translations()
+            self._add_local_translations()
         self._add_fallback()
 
     def __repr__(self):
@@ -144,6 +163,67 @@ class DjangoTranslation(gettext_module.GNUTranslations):
             translation._info = {}
         return translation
 
+    def _get_app_configs(self):
+        try:
+            return list(apps.get_app_configs())
+        except AppRegistryNotReady:
+            raise AppRegistryNotReady(
+                "The translation infrastructure cannot be initialized before the "
+                "apps registry is ready. Check that you don't make non-lazy "
+                "gettext calls at import time.")
+
+    def _get_catalog_path(self):
+        """
+        Returns the path of the merged catalog of the language, or None if
+        LOCALE_CATALOGS_DIR isn't set.
+        """
+        if settings.LOCALE_CATALOGS_DIR is None:
+            return None
+        return os.path.join(settings.LOCALE_CATALOGS_DIR, '%s.mo' % self.__locale)
+
+    def _get_source_catalogs(self):
+        """
+        Returns the paths of the catalogs of the language that are merged:
+        those of the project, of the installed apps and of LOCALE_PATHS.
+        """
+        settingsfile = upath(sys.modules[settings.__module__].__file__)
+        localedirs = [os.path.join(os.path.dirname(settingsfile), 'locale')]
+        localedirs.extend(os.path.join(app_config.path, 'locale') for app_config in self._get_app_configs())
+        localedirs.extend(settings.LOCALE_PATHS)
+        mofiles = []
+        for localedir in localedirs:
+            mofiles.extend(gettext_module.find('django', localedir, [self.__locale], all=True))
+        return mofiles
+
+    def _load_compiled_catalog(self):
+        """
+        Uses the merged catalog of the language if it exists, was merged from
+        the current source catalogs and is more recent than all of them.
+        Returns whether it was used.
+        """
+        path = self._get_catalog_path()
+        if path is None:
+            return False
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            return False
+        mofiles = self._get_source_catalogs()
+        if any(os.path.getmtime(mofile) > mtime for mofile in mofiles):
+            return False
+        catalog = MappedCatalog(path)
+        info = {}
+        for line in catalog[''].splitlines():
+            key, _, value = line.partition(':')
+            info[key.strip().lower()] = value.strip()
+        # Apps or LOCALE_PATHS may have been added or removed since the
+        # catalog was merged.
+        if info.pop(SOURCES_HEADER, None) != catalog_sources_fingerprint(mofiles):
+            return False
+        self._catalog = catalog
+        self._info = info
+        return True
+
     def _init_translation_catalog(self):
         """Creates a base catalog using global django translations."""
         settingsfile = upath(sys.modules[settings.__module__].__file__)
@@ -159,14 +239,7 @@ class DjangoTranslation(gettext_module.GNUTranslations):
 
     def _add_installed_apps_translations(self):
         """Merges translations from each installed app."""
-        try:
-            app_configs = reversed(list(apps.get_app_configs()))
-        except AppRegistryNotReady:
-            raise AppRegistryNotReady(
-                "The translation infrastructure cannot be initialized before the "
-                "apps registry is ready. Check that you don't make non-lazy "
-                "gettext calls at import time.")
-        for app_config in app_configs:
+        for app_config in reversed(self._get_app_configs()):
             localedir = os.path.join(app_config.path, 'locale')
             translation = self._new_gnu_trans(localedir)
             self.merge(translation)
@@ -190,6 +263,9 @@ class DjangoTranslation(gettext_module.GNUTranslations):
 
     def merge(self, other):
         """Merge another translation into this catalog."""
+        if not isinstance(self._catalog, dict):
+            # A compiled catalog is read-only.
+            self._catalog = dict(self._catalog)
         self._catalog.update(other._catalog)
 
     def language(self):
@@ -201,6 +277,28 @@ class DjangoTranslation(gettext_module.GNUTranslations):
         return self.__to_language
 
 
+def write_compiled_catalog(language):
+    """
+    Writes the catalog of the language, merged from the catalogs of the
+    project, of the installed apps and of LOCALE_PATHS, to
+    LOCALE_CATALOGS_DIR. Returns the path of the file.
+    """
+    trans = DjangoTranslation(language, use_compiled_catalog=False)
+    path = trans._get_catalog_path()
+    if not os.path.isdir(settings.LOCALE_CATALOGS_DIR):
+        os.makedirs(settings.LOCALE_CATALOGS_DIR)
+    # Write to a temporary file and rename it, so that processes loading the
+    # catalog never see a partial file.
+    tmp_path = '%s.%d.tmp' % (path, os.getpid())
+    info = dict(trans._info)
+    info[SOURCES_HEADER] = catalog_sources_fingerprint(trans._get_source_catalogs())
+    write_catalog(tmp_path, trans._catalog, info)
+    if os.name == 'nt' and os.path.exists(path):
+        os.remove(path)
+    os.rename(tmp_path, path)
+    return path
+
+
 def translation(language):
     """
     Returns a translation object.
@@ -10,8 +10,8 @@ import stat
 import posixpath
 import re
 
-from django.http import (Http404, HttpResponse, HttpResponseRedirect,
-    HttpResponseNotModified, StreamingHttpResponse)
+from django.http import (FileResponse, Http404, HttpResponse,
+    HttpResponseRedirect, HttpResponseNotModified)
 from django.template import loader, Template, Context, TemplateDoesNotExist
 from django.utils.http import http_date, parse_http_date
 from django.utils.six.moves.urllib.parse import unquote
@@ -63,11 +63,33 @@ def serve(request, path, document_root=None, show_indexes=False):
         return HttpResponseNotModified()
     content_type, encoding = mimetypes.guess_type(fullpath)
     content_type = content_type or 'application/octet-stream'
-    response = StreamingHttpResponse(open(fullpath, 'rb'),
-                                     content_type=content_type)
-    response["Last-Modified"] = http_date(statobj.st_mtime)
+    last_modified = http_date(statobj.st_mtime)
+    byte_range = None
+    if stat.S_ISREG(statobj.st_mode) and request.META.get('HTTP_IF_RANGE', last_modified) == last_modified:
+        try:
+            byte_range = parse_range_header(request.META.get('HTTP_RANGE'), statobj.st_size)
+        except ValueError:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = 'bytes */%d' % statobj.st_size
+            return response
+    f = open(fullpath, 'rb')
+    if byte_range is None:
+        response = FileResponse(f, content_type=content_type)
+        if stat.S_ISREG(statobj.st_mode):
+            response["Content-Length"] = statobj.st_size
+    else:
+        start, end = byte_range
+        f.seek(start)
+        response = FileResponse(f, content_type=content_type, status=206)
+        if end < statobj.st_size - 1:
+            # Stop before the end of the file. This prevents the file from
+            # being handed to wsgi.file_wrapper, which would send it all.
+            response.streaming_content = read_file_range(f, end - start + 1)
+        response["Content-Range"] = 'bytes %d-%d/%d' % (start, end, statobj.st_size)
+        response["Content-Length"] = end - start + 1
+    response["Last-Modified"] = last_modified
     if stat.S_ISREG(statobj.st_mode):
-        response["Content-Length"] = statobj.st_size
+        response["Accept-Ranges"] = 'bytes'
     if encoding:
         response["Content-Encoding"] = encoding
     return response
@@ -146,3 +168,47 @@ def was_modified_since(header=None, mtime=0, size=0):
     except (AttributeError, ValueError, OverflowError):
         return True
     return False
+
+
+def parse_range_header(header, size):
+    """
+    Parses the value of a Range header asking for a single range of bytes
+    of a file of the given size, and returns the (first, last) positions of
+    the range, both inclusive. Returns None when the header is missing,
+    malformed or asks for several ranges, in which case the whole file
+    should be sent. Raises ValueError when the range can't be satisfied.
+    """
+    if header is None:
+        return None
+    matches = re.match(r"^\s*bytes\s*=\s*([0-9]*)\s*-\s*([0-9]*)\s*$", header)
+    if matches is None:
+        return None
+    first, last = matches.groups()
+    if first:
+        first = int(first)
+        if last and int(last) < first:
+            # An invalid range, ignored.
+            return None
+        if first >= size:
+            raise ValueError
+        last = min(int(last), size - 1) if last else size - 1
+    elif last:
+        # A suffix range: the last bytes of the file.
+        if not int(last) or not size:
+            raise ValueError
+        first, last = max(size - int(last), 0), size - 1
+    else:
+        return None
+    return first, last
+
+
+def read_file_range(f, length, block_size=FileResponse.block_size):
+    """
+    Yields the next length bytes of the file f in chunks.
+    """
+    while length > 0:
+        data = f.read(min(block_size, length))
+        if not data:
+            break
+        length -= len(data)
+        yield data
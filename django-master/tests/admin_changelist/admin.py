@@ -44,6 +44,23 @@ class CustomPaginationAdmin(ChildAdmin):
     paginator = CustomPaginator
 
 
+class KeysetPaginationChildAdmin(admin.ModelAdmin):
+    list_display = ['name', 'parent']
+    list_per_page = 10
+    list_filter = ['parent']
+    search_fields = ['name']
+    keyset_pagination = True
+
+
+class ParentNameChildAdmin(admin.ModelAdmin):
+    list_display = ['name', 'parent_name']
+    search_fields = ['name']
+
+    def parent_name(self, obj):
+        return obj.parent.name
+    parent_name.admin_order_field = 'parent__name'
+
+
 class FilteredChildAdmin(admin.ModelAdmin):
     list_display = ['name', 'parent']
     list_per_page = 10
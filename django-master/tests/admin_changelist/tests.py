@@ -5,13 +5,17 @@ import datetime
 from django.contrib import admin
 from django.contrib.admin.options import IncorrectLookupParameters
 from django.contrib.admin.templatetags.admin_list import pagination
-from django.contrib.admin.views.main import ChangeList, SEARCH_VAR, ALL_VAR
+from django.contrib.admin.views.main import (ChangeList, SEARCH_VAR, ALL_VAR,
+    CURSOR_VAR, ORDER_VAR)
 from django.contrib.admin.tests import AdminSeleniumWebDriverTestCase
 from django.contrib.auth.models import User
+from django.core.signals import request_finished
 from django.core.urlresolvers import reverse
+from django.db import connection
 from django.template import Context, Template
 from django.test import TestCase, override_settings
 from django.test.client import RequestFactory
+from django.test.utils import patch_logger
 from django.utils import formats
 from django.utils import six
 
@@ -20,7 +24,8 @@ from .admin import (ChildAdmin, QuartetAdmin, BandAdmin, ChordsBandAdmin,
     DynamicListDisplayLinksChildAdmin, CustomPaginationAdmin,
     FilteredChildAdmin, CustomPaginator, site as custom_site,
     SwallowAdmin, DynamicListFilterChildAdmin, InvitationAdmin,
-    DynamicSearchFieldsChildAdmin, NoListDisplayLinksParentAdmin)
+    DynamicSearchFieldsChildAdmin, NoListDisplayLinksParentAdmin,
+    KeysetPaginationChildAdmin, ParentNameChildAdmin)
 from .models import (Event, Child, Parent, Genre, Band, Musician, Group,
     Quartet, Membership, ChordsMusician, ChordsBand, Invitation, Swallow,
     UnorderedObject, OrderedObject, CustomIdUser)
@@ -74,6 +79,48 @@ class ChangeListTests(TestCase):
                         ia.list_max_show_all, ia.list_editable, ia)
         self.assertEqual(cl.queryset.query.select_related, False)
 
+    def test_select_related_inferred_from_list_display(self):
+        """
+        Nullable foreign keys in list_display, and the relations followed by
+        the admin_order_field of callables, are passed to select_related().
+        """
+        for m in (FilteredChildAdmin(Child, admin.site),
+                  ParentNameChildAdmin(Child, admin.site)):
+            request = self.factory.get('/child/')
+            cl = ChangeList(request, Child, m.list_display, m.list_display_links,
+                            m.list_filter, m.date_hierarchy, m.search_fields,
+                            m.list_select_related, m.list_per_page,
+                            m.list_max_show_all, m.list_editable, m)
+            self.assertEqual(cl.queryset.query.select_related, {'parent': {}})
+
+    def test_select_related_follows_non_null_relations(self):
+        """
+        The non-null foreign keys of the model and of the related models in
+        list_display are followed, like select_related() without arguments.
+        """
+        ia = InvitationAdmin(Invitation, admin.site)
+        ia.list_display = ('player',)
+        ia.list_select_related = False
+        request = self.factory.get('/invitation/')
+        cl = ChangeList(request, Invitation, ia.list_display, ia.list_display_links,
+                        ia.list_filter, ia.date_hierarchy, ia.search_fields,
+                        ia.list_select_related, ia.list_per_page,
+                        ia.list_max_show_all, ia.list_editable, ia)
+        self.assertEqual(cl.queryset.query.select_related, {
+            'band': {},
+            'player': {'musician_ptr': {}},
+        })
+
+    def test_list_prefetch_related(self):
+        m = BandAdmin(Band, admin.site)
+        m.list_prefetch_related = ('genres',)
+        request = self.factory.get('/band/')
+        cl = ChangeList(request, Band, m.list_display, m.list_display_links,
+                        m.list_filter, m.date_hierarchy, m.search_fields,
+                        m.list_select_related, m.list_per_page,
+                        m.list_max_show_all, m.list_editable, m)
+        self.assertEqual(cl.queryset._prefetch_related_lookups, ['genres'])
+
     def test_result_list_empty_changelist_value(self):
         """
         Regression test for #14982: EMPTY_CHANGELIST_VALUE should be honored
@@ -643,6 +690,199 @@ class ChangeListTests(TestCase):
                 list(real_page_range),
             )
 
+    def test_filtered_result_counts_single_query(self):
+        """
+        The filtered and the total number of objects are counted with a
+        single query, and displaying the rows doesn't query each parent.
+        """
+        for i in range(3):
+            parent = Parent.objects.create(name='parent %s' % i)
+            Child.objects.create(name='name %s' % i, parent=parent)
+        Child.objects.create(name='other', parent=parent)
+        m = ParentNameChildAdmin(Child, admin.site)
+        request = self.factory.get('/child/?%s=name' % SEARCH_VAR)
+        with self.assertNumQueries(1):
+            cl = ChangeList(request, Child, m.list_display, m.list_display_links,
+                            m.list_filter, m.date_hierarchy, m.search_fields,
+                            m.list_select_related, m.list_per_page,
+                            m.list_max_show_all, m.list_editable, m)
+        self.assertEqual(cl.result_count, 3)
+        self.assertEqual(cl.full_result_count, 4)
+        with self.assertNumQueries(1):
+            names = [m.parent_name(child) for child in cl.result_list]
+        self.assertEqual(sorted(names), ['parent 0', 'parent 1', 'parent 2'])
+
+    def test_filtered_result_counts_no_results(self):
+        Child.objects.create(name='name')
+        m = ParentNameChildAdmin(Child, admin.site)
+        request = self.factory.get('/child/?%s=nothing' % SEARCH_VAR)
+        cl = ChangeList(request, Child, m.list_display, m.list_display_links,
+                        m.list_filter, m.date_hierarchy, m.search_fields,
+                        m.list_select_related, m.list_per_page,
+                        m.list_max_show_all, m.list_editable, m)
+        self.assertEqual(cl.result_count, 0)
+        self.assertEqual(cl.full_result_count, 1)
+
+    def test_list_query_budget(self):
+        """
+        A warning is logged when building and rendering the change list runs
+        more queries than list_query_budget.
+        """
+        parent = Parent.objects.create(name='parent')
+        Child.objects.create(name='name', parent=parent)
+        m = ParentNameChildAdmin(Child, admin.site)
+        superuser = self._create_superuser('superuser')
+
+        m.list_query_budget = 10
+        request = self._mocked_authenticated_request('/child/', superuser)
+        with patch_logger('django.contrib.admin', 'warning') as calls:
+            response = m.changelist_view(request)
+            response.render()
+        self.assertEqual(calls, [])
+
+        m.list_query_budget = 1
+        request = self._mocked_authenticated_request('/child/', superuser)
+        with patch_logger('django.contrib.admin', 'warning') as calls:
+            with self.assertNumQueries(2):
+                response = m.changelist_view(request)
+                response.render()
+        self.assertEqual(len(calls), 1)
+        self.assertIn(
+            'Change list of admin_changelist.child ran 2 queries, more than '
+            'its budget of 1.', calls[0])
+
+    def test_list_query_budget_unrendered_response(self):
+        """
+        Queries stop being recorded at the end of the request if the change
+        list isn't rendered.
+        """
+        m = ParentNameChildAdmin(Child, admin.site)
+        m.list_query_budget = 10
+        superuser = self._create_superuser('superuser')
+        request = self._mocked_authenticated_request('/child/', superuser)
+        queries_log = connection.queries_log
+        force_debug_cursor = connection.force_debug_cursor
+        m.changelist_view(request)
+        self.assertIsNot(connection.queries_log, queries_log)
+        request_finished.send(sender=self.__class__)
+        self.assertIs(connection.queries_log, queries_log)
+        self.assertEqual(connection.force_debug_cursor, force_debug_cursor)
+
+    def _keyset_changelist(self, url, m):
+        request = self.factory.get(url)
+        return ChangeList(request, Child, m.list_display, m.list_display_links,
+                m.list_filter, m.date_hierarchy, m.search_fields,
+                m.list_select_related, m.list_per_page, m.list_max_show_all,
+                m.list_editable, m)
+
+    def test_keyset_pagination(self):
+        parent = Parent.objects.create(name='anything')
+        for i in range(25):
+            Child.objects.create(name='name %s' % i, parent=parent)
+        m = KeysetPaginationChildAdmin(Child, admin.site)
+
+        cl = self._keyset_changelist('/child/', m)
+        self.assertEqual(cl.result_count, 25)
+        self.assertEqual(cl.full_result_count, 25)
+        self.assertTrue(cl.multi_page)
+        context = pagination(cl)
+        self.assertTrue(context['pagination_required'])
+        self.assertEqual(context['page_range'], [])
+        self.assertIsNone(context['previous_url'])
+        self.assertIn('%s=' % CURSOR_VAR, context['next_url'])
+
+        seen = [c.pk for c in cl.result_list]
+        next_url = context['next_url']
+        while next_url:
+            cl = self._keyset_changelist('/child/' + next_url, m)
+            # The cursor isn't treated as a lookup parameter.
+            self.assertNotIn(CURSOR_VAR, cl.params)
+            seen.extend(c.pk for c in cl.result_list)
+            context = pagination(cl)
+            self.assertIsNotNone(context['previous_url'])
+            next_url = context['next_url']
+        self.assertEqual(seen, list(Child.objects.order_by('-pk').values_list('pk', flat=True)))
+
+    def test_keyset_pagination_nullable_ordering(self):
+        """
+        The change list can be sorted by a column containing NULL values.
+        """
+        parent = Parent.objects.create(name='anything')
+        for i in range(25):
+            Child.objects.create(name='name %s' % i, parent=parent if i % 3 else None)
+        m = KeysetPaginationChildAdmin(Child, admin.site)
+        # The parent column, the view adds the action checkbox before it.
+        for order in ('1', '-1'):
+            cl = self._keyset_changelist('/child/?%s=%s' % (ORDER_VAR, order), m)
+            expected = list(cl.queryset.values_list('pk', flat=True))
+            pages = [[c.pk for c in cl.result_list]]
+            context = pagination(cl)
+            while context['next_url']:
+                cl = self._keyset_changelist('/child/' + context['next_url'], m)
+                pages.append([c.pk for c in cl.result_list])
+                context = pagination(cl)
+            self.assertEqual(sum(pages, []), expected)
+            # Going back from the last page gives the same pages.
+            for page in reversed(pages[:-1]):
+                cl = self._keyset_changelist('/child/' + context['previous_url'], m)
+                self.assertEqual([c.pk for c in cl.result_list], page)
+                context = pagination(cl)
+            self.assertIsNone(context['previous_url'])
+
+        request = self._mocked_authenticated_request(
+            '/child/?%s=2' % ORDER_VAR, self._create_superuser('superuser'))
+        response = m.changelist_view(request)
+        self.assertContains(response, 'class="next"')
+
+    def test_keyset_pagination_filtered(self):
+        """
+        Filtered results aren't counted with keyset pagination.
+        """
+        parent = Parent.objects.create(name='anything')
+        for i in range(5):
+            Child.objects.create(name='name %s' % i, parent=parent)
+        m = KeysetPaginationChildAdmin(Child, admin.site)
+        with self.assertNumQueries(3):
+            # The parent filter choices, the full result count and the page.
+            cl = self._keyset_changelist('/child/?%s=name' % SEARCH_VAR, m)
+        self.assertIsNone(cl.result_count)
+        self.assertEqual(cl.full_result_count, 5)
+        self.assertFalse(cl.multi_page)
+        self.assertFalse(pagination(cl)['pagination_required'])
+
+        m.show_full_result_count = False
+        with self.assertNumQueries(2):
+            cl = self._keyset_changelist('/child/?%s=name' % SEARCH_VAR, m)
+        self.assertIsNone(cl.full_result_count)
+
+    def test_keyset_pagination_invalid_cursor(self):
+        m = KeysetPaginationChildAdmin(Child, admin.site)
+        with self.assertRaises(IncorrectLookupParameters):
+            self._keyset_changelist('/child/?%s=invalid' % CURSOR_VAR, m)
+
+    def test_keyset_pagination_view(self):
+        parent = Parent.objects.create(name='anything')
+        for i in range(15):
+            Child.objects.create(name='name %s' % i, parent=parent)
+        m = KeysetPaginationChildAdmin(Child, admin.site)
+        request = self._mocked_authenticated_request(
+            '/child/?%s=name' % SEARCH_VAR, self._create_superuser('superuser'))
+        response = m.changelist_view(request)
+        self.assertContains(response, 'class="next"')
+        self.assertNotContains(response, 'class="previous"')
+        self.assertNotContains(response, 'None children')
+
+    def test_estimated_result_count(self):
+        """
+        Without statistics from the database, the count falls back to COUNT.
+        """
+        parent = Parent.objects.create(name='anything')
+        Child.objects.create(name='name', parent=parent)
+        m = KeysetPaginationChildAdmin(Child, admin.site)
+        m.estimate_result_count = True
+        cl = self._keyset_changelist('/child/', m)
+        self.assertEqual(cl.full_result_count, 1)
+
 
 class AdminLogNodeTestCase(TestCase):
 
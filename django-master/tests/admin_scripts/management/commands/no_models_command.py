@@ -0,0 +1,16 @@
+import sys
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Test command that doesn't require models"
+    requires_models = False
+
+    def handle(self, **options):
+        models = [
+            app_config.label for app_config in apps.get_app_configs()
+            if sys.modules.get('%s.models' % app_config.name) is not None
+        ]
+        print('EXECUTE: no_models_command models=%s ready=%s' % (models, apps.ready))
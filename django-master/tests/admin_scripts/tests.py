@@ -30,22 +30,34 @@ from django.test import LiveServerTestCase, TestCase, override_settings
 from django.test.runner import DiscoverRunner
 
 
-test_dir = os.path.realpath(os.path.join(os.environ['DJANGO_TEST_TEMP_DIR'], 'test_project'))
-if not os.path.exists(test_dir):
-    os.mkdir(test_dir)
-    open(os.path.join(test_dir, '__init__.py'), 'w').close()
-
 custom_templates_dir = os.path.join(os.path.dirname(__file__), 'custom_templates')
 
 
 class AdminScriptTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super(AdminScriptTestCase, cls).setUpClass()
+        # Each test case class has its own directory, so that they can be
+        # run in parallel.
+        cls.test_dir = os.path.realpath(os.path.join(
+            os.environ['DJANGO_TEST_TEMP_DIR'], cls.__name__, 'test_project'))
+        if not os.path.exists(cls.test_dir):
+            os.makedirs(cls.test_dir)
+        with open(os.path.join(cls.test_dir, '__init__.py'), 'w'):
+            pass
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(os.path.dirname(cls.test_dir))
+        super(AdminScriptTestCase, cls).tearDownClass()
+
     def write_settings(self, filename, apps=None, is_dir=False, sdict=None, extra=None):
         if is_dir:
-            settings_dir = os.path.join(test_dir, filename)
+            settings_dir = os.path.join(self.test_dir, filename)
             os.mkdir(settings_dir)
             settings_file_path = os.path.join(settings_dir, '__init__.py')
         else:
-            settings_file_path = os.path.join(test_dir, filename)
+            settings_file_path = os.path.join(self.test_dir, filename)
 
         with open(settings_file_path, 'w') as settings_file:
             settings_file.write('# -*- coding: utf-8 -*\n')
@@ -76,7 +88,7 @@ class AdminScriptTestCase(unittest.TestCase):
                     settings_file.write("%s = %s\n" % (k, v))
 
     def remove_settings(self, filename, is_dir=False):
-        full_name = os.path.join(test_dir, filename)
+        full_name = os.path.join(self.test_dir, filename)
         if is_dir:
             shutil.rmtree(full_name)
         else:
@@ -94,7 +106,7 @@ class AdminScriptTestCase(unittest.TestCase):
         except OSError:
             pass
         # Also remove a __pycache__ directory, if it exists
-        cache_name = os.path.join(test_dir, '__pycache__')
+        cache_name = os.path.join(self.test_dir, '__pycache__')
         if os.path.isdir(cache_name):
             shutil.rmtree(cache_name)
 
@@ -113,7 +125,7 @@ class AdminScriptTestCase(unittest.TestCase):
         return paths
 
     def run_test(self, script, args, settings_file=None, apps=None):
-        base_dir = os.path.dirname(test_dir)
+        base_dir = os.path.dirname(self.test_dir)
         # The base dir for Django's tests is one level up.
         tests_dir = os.path.dirname(os.path.dirname(__file__))
         # The base dir for Django is one level above the test dir. We don't use
@@ -143,7 +155,7 @@ class AdminScriptTestCase(unittest.TestCase):
         test_environ[str('PYTHONWARNINGS')] = str('')
 
         # Move to the test directory and run
-        os.chdir(test_dir)
+        os.chdir(self.test_dir)
         out, err = subprocess.Popen([sys.executable, script] + args,
                 stdout=subprocess.PIPE, stderr=subprocess.PIPE,
                 env=test_environ, universal_newlines=True).communicate()
@@ -166,7 +178,7 @@ class AdminScriptTestCase(unittest.TestCase):
         conf_dir = os.path.dirname(upath(conf.__file__))
         template_manage_py = os.path.join(conf_dir, 'project_template', 'manage.py')
 
-        test_manage_py = os.path.join(test_dir, 'manage.py')
+        test_manage_py = os.path.join(self.test_dir, 'manage.py')
         shutil.copyfile(template_manage_py, test_manage_py)
 
         with open(test_manage_py, 'r') as fp:
@@ -590,7 +602,7 @@ class DjangoAdminSettingsDirectory(AdminScriptTestCase):
     def test_setup_environ(self):
         "directory: startapp creates the correct directory"
         args = ['startapp', 'settings_test']
-        app_path = os.path.join(test_dir, 'settings_test')
+        app_path = os.path.join(self.test_dir, 'settings_test')
         out, err = self.run_django_admin(args, 'test_project.settings')
         self.addCleanup(shutil.rmtree, app_path)
         self.assertNoOutput(err)
@@ -600,7 +612,7 @@ class DjangoAdminSettingsDirectory(AdminScriptTestCase):
         "directory: startapp creates the correct directory with a custom template"
         template_path = os.path.join(custom_templates_dir, 'app_template')
         args = ['startapp', '--template', template_path, 'custom_settings_test']
-        app_path = os.path.join(test_dir, 'custom_settings_test')
+        app_path = os.path.join(self.test_dir, 'custom_settings_test')
         out, err = self.run_django_admin(args, 'test_project.settings')
         self.addCleanup(shutil.rmtree, app_path)
         self.assertNoOutput(err)
@@ -1039,7 +1051,7 @@ class ManageSettingsWithSettingsErrors(AdminScriptTestCase):
         self.remove_settings('settings.py')
 
     def write_settings_with_import_error(self, filename):
-        settings_file_path = os.path.join(test_dir, filename)
+        settings_file_path = os.path.join(self.test_dir, filename)
         with open(settings_file_path, 'w') as settings_file:
             settings_file.write('# Settings file automatically generated by admin_scripts test case\n')
             settings_file.write('# The next line will cause an import error:\nimport foo42bar\n')
@@ -1581,6 +1593,40 @@ class CommandTypes(AdminScriptTestCase):
             self.assertRaises(ImproperlyConfigured, InvalidCommand)
 
 
+class DeferModelImports(AdminScriptTestCase):
+    """
+    Tests for management commands when DEFER_MODEL_IMPORTS is True.
+    """
+    def setUp(self):
+        self.write_settings('settings.py', apps=[
+            'django.contrib.auth',
+            'django.contrib.contenttypes',
+            'admin_scripts',
+            'admin_scripts.broken_app',
+        ], sdict={'DEFER_MODEL_IMPORTS': True})
+
+    def tearDown(self):
+        self.remove_settings('settings.py')
+
+    def test_command_without_models(self):
+        "A command that doesn't require models doesn't import models modules"
+        out, err = self.run_manage(['no_models_command'])
+        self.assertNoOutput(err)
+        self.assertOutput(out, "EXECUTE: no_models_command models=[] ready=False")
+
+    def test_command_with_models(self):
+        "Models are imported before executing other commands, even without system checks"
+        out, err = self.run_manage(['noargs_command'])
+        self.assertNoOutput(out)
+        self.assertOutput(err, 'ImportError')
+
+    def test_check(self):
+        "The check command imports models"
+        out, err = self.run_manage(['check'])
+        self.assertNoOutput(out)
+        self.assertOutput(err, 'ImportError')
+
+
 class Discovery(TestCase):
 
     def test_precedence(self):
@@ -1672,7 +1718,7 @@ class StartProject(LiveServerTestCase, AdminScriptTestCase):
     def test_simple_project(self):
         "Make sure the startproject management command creates a project"
         args = ['startproject', 'testproject']
-        testproject_dir = os.path.join(test_dir, 'testproject')
+        testproject_dir = os.path.join(self.test_dir, 'testproject')
         self.addCleanup(shutil.rmtree, testproject_dir, True)
 
         out, err = self.run_django_admin(args)
@@ -1688,7 +1734,7 @@ class StartProject(LiveServerTestCase, AdminScriptTestCase):
         "Make sure the startproject management command validates a project name"
         for bad_name in ('7testproject', '../testproject'):
             args = ['startproject', bad_name]
-            testproject_dir = os.path.join(test_dir, bad_name)
+            testproject_dir = os.path.join(self.test_dir, bad_name)
             self.addCleanup(shutil.rmtree, testproject_dir, True)
 
             out, err = self.run_django_admin(args)
@@ -1699,7 +1745,7 @@ class StartProject(LiveServerTestCase, AdminScriptTestCase):
     def test_simple_project_different_directory(self):
         "Make sure the startproject management command creates a project in a specific directory"
         args = ['startproject', 'testproject', 'othertestproject']
-        testproject_dir = os.path.join(test_dir, 'othertestproject')
+        testproject_dir = os.path.join(self.test_dir, 'othertestproject')
         os.mkdir(testproject_dir)
         self.addCleanup(shutil.rmtree, testproject_dir)
 
@@ -1716,7 +1762,7 @@ class StartProject(LiveServerTestCase, AdminScriptTestCase):
         "Make sure the startproject management command is able to use a different project template"
         template_path = os.path.join(custom_templates_dir, 'project_template')
         args = ['startproject', '--template', template_path, 'customtestproject']
-        testproject_dir = os.path.join(test_dir, 'customtestproject')
+        testproject_dir = os.path.join(self.test_dir, 'customtestproject')
         self.addCleanup(shutil.rmtree, testproject_dir, True)
 
         out, err = self.run_django_admin(args)
@@ -1728,7 +1774,7 @@ class StartProject(LiveServerTestCase, AdminScriptTestCase):
         "Ticket 17475: Template dir passed has a trailing path separator"
         template_path = os.path.join(custom_templates_dir, 'project_template' + os.sep)
         args = ['startproject', '--template', template_path, 'customtestproject']
-        testproject_dir = os.path.join(test_dir, 'customtestproject')
+        testproject_dir = os.path.join(self.test_dir, 'customtestproject')
         self.addCleanup(shutil.rmtree, testproject_dir, True)
 
         out, err = self.run_django_admin(args)
@@ -1740,7 +1786,7 @@ class StartProject(LiveServerTestCase, AdminScriptTestCase):
         "Make sure the startproject management command is able to use a different project template from a tarball"
         template_path = os.path.join(custom_templates_dir, 'project_template.tgz')
         args = ['startproject', '--template', template_path, 'tarballtestproject']
-        testproject_dir = os.path.join(test_dir, 'tarballtestproject')
+        testproject_dir = os.path.join(self.test_dir, 'tarballtestproject')
         self.addCleanup(shutil.rmtree, testproject_dir, True)
 
         out, err = self.run_django_admin(args)
@@ -1752,7 +1798,7 @@ class StartProject(LiveServerTestCase, AdminScriptTestCase):
         "Startproject can use a project template from a tarball and create it in a specified location"
         template_path = os.path.join(custom_templates_dir, 'project_template.tgz')
         args = ['startproject', '--template', template_path, 'tarballtestproject', 'altlocation']
-        testproject_dir = os.path.join(test_dir, 'altlocation')
+        testproject_dir = os.path.join(self.test_dir, 'altlocation')
         os.mkdir(testproject_dir)
         self.addCleanup(shutil.rmtree, testproject_dir)
 
@@ -1766,7 +1812,7 @@ class StartProject(LiveServerTestCase, AdminScriptTestCase):
         template_url = '%s/custom_templates/project_template.tgz' % self.live_server_url
 
         args = ['startproject', '--template', template_url, 'urltestproject']
-        testproject_dir = os.path.join(test_dir, 'urltestproject')
+        testproject_dir = os.path.join(self.test_dir, 'urltestproject')
         self.addCleanup(shutil.rmtree, testproject_dir, True)
 
         out, err = self.run_django_admin(args)
@@ -1779,7 +1825,7 @@ class StartProject(LiveServerTestCase, AdminScriptTestCase):
         template_url = '%s/custom_templates/project_template.tgz/' % self.live_server_url
 
         args = ['startproject', '--template', template_url, 'urltestproject']
-        testproject_dir = os.path.join(test_dir, 'urltestproject')
+        testproject_dir = os.path.join(self.test_dir, 'urltestproject')
         self.addCleanup(shutil.rmtree, testproject_dir, True)
 
         out, err = self.run_django_admin(args)
@@ -1791,7 +1837,7 @@ class StartProject(LiveServerTestCase, AdminScriptTestCase):
         "Make sure the startproject management command is able to render custom files"
         template_path = os.path.join(custom_templates_dir, 'project_template')
         args = ['startproject', '--template', template_path, 'customtestproject', '-e', 'txt', '-n', 'Procfile']
-        testproject_dir = os.path.join(test_dir, 'customtestproject')
+        testproject_dir = os.path.join(self.test_dir, 'customtestproject')
         self.addCleanup(shutil.rmtree, testproject_dir, True)
 
         out, err = self.run_django_admin(args)
@@ -1809,7 +1855,7 @@ class StartProject(LiveServerTestCase, AdminScriptTestCase):
         "Make sure template context variables are rendered with proper values"
         template_path = os.path.join(custom_templates_dir, 'project_template')
         args = ['startproject', '--template', template_path, 'another_project', 'project_dir']
-        testproject_dir = os.path.join(test_dir, 'project_dir')
+        testproject_dir = os.path.join(self.test_dir, 'project_dir')
         os.mkdir(testproject_dir)
         self.addCleanup(shutil.rmtree, testproject_dir)
         out, err = self.run_django_admin(args)
@@ -1827,7 +1873,7 @@ class StartProject(LiveServerTestCase, AdminScriptTestCase):
         self.addCleanup(self.remove_settings, 'alternate_settings.py')
         template_path = os.path.join(custom_templates_dir, 'project_template')
         args = ['custom_startproject', '--template', template_path, 'another_project', 'project_dir', '--extra', '<&>', '--settings=alternate_settings']
-        testproject_dir = os.path.join(test_dir, 'project_dir')
+        testproject_dir = os.path.join(self.test_dir, 'project_dir')
         os.mkdir(testproject_dir)
         self.addCleanup(shutil.rmtree, testproject_dir)
         out, err = self.run_manage(args)
@@ -1844,7 +1890,7 @@ class StartProject(LiveServerTestCase, AdminScriptTestCase):
         """
         template_path = os.path.join(custom_templates_dir, 'project_template')
         args = ['startproject', '--template', template_path, 'yet_another_project', 'project_dir2']
-        testproject_dir = os.path.join(test_dir, 'project_dir2')
+        testproject_dir = os.path.join(self.test_dir, 'project_dir2')
         out, err = self.run_django_admin(args)
         self.assertNoOutput(out)
         self.assertOutput(err, "Destination directory '%s' does not exist, please create it first." % testproject_dir)
@@ -1854,7 +1900,7 @@ class StartProject(LiveServerTestCase, AdminScriptTestCase):
         "Ticket 18091: Make sure the startproject management command is able to render templates with non-ASCII content"
         template_path = os.path.join(custom_templates_dir, 'project_template')
         args = ['startproject', '--template', template_path, '--extension=txt', 'customtestproject']
-        testproject_dir = os.path.join(test_dir, 'customtestproject')
+        testproject_dir = os.path.join(self.test_dir, 'customtestproject')
         self.addCleanup(shutil.rmtree, testproject_dir, True)
 
         out, err = self.run_django_admin(args)
@@ -208,6 +208,24 @@ class AppsTests(TestCase):
             apps.get_model("apps", "SouthPonies")
         self.assertEqual(new_apps.get_model("apps", "SouthPonies"), temp_model)
 
+    def test_defer_models(self):
+        """
+        Models can be imported the first time the registry is asked for them.
+        """
+        new_apps = Apps(installed_apps=[])
+        new_apps.apps_ready = new_apps.models_ready = new_apps.ready = False
+        new_apps.populate(['apps'], defer_models=True)
+        self.assertTrue(new_apps.apps_ready)
+        self.assertFalse(new_apps.models_ready)
+        app_config = new_apps.get_app_config('apps')
+        self.assertIsNone(app_config.models_module)
+
+        self.assertEqual(list(app_config.get_models()), [])
+        self.assertTrue(new_apps.ready)
+        self.assertEqual(app_config.models_module.__name__, 'apps.models')
+        self.assertEqual(list(new_apps.import_times), ['apps'])
+        self.assertEqual(sorted(new_apps.import_times['apps']), ['app', 'models', 'ready'])
+
 
 class Stub(object):
     def __init__(self, **kwargs):
@@ -132,6 +132,27 @@ class SQLiteTests(TestCase):
                 models.Item.objects.all().aggregate, aggregate('last_modified'))
 
 
+@unittest.skipUnless(connection.vendor == 'sqlite', "Test only for SQLite")
+class SQLiteSnapshotTests(TransactionTestCase):
+
+    available_apps = ['backends']
+
+    def test_restore_snapshot(self):
+        models.Square.objects.create(root=2, square=4)
+        connection.creation.snapshot_test_db()
+        models.Square.objects.create(root=3, square=9)
+        models.Person.objects.create(first_name='John', last_name='Doe')
+        self.assertTrue(connection.creation.restore_test_db())
+        self.assertEqual(list(models.Square.objects.values_list('root', 'square')), [(2, 4)])
+        self.assertFalse(models.Person.objects.exists())
+
+    def test_snapshot_of_other_apps(self):
+        connection.creation.snapshot_test_db()
+        # The snapshot doesn't apply when other apps are installed.
+        with self.modify_settings(INSTALLED_APPS={'append': 'django.contrib.humanize'}):
+            self.assertFalse(connection.creation.restore_test_db())
+
+
 @unittest.skipUnless(connection.vendor == 'postgresql', "Test only for PostgreSQL")
 class PostgreSQLTests(TestCase):
 
@@ -11,13 +11,14 @@ import tempfile as sys_tempfile
 import unittest
 
 from django.core.files import temp as tempfile
+from django.core.files.uploadhandler import MemoryFileUploadHandler
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.http.multipartparser import MultiPartParser, parse_header
 from django.test import TestCase, client
 from django.test import override_settings
 from django.utils.encoding import force_bytes
 from django.utils.http import urlquote
-from django.utils.six import StringIO
+from django.utils.six import BytesIO, StringIO
 
 from . import uploadhandler
 from .models import FileModel
@@ -551,3 +552,77 @@ class MultiParserTests(unittest.TestCase):
         for raw_line, expected_title in test_data:
             parsed = parse_header(raw_line)
             self.assertEqual(parsed[1]['title'], expected_title)
+
+    def _parse(self, body, handlers):
+        return MultiPartParser({
+            'CONTENT_TYPE': client.MULTIPART_CONTENT,
+            'CONTENT_LENGTH': len(body),
+        }, BytesIO(body), handlers, 'utf-8').parse()
+
+    def _multipart_body(self, *parts):
+        lines = []
+        for headers, content in parts:
+            lines.extend([b'--' + client.BOUNDARY.encode('ascii')] + headers + [b'', content])
+        lines.extend([b'--' + client.BOUNDARY.encode('ascii') + b'--', b''])
+        return b'\r\n'.join(lines)
+
+    def test_parts_spanning_chunks(self):
+        """
+        Fields and files are split on boundaries which span several chunks,
+        and data which resembles a boundary is kept.
+        """
+        content = b'\r\n--' + client.BOUNDARY.encode('ascii')[:-1] + b'\n' + b'x' * 100 + b'\r\n-'
+        body = self._multipart_body(
+            ([b'Content-Disposition: form-data; name="field"'], b'value \r\n--'),
+            ([b'Content-Disposition: form-data; name="file"; filename="a.txt"',
+              b'Content-Type: text/plain'], content),
+        )
+        handler = uploadhandler.ChunkRecordingUploadHandler()
+        post, files = self._parse(body, [handler])
+        self.assertEqual(post['field'], 'value \r\n--')
+        self.assertEqual(files['file'], content)
+        self.assertTrue(all(len(chunk) <= handler.chunk_size for chunk in handler.chunks))
+
+    def test_chunks_bytes_or_memoryview(self):
+        """
+        Upload handlers receive bytes unless they accept memoryviews.
+        """
+        body = self._multipart_body(
+            ([b'Content-Disposition: form-data; name="file"; filename="a.txt"'], b'content'),
+        )
+        handler = uploadhandler.ChunkRecordingUploadHandler()
+        self._parse(body, [handler])
+        self.assertEqual(handler.chunks, [b'content'])
+        self.assertIsInstance(handler.chunks[0], bytes)
+
+        memory_handler = MemoryFileUploadHandler()
+        post, files = self._parse(body, [memory_handler])
+        self.assertEqual(files['file'].read(), b'content')
+
+        # Subclasses of the built-in handlers receive bytes unless they set
+        # accepts_memoryview themselves.
+        subclass_handler = uploadhandler.RecordingMemoryFileUploadHandler()
+        post, files = self._parse(body, [subclass_handler])
+        self.assertEqual(subclass_handler.chunks, [b'content'])
+        self.assertIsInstance(subclass_handler.chunks[0], bytes)
+        self.assertEqual(files['file'].read(), b'content')
+
+    def test_lf_delimiters(self):
+        """
+        Boundaries preceded by a bare LF rather than a CRLF are recognized.
+        """
+        boundary = client.BOUNDARY.encode('ascii')
+        body = (
+            b'--' + boundary + b'\r\n'
+            b'Content-Disposition: form-data; name="f0"\r\n\r\nab\n'
+            b'--' + boundary + b'\r\n'
+            b'Content-Disposition: form-data; name="f1"\r\n\r\nyy\n'
+            b'--' + boundary + b'\r\n'
+            b'Content-Disposition: form-data; name="file"; filename="a.txt"\r\n\r\n'
+            b'content\n'
+            b'--' + boundary + b'--\n'
+        )
+        post, files = self._parse(body, [MemoryFileUploadHandler()])
+        self.assertEqual(post['f0'], 'ab')
+        self.assertEqual(post['f1'], 'yy')
+        self.assertEqual(files['file'].read(), b'content')
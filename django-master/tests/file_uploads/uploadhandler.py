@@ -2,7 +2,9 @@
 Upload handlers to test the upload API.
 """
 
-from django.core.files.uploadhandler import FileUploadHandler, StopUpload
+from django.core.files.uploadhandler import (
+    FileUploadHandler, MemoryFileUploadHandler, StopUpload,
+)
 
 
 class QuotaUploadHandler(FileUploadHandler):
@@ -35,3 +37,33 @@ class ErroringUploadHandler(FileUploadHandler):
     """A handler that raises an exception."""
     def receive_data_chunk(self, raw_data, start):
         raise CustomUploadError("Oops!")
+
+
+class ChunkRecordingUploadHandler(FileUploadHandler):
+    """
+    A handler that records the chunks it receives, with a small chunk size.
+    """
+    chunk_size = 16
+
+    def new_file(self, *args, **kwargs):
+        super(ChunkRecordingUploadHandler, self).new_file(*args, **kwargs)
+        self.chunks = []
+
+    def receive_data_chunk(self, raw_data, start):
+        self.chunks.append(raw_data)
+
+    def file_complete(self, file_size):
+        return b''.join(self.chunks)
+
+
+class RecordingMemoryFileUploadHandler(MemoryFileUploadHandler):
+    """
+    A subclass of a built-in handler that records the chunks it receives.
+    """
+    def new_file(self, *args, **kwargs):
+        self.chunks = []
+        super(RecordingMemoryFileUploadHandler, self).new_file(*args, **kwargs)
+
+    def receive_data_chunk(self, raw_data, start):
+        self.chunks.append(raw_data)
+        return super(RecordingMemoryFileUploadHandler, self).receive_data_chunk(raw_data, start)
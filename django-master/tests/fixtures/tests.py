@@ -7,9 +7,10 @@ from django.contrib.sites.models import Site
 from django.core import management
 from django.db import connection, IntegrityError
 from django.test import TestCase, TransactionTestCase, skipUnlessDBFeature
+from django.test.utils import CaptureQueriesContext
 from django.utils import six
 
-from .models import Article, Book, Spy, Tag, Visa
+from .models import Article, Book, Person, Spy, Tag, Visa
 
 
 class TestCaseFixtureLoadingTests(TestCase):
@@ -346,6 +347,68 @@ class FixtureLoadingTests(DumpDataAssertMixin, TestCase):
             management.call_command('loaddata', 'invalid.json', verbosity=0)
             self.assertIn("Could not load fixtures.Article(pk=1):", cm.exception.args[0])
 
+    def test_bulk_loading(self):
+        # Objects are inserted with a query per model.
+        with CaptureQueriesContext(connection) as context:
+            management.call_command('loaddata', 'fixture2.json', app_label='fixtures', bulk=True, verbosity=0)
+        inserts = [query for query in context.captured_queries if 'INSERT INTO' in query['sql']]
+        self.assertEqual(len(inserts), 1)
+        self.assertQuerysetEqual(Article.objects.all(), [
+            '<Article: Django conquers world!>',
+            '<Article: Copyright is fine the way it is>',
+        ])
+        for name in ('Django Reinhardt', 'Stephane Grappelli', 'Prince'):
+            Person.objects.get_or_create(name=name)
+        management.call_command('loaddata', 'fixture8.json', bulk=True, verbosity=0)
+        self.assertQuerysetEqual(Visa.objects.all(), [
+            '<Visa: Django Reinhardt Can add user, Can change user, Can delete user>',
+            '<Visa: Stephane Grappelli Can add user>',
+            '<Visa: Prince >'
+        ], ordered=False)
+
+    def test_bulk_loading_existing_object(self):
+        # The site with pk=1 already exists.
+        with self.assertRaises(IntegrityError) as cm:
+            management.call_command('loaddata', 'fixture1.json', bulk=True, verbosity=0)
+        self.assertIn("Could not load 1 sites.Site objects (pk=1 to 1):", cm.exception.args[0])
+
+    def test_fixture_cache(self):
+        cache = {}
+        management.call_command('loaddata', 'fixture2.json', app_label='fixtures', fixture_cache=cache, verbosity=0)
+        self.assertEqual(len(cache), 1)
+        # The cached data is loaded instead of the file.
+        cached = list(cache.values())[0]
+        cached[1]['fields']['headline'] = 'Django conquers the cache!'
+        Article.objects.all().delete()
+        management.call_command('loaddata', 'fixture2.json', app_label='fixtures', fixture_cache=cache, verbosity=0)
+        self.assertEqual(len(cache), 1)
+        self.assertQuerysetEqual(Article.objects.all(), [
+            '<Article: Django conquers the cache!>',
+            '<Article: Copyright is fine the way it is>',
+        ])
+        # Natural keys are resolved every time the fixture is loaded, even if
+        # the objects they refer to have other primary keys.
+        names = ['Django Reinhardt', 'Stephane Grappelli', 'Prince']
+        for i in range(2):
+            Visa.objects.all().delete()
+            Person.objects.all().delete()
+            for name in names:
+                Person.objects.create(name=name)
+            names.reverse()
+            management.call_command('loaddata', 'fixture8.json', fixture_cache=cache, verbosity=0)
+            self.assertQuerysetEqual(Visa.objects.all(), [
+                '<Visa: Django Reinhardt Can add user, Can change user, Can delete user>',
+                '<Visa: Stephane Grappelli Can add user>',
+                '<Visa: Prince >'
+            ], ordered=False)
+
+    def test_fixture_cache_xml(self):
+        # XML fixtures aren't cached.
+        cache = {}
+        management.call_command('loaddata', 'fixture2.xml', app_label='fixtures', fixture_cache=cache, verbosity=0)
+        self.assertEqual(list(cache.values()), [None])
+        self.assertEqual(Article.objects.count(), 2)
+
     def test_loaddata_app_option(self):
         """
         Verifies that the --app option works.
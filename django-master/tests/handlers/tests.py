@@ -2,6 +2,8 @@
 
 from __future__ import unicode_literals
 
+from wsgiref.util import FileWrapper
+
 from django.core.handlers.wsgi import WSGIHandler, WSGIRequest
 from django.core.signals import request_started, request_finished
 from django.db import close_old_connections, connection
@@ -10,6 +12,8 @@ from django.test import override_settings
 from django.utils.encoding import force_str
 from django.utils import six
 
+from . import views
+
 
 class HandlerTests(TestCase):
 
@@ -141,6 +145,23 @@ class SignalsTests(TestCase):
         self.assertEqual(b''.join(response.streaming_content), b"streaming content")
         self.assertEqual(self.signals, ['started', 'finished'])
 
+    def test_file_response_wsgi_file_wrapper(self):
+        """
+        The file of a FileResponse is handed to wsgi.file_wrapper, and closing
+        the wrapper closes the response.
+        """
+        environ = RequestFactory().get('/file_response/').environ
+        environ['wsgi.file_wrapper'] = FileWrapper
+        handler = WSGIHandler()
+        response = handler(environ, lambda *a, **k: None)
+        self.assertIsInstance(response, FileWrapper)
+        with open(views.__file__, 'rb') as fp:
+            self.assertEqual(b''.join(response), fp.read())
+        self.assertEqual(self.signals, ['started'])
+        response.close()
+        self.assertEqual(self.signals, ['started', 'finished'])
+        self.assertTrue(response.filelike.file.closed)
+
 
 @override_settings(ROOT_URLCONF='handlers.urls')
 class HandlerSuspiciousOpsTest(TestCase):
@@ -7,6 +7,7 @@ from . import views
 urlpatterns = [
     url(r'^regular/$', views.regular),
     url(r'^streaming/$', views.streaming),
+    url(r'^file_response/$', views.file_response),
     url(r'^in_transaction/$', views.in_transaction),
     url(r'^not_in_transaction/$', views.not_in_transaction),
     url(r'^suspicious/$', views.suspicious),
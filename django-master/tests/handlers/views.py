@@ -2,7 +2,7 @@ from __future__ import unicode_literals
 
 from django.core.exceptions import SuspiciousOperation
 from django.db import connection, transaction
-from django.http import HttpResponse, StreamingHttpResponse
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
 
 
 def regular(request):
@@ -13,6 +13,10 @@ def streaming(request):
     return StreamingHttpResponse([b"streaming", b" ", b"content"])
 
 
+def file_response(request):
+    return FileResponse(open(__file__, 'rb'))
+
+
 def in_transaction(request):
     return HttpResponse(str(connection.in_atomic_block))
 
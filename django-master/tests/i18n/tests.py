@@ -8,6 +8,8 @@ import gettext as gettext_module
 from importlib import import_module
 import os
 import pickle
+import shutil
+import tempfile
 from threading import local
 from unittest import skipUnless
 
@@ -35,6 +37,7 @@ from django.utils.translation import (activate, deactivate,
     npgettext, npgettext_lazy,
     check_for_language,
     string_concat, LANGUAGE_SESSION_KEY)
+from django.utils.translation.catalog import MappedCatalog
 
 from .forms import I18nForm, SelectDateForm, SelectDateWidget, CompanyForm
 from .models import Company, TestModel
@@ -1197,6 +1200,54 @@ class DjangoFallbackResolutionOrderI18NTests(ResolutionOrderI18NTests):
         self.assertEqual(ugettext('Date/time'), 'Datum/Zeit')
 
 
+class CompiledCatalogTests(TestCase):
+
+    def setUp(self):
+        self.catalogs_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.catalogs_dir)
+        self.addCleanup(trans_real._translations.clear)
+        trans_real._translations.clear()
+
+    def test_write_and_load(self):
+        with self.settings(LOCALE_CATALOGS_DIR=self.catalogs_dir, LOCALE_PATHS=extended_locale_paths):
+            path = trans_real.write_compiled_catalog('de')
+            self.assertEqual(path, os.path.join(self.catalogs_dir, 'de.mo'))
+            merged = trans_real.DjangoTranslation('de', use_compiled_catalog=False)
+            compiled = trans_real.DjangoTranslation('de')
+            self.assertIsInstance(compiled._catalog, MappedCatalog)
+            self.assertEqual(dict(compiled._catalog), dict(merged._catalog, **{'': compiled._catalog['']}))
+            self.assertEqual(compiled._info, merged._info)
+            with translation.override('de'):
+                # Translations from LOCALE_PATHS, plurals and contexts.
+                self.assertEqual(ugettext('Date/time'), 'Datum/Zeit (LOCALE_PATHS)')
+                self.assertEqual(ungettext_lazy('%d year', '%d years', 2) % 2, '2 Jahre')
+                self.assertEqual(pgettext('month name', 'May'), 'Mai')
+                self.assertEqual(ugettext('Untranslated message'), 'Untranslated message')
+        # The file is a valid .mo file.
+        with open(path, 'rb') as fp:
+            translations = gettext_module.GNUTranslations(fp)
+        self.assertEqual(translations.ugettext('Date/time') if six.PY2 else translations.gettext('Date/time'), 'Datum/Zeit (LOCALE_PATHS)')
+
+    def test_outdated_catalog_ignored(self):
+        with self.settings(LOCALE_CATALOGS_DIR=self.catalogs_dir):
+            path = trans_real.write_compiled_catalog('de')
+            # Make the compiled catalog older than the catalogs it's made of.
+            os.utime(path, (0, 0))
+            self.assertIsInstance(trans_real.DjangoTranslation('de')._catalog, dict)
+
+    def test_changed_sources_catalog_ignored(self):
+        with self.settings(LOCALE_CATALOGS_DIR=self.catalogs_dir):
+            trans_real.write_compiled_catalog('de')
+            self.assertIsInstance(trans_real.DjangoTranslation('de')._catalog, MappedCatalog)
+            # The catalogs of LOCALE_PATHS are older than the merged catalog
+            # but weren't merged into it.
+            with self.settings(LOCALE_PATHS=extended_locale_paths):
+                translation = trans_real.DjangoTranslation('de')
+                self.assertIsInstance(translation._catalog, dict)
+                self.assertEqual(translation.ugettext('Date/time') if six.PY2 else translation.gettext('Date/time'),
+                                 'Datum/Zeit (LOCALE_PATHS)')
+
+
 class TestModels(TestCase):
     def test_lazy(self):
         tm = TestModel()
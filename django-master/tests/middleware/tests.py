@@ -2,6 +2,7 @@
 from __future__ import unicode_literals
 
 import gzip
+import zlib
 from io import BytesIO
 import random
 import re
@@ -9,9 +10,14 @@ from unittest import skipIf
 
 from django.conf import settings
 from django.core import mail
+from django.core.cache import caches
 from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
 from django.middleware.clickjacking import XFrameOptionsMiddleware
 from django.middleware.common import CommonMiddleware, BrokenLinkEmailsMiddleware
+from django.middleware import compression
+from django.middleware.compression import (
+    CompressionMiddleware, Encoder, register_encoder,
+)
 from django.middleware.http import ConditionalGetMiddleware
 from django.middleware.gzip import GZipMiddleware
 from django.test import TestCase, RequestFactory, override_settings
@@ -678,3 +684,119 @@ class ETagGZipMiddlewareTest(TestCase):
         nogzip_etag = response.get('ETag')
 
         self.assertNotEqual(gzip_etag, nogzip_etag)
+
+
+class ReverseEncoder(Encoder):
+    name = 'x-reverse'
+
+    def compress(self, content, level):
+        return content[:50][::-1]
+
+    def compress_sequence(self, sequence, level, flush_size):
+        for item in sequence:
+            yield item[::-1]
+
+
+class CompressionMiddlewareTest(TestCase):
+    """
+    Tests the compression middleware.
+    """
+    compressible_string = b'a' * 500
+
+    def setUp(self):
+        self.rf = RequestFactory()
+
+    def get_response(self, middleware, accept_encoding='gzip, deflate', content_type='text/html', etag=None):
+        request = self.rf.get('/', HTTP_ACCEPT_ENCODING=accept_encoding)
+        response = HttpResponse(self.compressible_string, content_type=content_type)
+        if etag:
+            response['ETag'] = etag
+        return middleware.process_response(request, response)
+
+    def test_negotiation(self):
+        """
+        The encoding with the highest quality value is used, ties being
+        resolved by the order of the middleware's encodings.
+        """
+        middleware = CompressionMiddleware()
+        middleware.encodings = ('gzip', 'deflate')
+        response = self.get_response(middleware, 'gzip, deflate')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        response = self.get_response(middleware, 'gzip;q=0.5, deflate')
+        self.assertEqual(response['Content-Encoding'], 'deflate')
+        self.assertEqual(zlib.decompress(response.content), self.compressible_string)
+        response = self.get_response(middleware, '*;q=0.1, gzip;q=0')
+        self.assertEqual(response['Content-Encoding'], 'deflate')
+        response = self.get_response(middleware, 'identity')
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+
+    def test_gzip_q_zero(self):
+        """
+        A quality value of 0 excludes an encoding.
+        """
+        response = self.get_response(GZipMiddleware(), 'gzip;q=0, deflate')
+        self.assertEqual(response.content, self.compressible_string)
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    def test_compress_levels(self):
+        middleware = CompressionMiddleware()
+        middleware.compress_levels = {'text/html': 1, 'image/*': None}
+        response = self.get_response(middleware)
+        level_1 = gzip.GzipFile(mode='rb', fileobj=BytesIO(response.content)).read()
+        self.assertEqual(level_1, self.compressible_string)
+        self.assertEqual(middleware.get_compress_level(None, response), 1)
+        response = self.get_response(middleware, content_type='image/svg+xml')
+        self.assertEqual(response.content, self.compressible_string)
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertFalse(response.has_header('Vary'))
+        response = self.get_response(middleware, content_type='text/plain')
+        self.assertEqual(middleware.get_compress_level(None, response), 6)
+
+    def test_streaming_flush_size(self):
+        """
+        Streaming content is flushed every streaming_flush_size bytes.
+        """
+        sequence = [b'a' * 100] * 10
+        request = self.rf.get('/', HTTP_ACCEPT_ENCODING='deflate')
+        middleware = CompressionMiddleware()
+        middleware.encodings = ('deflate',)
+        middleware.streaming_flush_size = 300
+        response = middleware.process_response(request, StreamingHttpResponse(sequence))
+        chunks = list(response)
+        # At most the zlib header, one chunk per flush, and the final one.
+        self.assertLessEqual(len(chunks), 5)
+        self.assertEqual(zlib.decompress(b''.join(chunks)), b''.join(sequence))
+
+        middleware = CompressionMiddleware()
+        response = middleware.process_response(self.rf.get('/', HTTP_ACCEPT_ENCODING='gzip'),
+                                               StreamingHttpResponse(sequence))
+        compressed = b''.join(response)
+        self.assertEqual(gzip.GzipFile(mode='rb', fileobj=BytesIO(compressed)).read(), b''.join(sequence))
+
+    @override_settings(CACHES={
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    })
+    def test_cache_strong_etag(self):
+        """
+        The compressed content of responses with a strong ETag is cached.
+        """
+        middleware = CompressionMiddleware()
+        middleware.encodings = ('x-reverse',)
+        middleware.cache_alias = 'default'
+        register_encoder(ReverseEncoder())
+        try:
+            caches['default'].clear()
+            response = self.get_response(middleware, 'x-reverse', etag='"abc"')
+            self.assertEqual(response['ETag'], '"abc;x-reverse"')
+            cached = response.content
+            self.compressible_string = b'b' * 500
+            response = self.get_response(middleware, 'x-reverse', etag='"abc"')
+            self.assertEqual(response.content, cached)
+            # Weak ETags and other ETags aren't served from the cache.
+            response = self.get_response(middleware, 'x-reverse', etag='W/"abc"')
+            self.assertEqual(response.content, b'b' * 50)
+            response = self.get_response(middleware, 'x-reverse', etag='"def"')
+            self.assertEqual(response.content, b'b' * 50)
+        finally:
+            del compression._encoders['x-reverse']
@@ -1354,6 +1354,71 @@ class ModelFormsetTest(TestCase):
         self.assertEqual(formset._non_form_errors,
             ['Please correct the duplicate data for subtitle which must be unique for the month in posted.'])
 
+    def test_shared_choices(self):
+        charles = Author.objects.create(name='Charles Baudelaire')
+        Author.objects.create(name='Paul Verlaine')
+        BookFormSet = modelformset_factory(Book, fields="__all__", extra=3)
+        formset = BookFormSet(queryset=Book.objects.none())
+        # The choices of the authors are fetched once for all the forms.
+        with self.assertNumQueries(1):
+            rendered = [form['author'].as_widget() for form in formset]
+        self.assertHTMLEqual(rendered[0], rendered[2].replace('form-2', 'form-0'))
+        self.assertInHTML('<option value="%d">Charles Baudelaire</option>' % charles.pk, rendered[0])
+        self.assertEqual(len(formset.forms[0].fields['author'].choices), 3)
+
+        data = {
+            'form-TOTAL_FORMS': '2',
+            'form-INITIAL_FORMS': '0',
+            'form-MAX_NUM_FORMS': '',
+            'form-0-title': 'Les Fleurs du mal',
+            'form-0-author': str(charles.pk),
+            'form-1-title': 'Le Spleen de Paris',
+            'form-1-author': str(charles.pk),
+        }
+        formset = BookFormSet(data, queryset=Book.objects.none())
+        with self.assertNumQueries(1):
+            for form in formset:
+                self.assertInHTML(
+                    '<option value="%d" selected="selected">Charles Baudelaire</option>' % charles.pk,
+                    form['author'].as_widget())
+        # The objects fetched to render the choices are used for validation.
+        with self.assertNumQueries(0):
+            for form in formset:
+                form.fields['author'].clean(str(charles.pk))
+
+    def test_shared_choices_disabled(self):
+        Author.objects.create(name='Charles Baudelaire')
+        BookFormSet = modelformset_factory(
+            Book, fields="__all__", extra=3,
+            formset=type(str('BookFormSet'), (BaseModelFormSet,), {'share_choices': False}))
+        formset = BookFormSet(queryset=Book.objects.none())
+        with self.assertNumQueries(3):
+            for form in formset:
+                form['author'].as_widget()
+
+    def test_shared_choices_customized_queryset(self):
+        charles = Author.objects.create(name='Charles Baudelaire')
+        paul = Author.objects.create(name='Paul Verlaine')
+
+        class BookForm(forms.ModelForm):
+            class Meta:
+                model = Book
+                fields = '__all__'
+
+            def __init__(self, *args, **kwargs):
+                super(BookForm, self).__init__(*args, **kwargs)
+                if self.prefix == 'form-1':
+                    self.fields['author'].queryset = Author.objects.filter(pk=paul.pk)
+
+        BookFormSet = modelformset_factory(Book, form=BookForm, extra=3)
+        formset = BookFormSet(queryset=Book.objects.none())
+        with self.assertNumQueries(2):
+            rendered = [form['author'].as_widget() for form in formset]
+        self.assertIn('Charles Baudelaire', rendered[0])
+        self.assertNotIn('Charles Baudelaire', rendered[1])
+        self.assertIn('Charles Baudelaire', rendered[2])
+        self.assertIn('<option value="%d">' % charles.pk, rendered[2])
+
 
 class TestModelFormsetOverridesTroughFormMeta(TestCase):
     def test_modelformset_factory_widgets(self):
@@ -4,7 +4,7 @@ from datetime import datetime
 import unittest
 
 from django.core.paginator import (Paginator, EmptyPage, InvalidPage,
-    PageNotAnInteger)
+    PageNotAnInteger, KeysetPaginator, InvalidCursor)
 from django.test import TestCase
 from django.utils import six
 
@@ -308,3 +308,89 @@ class ModelPaginationTests(TestCase):
         )
         # After __getitem__ is called, object_list is a list
         self.assertIsInstance(p.object_list, list)
+
+
+class KeysetPaginationTests(TestCase):
+    """
+    Test keyset pagination with Django model instances
+    """
+    def setUp(self):
+        for x in range(1, 10):
+            Article.objects.create(headline='Article %s' % (x % 3),
+                                   pub_date=datetime(2005, 7, x, 12, 30, 0, x))
+
+    def walk(self, paginator):
+        """
+        Returns the headlines of every page, following the next cursors, and
+        checks that following the previous cursors gives the same pages.
+        """
+        pages = []
+        page = paginator.page()
+        self.assertFalse(page.has_previous())
+        self.assertIsNone(page.previous_cursor())
+        while True:
+            pages.append([a.pk for a in page])
+            cursor = page.next_cursor()
+            if cursor is None:
+                break
+            page = paginator.page(cursor)
+            self.assertTrue(page.has_previous())
+        backwards = [[a.pk for a in page]]
+        while page.has_previous():
+            page = paginator.page(page.previous_cursor())
+            self.assertTrue(page.has_next())
+            backwards.insert(0, [a.pk for a in page])
+        self.assertEqual(backwards, pages)
+        return pages
+
+    def expected(self, queryset, per_page):
+        pks = list(queryset.values_list('pk', flat=True))
+        return [pks[i:i + per_page] for i in range(0, len(pks), per_page)]
+
+    def test_default_ordering(self):
+        queryset = Article.objects.all()
+        paginator = KeysetPaginator(queryset, 4)
+        self.assertEqual(self.walk(paginator), self.expected(queryset.order_by('pk'), 4))
+
+    def test_mixed_ordering(self):
+        queryset = Article.objects.order_by('headline', '-pub_date')
+        paginator = KeysetPaginator(queryset, 2)
+        self.assertEqual(self.walk(paginator), self.expected(queryset, 2))
+
+    def test_non_unique_ordering(self):
+        queryset = Article.objects.order_by('-headline')
+        paginator = KeysetPaginator(queryset, 2)
+        self.assertEqual([f[0] for f in paginator.ordering], ['headline', 'pk'])
+        self.assertEqual(self.walk(paginator), self.expected(queryset.order_by('-headline', '-pk'), 2))
+
+    def test_reversed_queryset(self):
+        queryset = Article.objects.order_by('pub_date').reverse()
+        paginator = KeysetPaginator(queryset, 4)
+        self.assertEqual(self.walk(paginator), self.expected(queryset, 4))
+
+    def test_exact_pages(self):
+        paginator = KeysetPaginator(Article.objects.order_by('pk'), 3)
+        self.assertEqual([len(p) for p in self.walk(paginator)], [3, 3, 3])
+
+    def test_constant_queries(self):
+        paginator = KeysetPaginator(Article.objects.order_by('pub_date'), 2)
+        cursor = paginator.page().next_cursor()
+        with self.assertNumQueries(1):
+            page = paginator.page(cursor)
+            self.assertEqual(len(page), 2)
+
+    def test_empty(self):
+        Article.objects.all().delete()
+        page = KeysetPaginator(Article.objects.all(), 5).page()
+        self.assertEqual(len(page), 0)
+        self.assertFalse(page.has_other_pages())
+        self.assertIsNone(page.next_cursor())
+
+    def test_invalid_cursor(self):
+        paginator = KeysetPaginator(Article.objects.all(), 5)
+        for cursor in ['', 'garbage', paginator.encode_cursor([1, 2])]:
+            self.assertRaises(InvalidCursor, paginator.page, cursor)
+        self.assertTrue(issubclass(InvalidCursor, InvalidPage))
+
+    def test_unsupported_ordering(self):
+        self.assertRaises(ValueError, KeysetPaginator, Article.objects.order_by('?'), 5)
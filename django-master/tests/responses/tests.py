@@ -2,8 +2,11 @@
 
 from __future__ import unicode_literals
 
+import io
+import os
+
 from django.conf import settings
-from django.http import HttpResponse
+from django.http import FileResponse, HttpResponse
 from django.test import SimpleTestCase
 
 UTF8 = 'utf-8'
@@ -64,3 +67,37 @@ class HttpResponseTests(SimpleTestCase):
 
         response = HttpResponse(iso_content, content_type='text/plain')
         self.assertContains(response, iso_content)
+
+
+class FileResponseTests(SimpleTestCase):
+
+    def test_file_from_disk(self):
+        response = FileResponse(open(__file__, 'rb'))
+        self.assertEqual(response.file_to_stream.name, __file__)
+        self.assertEqual(int(response['Content-Length']), os.path.getsize(__file__))
+        with open(__file__, 'rb') as fp:
+            self.assertEqual(b''.join(response), fp.read())
+        response.close()
+        self.assertTrue(response.file_to_stream.closed)
+
+    def test_content_length_from_position(self):
+        fp = open(__file__, 'rb')
+        fp.seek(10)
+        response = FileResponse(fp)
+        self.assertEqual(int(response['Content-Length']), os.path.getsize(__file__) - 10)
+        response.close()
+
+    def test_file_like_object(self):
+        response = FileResponse(io.BytesIO(b'binary content'))
+        self.assertNotIn('Content-Length', response)
+        self.assertEqual(b''.join(response), b'binary content')
+
+    def test_replaced_streaming_content(self):
+        """
+        A FileResponse whose content was replaced by an iterator doesn't
+        stream the file anymore.
+        """
+        response = FileResponse(io.BytesIO(b'binary content'))
+        response.streaming_content = (content.upper() for content in response.streaming_content)
+        self.assertIsNone(response.file_to_stream)
+        self.assertEqual(b''.join(response), b'BINARY CONTENT')
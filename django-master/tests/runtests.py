@@ -14,6 +14,7 @@ from django.apps import apps
 from django.conf import settings
 from django.db import connection
 from django.test import TransactionTestCase, TestCase
+from django.test.runner import default_test_processes
 from django.test.utils import get_runner
 from django.utils.deprecation import RemovedInDjango19Warning, RemovedInDjango20Warning
 from django.utils._os import upath
@@ -198,7 +199,7 @@ def teardown(state):
         setattr(settings, key, value)
 
 
-def django_tests(verbosity, interactive, failfast, test_labels):
+def django_tests(verbosity, interactive, failfast, test_labels, parallel=1):
     state = setup(verbosity, test_labels)
     extra_tests = []
 
@@ -211,6 +212,7 @@ def django_tests(verbosity, interactive, failfast, test_labels):
         verbosity=verbosity,
         interactive=interactive,
         failfast=failfast,
+        parallel=parallel,
     )
     # Catch warnings thrown in test DB setup -- remove in Django 1.9
     with warnings.catch_warnings():
@@ -346,6 +348,11 @@ if __name__ == "__main__":
         '--failfast', action='store_true', dest='failfast', default=False,
         help='Tells Django to stop running the test suite after first failed '
              'test.')
+    parser.add_argument(
+        '--parallel', dest='parallel', type=int, nargs='?', default=1,
+        const=default_test_processes(), metavar='N',
+        help='Run tests in N parallel processes. Defaults to the number of '
+             'CPUs.')
     parser.add_argument(
         '--settings',
         help='Python path to settings module, e.g. "myproject.settings". If '
@@ -378,6 +385,10 @@ if __name__ == "__main__":
 
     if options.liveserver is not None:
         os.environ['DJANGO_LIVE_TEST_SERVER_ADDRESS'] = options.liveserver
+    elif options.parallel > 1:
+        # Each worker process starts its own live servers, let them pick
+        # a free port from a range rather than all competing for one.
+        os.environ.setdefault('DJANGO_LIVE_TEST_SERVER_ADDRESS', 'localhost:8081-8179')
 
     if options.selenium:
         os.environ['DJANGO_SELENIUM_TESTS'] = '1'
@@ -388,6 +399,7 @@ if __name__ == "__main__":
         paired_tests(options.pair, options, options.modules)
     else:
         failures = django_tests(options.verbosity, options.interactive,
-                                options.failfast, options.modules)
+                                options.failfast, options.modules,
+                                options.parallel)
         if failures:
             sys.exit(bool(failures))
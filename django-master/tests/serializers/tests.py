@@ -196,6 +196,21 @@ class SerializersTestBase(object):
         with self.assertNumQueries(0):
             serializers.serialize(self.serializer_name, [mv])
 
+    def test_serialize_prefetch_related(self):
+        """
+        The many-to-many relations of the serialized objects are fetched with
+        a query per chunk of objects.
+        """
+        with self.assertNumQueries(2):
+            serializers.serialize(self.serializer_name, Article.objects.all())
+        with self.assertNumQueries(3):
+            serializers.serialize(self.serializer_name, Article.objects.all(), chunk_size=1)
+        serial_str = serializers.serialize(self.serializer_name, Article.objects.all())
+        objects = list(serializers.deserialize(self.serializer_name, serial_str))
+        self.assertEqual(
+            [[int(pk) for pk in obj.m2m_data['categories']] for obj in objects],
+            [[c.pk for c in a.categories.all()] for a in Article.objects.all()])
+
     def test_serialize_with_null_pk(self):
         """
         Tests that serialized data with no primary key results
@@ -407,6 +422,23 @@ class JsonSerializerTestCase(SerializersTestBase, TestCase):
             if re.search(r'.+,\s*$', line):
                 self.assertEqual(line, line.rstrip())
 
+    def test_iterload(self):
+        data = ' [{"a": [1, "]"]}, 12345,\n"\u00e9" , {}] '
+        for chunk_size in (1, 2, 3, 100):
+            for stream in (StringIO(data), six.BytesIO(data.encode('utf-8'))):
+                items = list(serializers.json.iterload(stream, chunk_size=chunk_size))
+                self.assertEqual(items, [{'a': [1, ']']}, 12345, '\xe9', {}])
+        self.assertEqual(list(serializers.json.iterload(StringIO('[]'))), [])
+        self.assertEqual(list(serializers.json.iterload(StringIO('{"a": 1}'))), [{'a': 1}])
+        for invalid in ('', '[', '[1', '[1,]', '[1 2]', '[1] 2'):
+            with self.assertRaises(ValueError):
+                list(serializers.json.iterload(StringIO(invalid), chunk_size=1))
+
+    def test_deserialize_stream(self):
+        serial_str = serializers.serialize(self.serializer_name, Category.objects.all())
+        objects = list(serializers.deserialize(self.serializer_name, StringIO(serial_str)))
+        self.assertEqual([obj.object for obj in objects], list(Category.objects.all()))
+
 
 class JsonSerializerTransactionTestCase(SerializersTransactionTestBase, TransactionTestCase):
     serializer_name = "json"
@@ -6,15 +6,17 @@ import os
 import posixpath
 import shutil
 import sys
+import tempfile
 import unittest
 
+from django.apps import apps
 from django.template import loader, Context
 from django.conf import settings
 from django.core.cache.backends.base import BaseCache
 from django.core.exceptions import ImproperlyConfigured
 from django.core.management import call_command
 from django.test import TestCase, override_settings
-from django.utils.encoding import force_text
+from django.utils.encoding import force_bytes, force_text
 from django.utils.functional import empty
 from django.utils._os import rmtree_errorhandler, upath, symlinks_supported
 from django.utils import six
@@ -59,6 +61,35 @@ class BaseStaticFilesTestCase(object):
     Test case with a couple utility assertions.
     """
     def setUp(self):
+        # Work on a copy of the test apps and project files, and collect them
+        # to a STATIC_ROOT of its own, so that tests can create and modify
+        # files without affecting other tests, which may run in parallel.
+        temp_dir = tempfile.mkdtemp(dir=os.environ.get('DJANGO_TEST_TEMP_DIR'))
+        # Use our own error handler that can handle .svn dirs on Windows
+        self.addCleanup(shutil.rmtree, temp_dir, onerror=rmtree_errorhandler)
+        self.test_root = os.path.join(temp_dir, 'staticfiles_tests')
+        for dirname in ('apps', 'project'):
+            shutil.copytree(os.path.join(TEST_ROOT, dirname),
+                            os.path.join(self.test_root, dirname), symlinks=True)
+        staticfiles_dirs = []
+        for root in settings.STATICFILES_DIRS:
+            if isinstance(root, (list, tuple)):
+                prefix, root = root
+                staticfiles_dirs.append((prefix, self.temp_path(root)))
+            else:
+                staticfiles_dirs.append(self.temp_path(root))
+        settings_override = override_settings(
+            MEDIA_ROOT=self.temp_path(settings.MEDIA_ROOT),
+            STATIC_ROOT=self.temp_path(settings.STATIC_ROOT),
+            STATICFILES_DIRS=staticfiles_dirs,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        for app_config in apps.get_app_configs():
+            if app_config.path != self.temp_path(app_config.path):
+                self.addCleanup(setattr, app_config, 'path', app_config.path)
+                app_config.path = self.temp_path(app_config.path)
+
         # Clear the cached staticfiles_storage out, this is because when it first
         # gets accessed (by some other test), it evaluates settings.STATIC_ROOT,
         # since we're planning on changing that we need to clear out the cache.
@@ -67,27 +98,35 @@ class BaseStaticFilesTestCase(object):
         # run and pick up changes in settings.STATICFILES_DIRS.
         finders.get_finder.cache_clear()
 
-        self.testfiles_path = os.path.join(TEST_ROOT, 'apps', 'test', 'static', 'test')
+        self.testfiles_path = os.path.join(self.test_root, 'apps', 'test', 'static', 'test')
+        self.create_test_files()
+
+    def temp_path(self, path):
+        """
+        Returns the path of the copy of the given file or directory of the
+        test apps and project, or path if it's elsewhere.
+        """
+        if not path:
+            return path
+        for dirname in ('apps', 'project'):
+            root = os.path.join(TEST_ROOT, dirname)
+            if path == root or path.startswith(root + os.sep):
+                return os.path.join(self.test_root, os.path.relpath(path, TEST_ROOT))
+        return path
+
+    def create_test_files(self):
         # To make sure SVN doesn't hangs itself with the non-ASCII characters
         # during checkout, we actually create one file dynamically.
-        self._nonascii_filepath = os.path.join(self.testfiles_path, '\u2297.txt')
-        with codecs.open(self._nonascii_filepath, 'w', 'utf-8') as f:
+        with codecs.open(os.path.join(self.testfiles_path, '\u2297.txt'), 'w', 'utf-8') as f:
             f.write("\u2297 in the app dir")
         # And also create the magic hidden file to trick the setup.py's
         # package data handling.
-        self._hidden_filepath = os.path.join(self.testfiles_path, '.hidden')
-        with codecs.open(self._hidden_filepath, 'w', 'utf-8') as f:
+        with codecs.open(os.path.join(self.testfiles_path, '.hidden'), 'w', 'utf-8') as f:
             f.write("should be ignored")
-        self._backup_filepath = os.path.join(
-            TEST_ROOT, 'project', 'documents', 'test', 'backup~')
-        with codecs.open(self._backup_filepath, 'w', 'utf-8') as f:
+        backup_filepath = os.path.join(self.test_root, 'project', 'documents', 'test', 'backup~')
+        with codecs.open(backup_filepath, 'w', 'utf-8') as f:
             f.write("should be ignored")
 
-    def tearDown(self):
-        os.unlink(self._nonascii_filepath)
-        os.unlink(self._hidden_filepath)
-        os.unlink(self._backup_filepath)
-
     def assertFileContains(self, filepath, text):
         self.assertIn(text, self._get_file(force_text(filepath)),
                       "'%s' not in '%s'" % (text, filepath))
@@ -132,9 +171,6 @@ class BaseCollectionTestCase(BaseStaticFilesTestCase):
         if not os.path.exists(settings.STATIC_ROOT):
             os.mkdir(settings.STATIC_ROOT)
         self.run_collectstatic()
-        # Use our own error handler that can handle .svn dirs on Windows
-        self.addCleanup(shutil.rmtree, settings.STATIC_ROOT,
-                        ignore_errors=True, onerror=rmtree_errorhandler)
 
     def run_collectstatic(self, **kwargs):
         call_command('collectstatic', interactive=False, verbosity=0,
@@ -251,8 +287,8 @@ class TestFindStatic(CollectionTestCase, TestDefaults):
         self.assertIn(os.path.join('django', 'contrib', 'admin', 'static'),
                       searched_locations)
         # FileSystemFinder searched locations
-        self.assertIn(TEST_SETTINGS['STATICFILES_DIRS'][1][1], searched_locations)
-        self.assertIn(TEST_SETTINGS['STATICFILES_DIRS'][0], searched_locations)
+        self.assertIn(self.temp_path(TEST_SETTINGS['STATICFILES_DIRS'][1][1]), searched_locations)
+        self.assertIn(self.temp_path(TEST_SETTINGS['STATICFILES_DIRS'][0]), searched_locations)
         # DefaultStorageFinder searched locations
         self.assertIn(os.path.join('staticfiles_tests', 'project', 'site_media', 'media'),
                       searched_locations)
@@ -347,6 +383,14 @@ class TestCollectionExcludeNoDefaultIgnore(CollectionTestCase, TestDefaults):
         self.assertFileContains('test/CVS', 'should be ignored')
 
 
+class TestCollectionParallel(CollectionTestCase, TestDefaults):
+    """
+    Test the ``--jobs`` option of the ``collectstatic`` management command.
+    """
+    def run_collectstatic(self):
+        super(TestCollectionParallel, self).run_collectstatic(jobs=4)
+
+
 class TestNoFilesCreated(object):
 
     def test_no_files_created(self):
@@ -374,28 +418,21 @@ class TestCollectionFilesOverride(CollectionTestCase):
         'staticfiles_tests.apps.no_label',
 
     """
-    def setUp(self):
-        self.orig_path = os.path.join(TEST_ROOT, 'apps', 'no_label', 'static', 'file2.txt')
+    def create_test_files(self):
+        super(TestCollectionFilesOverride, self).create_test_files()
+        self.orig_path = os.path.join(self.test_root, 'apps', 'no_label', 'static', 'file2.txt')
         # get modification and access times for no_label/static/file2.txt
-        self.orig_mtime = os.path.getmtime(self.orig_path)
-        self.orig_atime = os.path.getatime(self.orig_path)
+        orig_mtime = os.path.getmtime(self.orig_path)
+        orig_atime = os.path.getatime(self.orig_path)
 
         # prepare duplicate of file2.txt from no_label app
         # this file will have modification time older than no_label/static/file2.txt
         # anyway it should be taken to STATIC_ROOT because 'test' app is before
         # 'no_label' app in installed apps
-        self.testfile_path = os.path.join(TEST_ROOT, 'apps', 'test', 'static', 'file2.txt')
+        self.testfile_path = os.path.join(self.test_root, 'apps', 'test', 'static', 'file2.txt')
         with open(self.testfile_path, 'w+') as f:
             f.write('duplicate of file2.txt')
-        os.utime(self.testfile_path, (self.orig_atime - 1, self.orig_mtime - 1))
-        super(TestCollectionFilesOverride, self).setUp()
-
-    def tearDown(self):
-        if os.path.exists(self.testfile_path):
-            os.unlink(self.testfile_path)
-        # set back original modification time
-        os.utime(self.orig_path, (self.orig_atime, self.orig_mtime))
-        super(TestCollectionFilesOverride, self).tearDown()
+        os.utime(self.testfile_path, (orig_atime - 1, orig_mtime - 1))
 
     def test_ordering_override(self):
         """
@@ -662,11 +699,6 @@ class TestCollectionManifestStorage(TestHashedFiles, BaseCollectionTestCase,
         with open(self._clear_filename, 'w') as f:
             f.write('to be deleted in one test')
 
-    def tearDown(self):
-        super(TestCollectionManifestStorage, self).tearDown()
-        if os.path.exists(self._clear_filename):
-            os.unlink(self._clear_filename)
-
     def test_manifest_exists(self):
         filename = storage.staticfiles_storage.manifest_name
         path = storage.staticfiles_storage.path(filename)
@@ -684,6 +716,66 @@ class TestCollectionManifestStorage(TestHashedFiles, BaseCollectionTestCase,
         manifest = storage.staticfiles_storage.load_manifest()
         self.assertEqual(hashed_files, manifest)
 
+    def collect(self, **kwargs):
+        options = {
+            'interactive': False,
+            'verbosity': 0,
+            'link': False,
+            'clear': False,
+            'dry_run': False,
+            'post_process': True,
+            'use_default_ignore_patterns': True,
+            'ignore_patterns': ['*.ignoreme'],
+        }
+        options.update(kwargs)
+        collectstatic_cmd = CollectstaticCommand()
+        collectstatic_cmd.set_options(**options)
+        return collectstatic_cmd.collect()
+
+    def test_post_processing(self):
+        """
+        Files unchanged since the previous run of collectstatic, in setUp(),
+        aren't post-processed again, unless the manifest is missing.
+        """
+        stats = self.collect()
+        self.assertNotIn(os.path.join('cached', 'css', 'window.css'), stats['post_processed'])
+        self.assertIn(os.path.join('cached', 'css', 'img', 'window.png'), stats['unmodified'])
+
+        storage.staticfiles_storage.delete(storage.staticfiles_storage.manifest_name)
+        stats = self.collect()
+        self.assertIn(os.path.join('cached', 'css', 'window.css'), stats['post_processed'])
+        self.assertIn(os.path.join('test', 'nonascii.css'), stats['post_processed'])
+
+    def test_post_processing_changed_reference(self):
+        """
+        A file referring to a file that changed is adjusted again, although
+        its own content didn't change.
+        """
+        referrer_path = os.path.join(self.testfiles_path, 'referrer.css')
+        referenced_path = os.path.join(self.testfiles_path, 'referenced.txt')
+        with open(referrer_path, 'w') as f:
+            f.write('body { background: url("referenced.txt"); }')
+        with open(referenced_path, 'w') as f:
+            f.write('first version')
+        self.collect()
+        referrer_name = self.hashed_file_path('test/referrer.css')
+
+        with open(referenced_path, 'w') as f:
+            f.write('second version')
+        stats = self.collect()
+        self.assertIn(os.path.join('test', 'referrer.css'), stats['post_processed'])
+        self.assertEqual(self.hashed_file_path('test/referrer.css'), referrer_name)
+        with storage.staticfiles_storage.open(referrer_name) as referrer:
+            self.assertIn(
+                force_bytes(self.hashed_file_path('test/referenced.txt').split('/')[-1]),
+                referrer.read())
+
+    def test_post_processing_parallel(self):
+        self.run_collectstatic(clear=True)
+        hashed_files = storage.staticfiles_storage.load_manifest()
+        self.run_collectstatic(clear=True, jobs=4)
+        self.assertEqual(storage.staticfiles_storage.load_manifest(), hashed_files)
+
     def test_clear_empties_manifest(self):
         cleared_file_name = os.path.join('test', 'cleared.txt')
         # collect the additional file
@@ -858,7 +950,7 @@ class TestFileSystemFinder(StaticFilesTestCase, FinderTestCase):
     def setUp(self):
         super(TestFileSystemFinder, self).setUp()
         self.finder = finders.FileSystemFinder()
-        test_file_path = os.path.join(TEST_ROOT, 'project', 'documents', 'test', 'file.txt')
+        test_file_path = os.path.join(self.test_root, 'project', 'documents', 'test', 'file.txt')
         self.find_first = (os.path.join('test', 'file.txt'), test_file_path)
         self.find_all = (os.path.join('test', 'file.txt'), [test_file_path])
 
@@ -870,7 +962,7 @@ class TestAppDirectoriesFinder(StaticFilesTestCase, FinderTestCase):
     def setUp(self):
         super(TestAppDirectoriesFinder, self).setUp()
         self.finder = finders.AppDirectoriesFinder()
-        test_file_path = os.path.join(TEST_ROOT, 'apps', 'test', 'static', 'test', 'file1.txt')
+        test_file_path = os.path.join(self.test_root, 'apps', 'test', 'static', 'test', 'file1.txt')
         self.find_first = (os.path.join('test', 'file1.txt'), test_file_path)
         self.find_all = (os.path.join('test', 'file1.txt'), [test_file_path])
 
@@ -9,7 +9,8 @@ from django.test import RequestFactory, TestCase
 from django.conf import settings
 from django.template import Template, Context
 from django.template.response import (TemplateResponse, SimpleTemplateResponse,
-                                      ContentNotRenderedError)
+    ContentNotRenderedError, SimpleStreamingTemplateResponse,
+    StreamingTemplateResponse)
 from django.test import override_settings
 from django.utils._os import upath
 
@@ -299,6 +300,81 @@ class TemplateResponseTest(TestCase):
         pickle.dumps(unpickled_response)
 
 
+class SimpleStreamingTemplateResponseTest(TestCase):
+
+    def _response(self, template='foo', *args, **kwargs):
+        return SimpleStreamingTemplateResponse(Template(template), *args, **kwargs)
+
+    def test_render(self):
+        response = self._response('{% for i in items %}{{ i }},{% endfor %}',
+                                  {'items': [1, 2, 3]})
+        self.assertTrue(response.streaming)
+        self.assertFalse(response.is_rendered)
+        response = response.render()
+        self.assertTrue(response.is_rendered)
+        self.assertEqual(list(response), [b'1', b',', b'2', b',', b'3', b','])
+
+    def test_template_resolving(self):
+        response = SimpleStreamingTemplateResponse('first/test.html').render()
+        self.assertEqual(b''.join(response), b'First template\n')
+
+    def test_iteration_unrendered(self):
+        response = self._response()
+        with self.assertRaises(ContentNotRenderedError):
+            list(response)
+        with self.assertRaises(ContentNotRenderedError):
+            response.streaming_content
+
+    def test_no_content(self):
+        response = self._response().render()
+        with self.assertRaises(AttributeError):
+            response.content
+
+    def test_kwargs(self):
+        response = self._response(content_type='text/csv', status=504)
+        self.assertEqual(response['content-type'], 'text/csv')
+        self.assertEqual(response.status_code, 504)
+
+    def test_post_callbacks(self):
+        post = []
+        response = self._response('{{ foo }}', {'foo': 'bar'})
+        response.add_post_render_callback(lambda r: post.append('post1'))
+        response.render()
+        self.assertEqual(post, ['post1'])
+        # Callbacks added after rendering run immediately.
+        response.add_post_render_callback(lambda r: post.append('post2'))
+        self.assertEqual(post, ['post1', 'post2'])
+        self.assertEqual(b''.join(response), b'bar')
+
+
+@override_settings(
+    TEMPLATE_CONTEXT_PROCESSORS=[test_processor_name],
+)
+class StreamingTemplateResponseTest(TestCase):
+
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def _response(self, template='foo', *args, **kwargs):
+        return StreamingTemplateResponse(self.factory.get('/'), Template(template),
+                                         *args, **kwargs)
+
+    def test_render_with_requestcontext(self):
+        response = self._response('{{ foo }}{{ processors }}',
+                                  {'foo': 'bar'}).render()
+        self.assertEqual(b''.join(response), b'baryes')
+
+    def test_render_with_context(self):
+        response = self._response('{{ foo }}{{ processors }}',
+                                  Context({'foo': 'bar'})).render()
+        self.assertEqual(b''.join(response), b'bar')
+
+    def test_custom_app(self):
+        response = self._response('{{ foo }}', current_app="foobar")
+        rc = response.resolve_context(response.context_data)
+        self.assertEqual(rc.current_app, 'foobar')
+
+
 @override_settings(
     MIDDLEWARE_CLASSES=list(settings.MIDDLEWARE_CLASSES) + [
         'template_tests.test_response.CustomURLConfMiddleware'
@@ -0,0 +1,111 @@
+from __future__ import unicode_literals
+
+from unittest import TestCase
+
+from django.template import Context, Template
+from django.template.loader import get_template_from_string
+from django.test import override_settings
+from django.utils.safestring import SafeData
+
+
+class TemplateStreamTest(TestCase):
+
+    def assertStreamsLikeRender(self, source, context=None):
+        template = Template(source)
+        chunks = list(template.stream(Context(context)))
+        self.assertEqual(''.join(chunks), template.render(Context(context)))
+        return chunks
+
+    def test_plain(self):
+        chunks = self.assertStreamsLikeRender('Hello {{ name }}!', {'name': 'world'})
+        self.assertEqual(chunks, ['Hello ', 'world', '!'])
+
+    def test_chunks_are_safe(self):
+        template = Template('{{ a }}')
+        for chunk in template.stream(Context({'a': '<b>'})):
+            self.assertIsInstance(chunk, SafeData)
+
+    def test_for(self):
+        chunks = self.assertStreamsLikeRender(
+            '{% for i in items %}<{{ i }}>{% endfor %}', {'items': [1, 2, 3]})
+        self.assertEqual(chunks, ['<', '1', '>', '<', '2', '>', '<', '3', '>'])
+
+    def test_for_empty(self):
+        self.assertStreamsLikeRender(
+            '{% for i in items %}{{ i }}{% empty %}none{% endfor %}', {'items': []})
+
+    def test_nested_for(self):
+        self.assertStreamsLikeRender(
+            '{% for row in rows %}{% for cell in row %}{{ forloop.parentloop.counter }}'
+            '{{ cell }}{% endfor %};{% endfor %}',
+            {'rows': [[1, 2], [3, 4]]})
+
+    def test_for_unpack(self):
+        self.assertStreamsLikeRender(
+            '{% for k, v in items %}{{ k }}={{ v }},{% endfor %}{{ k }}',
+            {'items': [('a', 1), ('b', 2)]})
+
+    def test_if(self):
+        source = '{% if x %}{% for i in items %}{{ i }}{% endfor %}{% else %}no{% endif %}'
+        self.assertStreamsLikeRender(source, {'x': True, 'items': 'abc'})
+        self.assertStreamsLikeRender(source, {'x': False})
+
+    def test_lazy(self):
+        """
+        Loop iterations are only rendered as the output is consumed.
+        """
+        seen = []
+
+        def items():
+            for i in range(3):
+                seen.append(i)
+                yield i
+
+        template = Template('{% for i in items %}{{ i }}{% endfor %}')
+        stream = template.stream(Context({'items': ItemsWithLen(items(), 3)}))
+        self.assertEqual(next(stream), '0')
+        self.assertEqual(seen, [0])
+        self.assertEqual(list(stream), ['1', '2'])
+        self.assertEqual(seen, [0, 1, 2])
+
+    def test_context_restored(self):
+        context = Context({'items': [1, 2]})
+        template = Template('{% for i in items %}{{ i }}{% endfor %}')
+        list(template.stream(context))
+        self.assertNotIn('forloop', context)
+        self.assertNotIn('i', context)
+        self.assertEqual(len(context.render_context.dicts), 1)
+
+    def test_extends(self):
+        parent = get_template_from_string(
+            '<{% block a %}parent{% endblock %}|{% block b %}b{% endblock %}>')
+        chunks = self.assertStreamsLikeRender(
+            '{% extends parent %}{% block a %}{% for i in items %}{{ i }}'
+            '{% endfor %}{{ block.super }}{% endblock %}',
+            {'parent': parent, 'items': [1, 2]})
+        self.assertEqual(''.join(chunks), '<12parent|b>')
+        self.assertEqual(chunks[:3], ['<', '1', '2'])
+
+    @override_settings(TEMPLATE_DEBUG=True)
+    def test_debug_source(self):
+        template = Template('{% for i in items %}{{ i.fail }}{% endfor %}')
+        with self.assertRaises(ValueError) as cm:
+            list(template.stream(Context({'items': [Failing()]})))
+        self.assertTrue(hasattr(cm.exception, 'django_template_source'))
+
+
+class ItemsWithLen(object):
+    def __init__(self, iterator, length):
+        self.iterator, self.length = iterator, length
+
+    def __iter__(self):
+        return self.iterator
+
+    def __len__(self):
+        return self.length
+
+
+class Failing(object):
+    @property
+    def fail(self):
+        raise ValueError
@@ -3,7 +3,7 @@ import os
 from unittest import TestSuite, TextTestRunner, defaultTestLoader
 
 from django.test import TestCase
-from django.test.runner import DiscoverRunner
+from django.test.runner import DiscoverRunner, ParallelTestSuite
 
 
 @contextmanager
@@ -75,6 +75,26 @@ class DiscoverRunnerTest(TestCase):
                 os.path.basename(os.getcwd()),
             )
 
+    def test_parallel(self):
+        suite = DiscoverRunner(parallel=2).build_suite(
+            ["test_discovery_sample.tests_sample"],
+        )
+
+        self.assertIsInstance(suite, ParallelTestSuite)
+        self.assertEqual(suite.countTestCases(), 4)
+
+    def test_parallel_single_test_case(self):
+        """
+        Tests aren't run in parallel if there's a single test case.
+        """
+        runner = DiscoverRunner(parallel=2)
+        suite = runner.build_suite(
+            ["test_discovery_sample.tests_sample.TestVanillaUnittest"],
+        )
+
+        self.assertNotIsInstance(suite, ParallelTestSuite)
+        self.assertEqual(runner.parallel, 1)
+
     def test_empty_test_case(self):
         count = DiscoverRunner().build_suite(
             ["test_discovery_sample.tests_sample.EmptyTestCase"],
@@ -3,15 +3,19 @@ Tests for django test runner
 """
 from __future__ import unicode_literals
 
+import os
+import shutil
+import tempfile
 import unittest
 
 from django import db
 from django.core.exceptions import ImproperlyConfigured
 from django.core.management import call_command
 from django.db.backends.dummy.base import DatabaseCreation
+from django.db.backends.sqlite3.base import DatabaseWrapper as SQLiteDatabaseWrapper
 from django.test import runner, TestCase, TransactionTestCase, skipUnlessDBFeature
 from django.test.testcases import connections_support_transactions
-from django.test.utils import override_system_checks
+from django.test.utils import override_settings, override_system_checks
 from django.utils import six
 
 from admin_scripts.tests import AdminScriptTestCase
@@ -275,6 +279,90 @@ class DummyBackendTest(unittest.TestCase):
             db.connections = old_db_connections
 
 
+@unittest.skipUnless(hasattr(os, 'fork'), "Running tests in parallel requires fork().")
+class ParallelTestSuiteTests(unittest.TestCase):
+    def test_run(self):
+        """
+        The outcomes of the tests run by the workers are reported to the
+        result of the main process, on the original tests.
+        """
+        class SampleTests(unittest.TestCase):
+            def test_success(self):
+                pass
+
+            def test_failure(self):
+                self.fail("Sample failure.")
+
+            def test_error(self):
+                raise ValueError("Sample error.")
+
+            @unittest.skip("Sample skip.")
+            def test_skip(self):
+                pass
+
+        class FixtureErrorTests(unittest.TestCase):
+            @classmethod
+            def setUpClass(cls):
+                raise ValueError("Sample fixture error.")
+
+            def test_success(self):
+                pass
+
+        loader = unittest.defaultTestLoader
+        suite = unittest.TestSuite([
+            loader.loadTestsFromTestCase(SampleTests),
+            loader.loadTestsFromTestCase(FixtureErrorTests),
+        ])
+        subsuites = runner.partition_suite_by_case(suite)
+        self.assertEqual([4, 1], [subsuite.countTestCases() for subsuite in subsuites])
+        parallel_suite = runner.ParallelTestSuite(subsuites, processes=2)
+        self.assertEqual(5, parallel_suite.countTestCases())
+
+        result = unittest.TestResult()
+        parallel_suite.run(result)
+        self.assertEqual(4, result.testsRun)
+        tests = list(parallel_suite)
+        self.assertEqual([tests[1]], [test for test, _ in result.failures])
+        self.assertIn("Sample failure.", result.failures[0][1])
+        # Subsuites are reported in the order in which they complete.
+        errors = sorted(result.errors, key=lambda error: str(error[0]))
+        self.assertIn("setUpClass (test_runner.tests.FixtureErrorTests)", str(errors[0][0]))
+        self.assertIn("Sample fixture error.", errors[0][1])
+        self.assertEqual(tests[0], errors[1][0])
+        self.assertIn("Sample error.", errors[1][1])
+        self.assertEqual([(tests[2], "Sample skip.")], result.skipped)
+
+    def test_run_failfast(self):
+        class SampleTests(unittest.TestCase):
+            def test_failure(self):
+                self.fail("Sample failure.")
+
+        class OtherSampleTests(unittest.TestCase):
+            def test_success(self):
+                pass
+
+        loader = unittest.defaultTestLoader
+        suite = unittest.TestSuite([
+            loader.loadTestsFromTestCase(SampleTests),
+            loader.loadTestsFromTestCase(OtherSampleTests),
+        ])
+        parallel_suite = runner.ParallelTestSuite(
+            runner.partition_suite_by_case(suite), processes=1, failfast=True)
+        result = unittest.TestResult()
+        result.failfast = True
+        parallel_suite.run(result)
+        self.assertEqual(1, result.testsRun)
+        self.assertEqual(1, len(result.failures))
+
+    def test_sqlite_clone_settings(self):
+        connection = SQLiteDatabaseWrapper({'NAME': 'tests.sqlite3'}, alias='clone')
+        self.assertEqual(
+            'tests_2.sqlite3', connection.creation.get_test_db_clone_settings(2)['NAME'])
+        # Workers get a copy of in-memory databases when they're forked.
+        connection = SQLiteDatabaseWrapper({'NAME': ':memory:'}, alias='clone')
+        self.assertEqual(':memory:', connection.creation.get_test_db_clone_settings(2)['NAME'])
+
+
 class AliasedDefaultTestSetupTest(unittest.TestCase):
     def test_setup_aliased_default_database(self):
         """
@@ -367,6 +455,66 @@ class SetupDatabasesTests(unittest.TestCase):
         self.runner_instance.setup_databases()
         self.assertEqual(serialize, [False])
 
+    def test_migrated_template(self):
+        migrated_template = []
+        DatabaseCreation.create_test_db = (
+            lambda *args, **kwargs: migrated_template.append(kwargs.get('migrated_template', 'not passed'))
+        )
+        db.connections = db.ConnectionHandler({
+            'default': {
+                'ENGINE': 'django.db.backends.dummy',
+            },
+            'other': {
+                'ENGINE': 'django.db.backends.dummy',
+                'NAME': 'other',
+                'TEST': {'MIGRATED_TEMPLATE': True},
+            },
+        })
+        self.runner_instance.setup_databases()
+        self.assertEqual(sorted(migrated_template, key=str), [True, 'not passed'])
+
+
+class MigratedTemplateTests(unittest.TestCase):
+
+    def test_fingerprint(self):
+        creation = db.connection.creation
+        fingerprint = creation.test_db_fingerprint()
+        self.assertEqual(fingerprint, creation.test_db_fingerprint())
+        with override_settings(INSTALLED_APPS=['django.contrib.contenttypes']):
+            self.assertNotEqual(fingerprint, creation.test_db_fingerprint())
+
+    def test_sqlite_template_name(self):
+        connection = SQLiteDatabaseWrapper({'NAME': 'tests', 'TEST': {'NAME': 'tests.sqlite3'}}, alias='template')
+        self.assertEqual(
+            'tests_template_0123456789ab.sqlite3',
+            connection.creation._get_test_db_template_name('0123456789abcdef'))
+        # In-memory databases don't have templates.
+        connection = SQLiteDatabaseWrapper({'NAME': 'tests', 'TEST': {'NAME': None}}, alias='template')
+        self.assertIsNone(connection.creation._get_test_db_template_name('0123456789abcdef'))
+
+    def test_sqlite_save_and_copy_template(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        test_database_name = os.path.join(tmpdir, 'tests.sqlite3')
+        connection = SQLiteDatabaseWrapper(
+            {'NAME': test_database_name, 'TEST': {'NAME': test_database_name}}, alias='template')
+        creation = connection.creation
+        old_template_name = creation._get_test_db_template_name('0' * 12)
+        template_name = creation._get_test_db_template_name('1' * 12)
+        for name, content in [(test_database_name, b'migrated'), (old_template_name, b'old')]:
+            with open(name, 'wb') as f:
+                f.write(content)
+        self.assertFalse(creation._test_db_template_exists(template_name))
+        creation._save_test_db_template(template_name, verbosity=0)
+        self.assertTrue(creation._test_db_template_exists(template_name))
+        # Templates for other fingerprints are removed.
+        self.assertFalse(creation._test_db_template_exists(old_template_name))
+        with open(test_database_name, 'wb') as f:
+            f.write(b'')
+        creation._copy_test_db_template(template_name, verbosity=0)
+        with open(test_database_name, 'rb') as f:
+            self.assertEqual(f.read(), b'migrated')
+
 
 class DeprecationDisplayTest(AdminScriptTestCase):
     # tests for 19546
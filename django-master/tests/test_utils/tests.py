@@ -139,6 +139,30 @@ class AssertNumQueriesTests(TestCase):
         self.assertNumQueries(2, test_func)
 
 
+@skipUnlessDBFeature('supports_transactions')
+class TestDataTests(TestCase):
+    """
+    The data created by setUpTestData() is created once for the class, and
+    the changes made by each test are rolled back.
+    """
+    setup_count = 0
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.setup_count += 1
+        cls.person = Person.objects.create(name='Jim')
+
+    def test_1_delete(self):
+        self.assertEqual(self.setup_count, 1)
+        Person.objects.all().delete()
+        self.assertEqual(Person.objects.count(), 0)
+
+    def test_2_rolled_back(self):
+        self.assertEqual(self.setup_count, 1)
+        self.assertQuerysetEqual(Person.objects.all(), ['<Person: Jim>'])
+        self.assertEqual(Person.objects.get().pk, self.person.pk)
+
+
 class AssertQuerysetEqualTests(TestCase):
     def setUp(self):
         self.p1 = Person.objects.create(name='p1')
@@ -1,10 +1,14 @@
 from importlib import import_module
 import os
+import shutil
+import sys
 import tempfile
+import types
 
 from django import conf
 from django.contrib import admin
 from django.test import TestCase, override_settings
+from django.utils import autoreload
 from django.utils.autoreload import gen_filenames
 from django.utils._os import upath
 
@@ -96,3 +100,120 @@ class TestFilenameGenerator(TestCase):
             os.close(fd)
             os.remove(filepath)
         self.assertNotIn(filepath, gen_filenames())
+
+
+class CodeChangedTests(TestCase):
+    def setUp(self):
+        autoreload._cached_modules = set()
+        autoreload._cached_filenames = []
+        autoreload._mtimes = {}
+        self.addCleanup(setattr, autoreload, '_mtimes', {})
+        fd, self.filepath = tempfile.mkstemp(dir=os.path.dirname(upath(__file__)), suffix='.py')
+        os.close(fd)
+        self.addCleanup(lambda: os.path.exists(self.filepath) and os.remove(self.filepath))
+        _, filename = os.path.split(self.filepath)
+        import_module('.%s' % filename.replace('.py', ''), package='utils_tests')
+
+    def touch(self, offset):
+        mtime = os.stat(self.filepath).st_mtime + offset
+        os.utime(self.filepath, (mtime, mtime))
+
+    def test_code_changed(self):
+        self.assertFalse(autoreload.code_changed())
+        self.assertIn(self.filepath, autoreload._mtimes)
+        self.touch(10)
+        self.assertEqual(autoreload.code_changed(), autoreload.FILE_MODIFIED)
+        # The change is only reported once.
+        self.assertFalse(autoreload.code_changed())
+        os.remove(self.filepath)
+        self.assertFalse(autoreload.code_changed())
+        self.assertNotIn(self.filepath, autoreload._mtimes)
+
+    def test_debounced_code_changed(self):
+        self.assertFalse(autoreload.debounced_code_changed())
+        mo_file = os.path.join(LOCALE_PATH, 'nl', 'LC_MESSAGES', 'django.mo')
+        autoreload._mtimes[mo_file] = 0
+        self.touch(10)
+        # Both changes are found by a single call.
+        self.assertEqual(autoreload.debounced_code_changed(), autoreload.FILE_MODIFIED)
+        self.assertFalse(autoreload.code_changed())
+
+
+class FakeNotifier(object):
+    """
+    Reports a change of the watched module the first time events are
+    processed, as pyinotify would do for a watch on its directory.
+    """
+    def __init__(self, watch_manager, handler):
+        self.watch_manager = watch_manager
+        self.handler = handler
+        self.changed_file = None
+
+    def check_events(self, timeout=None):
+        return timeout is None
+
+    def read_events(self):
+        pass
+
+    def process_events(self):
+        dirname, filename = os.path.split(self.changed_file)
+        assert dirname in self.watch_manager.watches, '%r not watched' % dirname
+        event = type(str('Event'), (object,), {'pathname': os.path.join(dirname, filename)})
+        self.handler.process_default(event)
+
+    def stop(self):
+        pass
+
+
+class FakeWatchManager(object):
+    def __init__(self):
+        self.watches = []
+
+    def add_watch(self, path, mask):
+        if not path:
+            raise ValueError('Invalid path %r' % path)
+        self.watches.append(path)
+
+
+class InotifyCodeChangedTests(TestCase):
+    def setUp(self):
+        autoreload._cached_modules = set()
+        autoreload._cached_filenames = []
+        self.tempdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tempdir)
+        old_cwd = os.getcwd()
+        os.chdir(self.tempdir)
+        self.addCleanup(os.chdir, old_cwd)
+        with open('relative_module.py', 'w'):
+            pass
+        module = types.ModuleType(str('relative_module'))
+        module.__file__ = 'relative_module.py'
+        sys.modules['relative_module'] = module
+        self.addCleanup(sys.modules.pop, 'relative_module')
+
+        self.notifier = None
+        test = self
+
+        def notifier(watch_manager, handler):
+            test.notifier = FakeNotifier(watch_manager, handler)
+            test.notifier.changed_file = os.path.join(os.getcwd(), 'relative_module.py')
+            return test.notifier
+
+        fake_pyinotify = types.ModuleType(str('pyinotify'))
+        fake_pyinotify.ProcessEvent = object
+        fake_pyinotify.WatchManager = FakeWatchManager
+        fake_pyinotify.Notifier = notifier
+        for name in ('IN_MODIFY', 'IN_DELETE', 'IN_ATTRIB', 'IN_MOVED_FROM',
+                     'IN_MOVED_TO', 'IN_CREATE'):
+            setattr(fake_pyinotify, name, 0)
+        old_pyinotify = getattr(autoreload, 'pyinotify', None)
+        autoreload.pyinotify = fake_pyinotify
+        self.addCleanup(setattr, autoreload, 'pyinotify', old_pyinotify)
+
+    def test_relative_module_path(self):
+        """
+        Modules with a relative __file__ are watched through the absolute
+        path of their directory.
+        """
+        self.assertEqual(autoreload.inotify_code_changed(), autoreload.FILE_MODIFIED)
+        self.assertIn(os.getcwd(), self.notifier.watch_manager.watches)
@@ -8,7 +8,7 @@ from django.conf.urls.static import static
 from django.http import HttpResponseNotModified
 from django.test import SimpleTestCase, override_settings
 from django.utils.http import http_date
-from django.views.static import was_modified_since
+from django.views.static import parse_range_header, was_modified_since
 
 from .. import urls
 from ..urls import media_dir
@@ -96,6 +96,50 @@ class StaticTests(SimpleTestCase):
         response = self.client.get('/%s/non_existing_resource' % self.prefix)
         self.assertEqual(404, response.status_code)
 
+    def test_range(self):
+        file_name = 'file.txt'
+        with open(path.join(media_dir, file_name), 'rb') as fp:
+            content = fp.read()
+        size = len(content)
+        for header, first, last in [('bytes=0-4', 0, 4), ('bytes=5-', 5, size - 1),
+                                    ('bytes=-3', size - 3, size - 1),
+                                    ('bytes=2-1000000', 2, size - 1)]:
+            response = self.client.get('/%s/%s' % (self.prefix, file_name), HTTP_RANGE=header)
+            self.assertEqual(response.status_code, 206)
+            self.assertEqual(b''.join(response), content[first:last + 1])
+            self.assertEqual(int(response['Content-Length']), last - first + 1)
+            self.assertEqual(response['Content-Range'], 'bytes %d-%d/%d' % (first, last, size))
+            self.assertEqual(response['Accept-Ranges'], 'bytes')
+            response.close()
+
+    def test_range_not_satisfiable(self):
+        file_name = 'file.txt'
+        size = path.getsize(path.join(media_dir, file_name))
+        response = self.client.get('/%s/%s' % (self.prefix, file_name),
+            HTTP_RANGE='bytes=%d-' % size)
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response['Content-Range'], 'bytes */%d' % size)
+
+    def test_range_ignored(self):
+        """
+        The whole file is sent for several ranges, or when If-Range doesn't
+        match the file's modification date.
+        """
+        file_name = 'file.txt'
+        file_path = path.join(media_dir, file_name)
+        with open(file_path, 'rb') as fp:
+            content = fp.read()
+        for extra in [{'HTTP_RANGE': 'bytes=0-1,3-4'},
+                      {'HTTP_RANGE': 'bytes=0-1', 'HTTP_IF_RANGE': 'Thu, 1 Jan 1970 00:00:00 GMT'}]:
+            response = self.client.get('/%s/%s' % (self.prefix, file_name), **extra)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(b''.join(response), content)
+            response.close()
+        response = self.client.get('/%s/%s' % (self.prefix, file_name), HTTP_RANGE='bytes=0-1',
+            HTTP_IF_RANGE=http_date(path.getmtime(file_path)))
+        self.assertEqual(response.status_code, 206)
+        response.close()
+
 
 class StaticHelperTest(StaticTests):
     """
@@ -120,3 +164,13 @@ class StaticUtilsTests(unittest.TestCase):
         mtime = 1343416141.107817
         header = http_date(mtime)
         self.assertFalse(was_modified_since(header, mtime))
+
+    def test_parse_range_header(self):
+        self.assertEqual(parse_range_header('bytes=0-0', 10), (0, 0))
+        self.assertEqual(parse_range_header('bytes = 3 - 5', 10), (3, 5))
+        self.assertEqual(parse_range_header('bytes=-20', 10), (0, 9))
+        for header in [None, '', 'bytes=5-3', 'bytes=-', 'bytes=0-1,3-4', 'items=0-1']:
+            self.assertIsNone(parse_range_header(header, 10))
+        for header, size in [('bytes=10-', 10), ('bytes=-0', 10), ('bytes=-5', 0)]:
+            with self.assertRaises(ValueError):
+                parse_range_header(header, size)